@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for the daily_exercises package
+
+Times imports in fresh interpreters (best of --runs), measured around the
+import statement only, so interpreter start-up isn't counted:
+
+    package       import daily_exercises
+    one solution  from daily_exercises import reverseList
+    pure Python   from daily_exercises import productExceptSelf, whose module also
+                  holds NumPy versions (NumPy loads on their first call)
+    everything    every submodule imported eagerly, as if there were no lazy loading
+
+Exits non-zero when the bare package import is slower than --max-ms.
+
+Usage:
+    python benchmarks/import_benchmark.py --runs 20 --max-ms 5
+"""
+
+import os
+import sys
+import argparse
+import subprocess
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    'package': 'import daily_exercises',
+    'one solution': 'from daily_exercises import reverseList',
+    'pure Python': 'from daily_exercises import productExceptSelf',
+    'everything': 'import daily_exercises as d\nfor name in sorted(d._SUBMODULES): getattr(d, name)',
+}
+
+TIMER = '''
+import time
+start = time.perf_counter()
+{statement}
+print((time.perf_counter() - start) * 1000)
+'''
+
+
+def time_import(statement, runs):
+    """Best wall time in ms for statement over runs fresh interpreters."""
+    script = TIMER.format(statement=statement)
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', script], cwd=REPO_DIR, check=True, capture_output=True, text=True
+        ).stdout
+        timings.append(float(output))
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='fresh interpreters per case')
+    parser.add_argument('--max-ms', type=float, default=5.0, help='fail if `import daily_exercises` is slower')
+    args = parser.parse_args()
+
+    results = {label: time_import(statement, args.runs) for label, statement in CASES.items()}
+    for label, ms in results.items():
+        print(f'{label:>22}: {ms:8.2f} ms')
+
+    if results['package'] > args.max_ms:
+        print(f"import daily_exercises took {results['package']:.2f} ms, over the {args.max_ms} ms budget")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Daily coding exercise solutions as an importable package.
+
+    from daily_exercises import reverseList, group_anagrams, feb
+
+Every solution is a plain function or class; nothing runs at import. The
+submodules are loaded on first attribute access (PEP 562 module __getattr__),
+so `import daily_exercises` only costs this file and each name pulls in just
+the submodule that defines it. Demos and benchmarks live in each submodule's
+main(), e.g. `python -m daily_exercises.fibonacci_numbers --benchmark 1000000`.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'isAnagram': 'anagram',
+    'isAnagramBetterSol': 'anagram',
+    'AnagramIndex': 'anagram',
+    'fibonacci': 'fibonacci_numbers',
+    'feb': 'fibonacci_numbers',
+    'feb_pair': 'fibonacci_numbers',
+    'feb_series': 'fibonacci_numbers',
+    'feb_mod': 'fibonacci_numbers',
+    'feb_cached': 'fibonacci_numbers',
+    'print_fibonacci_series': 'fibonacci_series',
+    'export_fibonacci_series': 'fibonacci_series',
+    'group_anagrams': 'anagram_groups',
+    'iter_anagram_groups': 'anagram_groups',
+    'ListNode': 'linked_list',
+    'reverseList': 'linked_list',
+    'create_linked_list': 'linked_list',
+    'linked_list_to_list': 'linked_list',
+    'iter_nodes': 'linked_list',
+    'linked_list_from_file': 'linked_list',
+    'ArrayLinkedList': 'linked_list',
+    'moveZeroes': 'move_zeros',
+    'move_to_end': 'move_zeros',
+    'productExceptSelf': 'prefix_products',
+    'product_except_self': 'prefix_products',
+    'reverse_string': 'string_reversal',
+    'reverse_text': 'string_reversal',
+    'is_palindrome': 'string_reversal',
+    'is_palindrome_file': 'string_reversal',
+    'reverse_file': 'string_reversal',
+    'second_largest': 'largest_values',
+}
+
+_SUBMODULES = frozenset(_EXPORTS.values())
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
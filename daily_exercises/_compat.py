@@ -0,0 +1,15 @@
+"""
+Optional dependencies, imported on first use so importing a solution stays cheap
+"""
+
+import importlib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def optional_import(name):
+    """Return the named module, or None if it isn't installed."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
@@ -0,0 +1,203 @@
+import time
+from collections import Counter
+
+from ._compat import optional_import
+from .anagram_groups import MAX_COUNT_SIGNATURE_LENGTH, signature as count_signature
+
+
+def isAnagram(s: str, t: str) -> bool:
+    # If lengths are different, they can't be anagrams
+    if len(s) != len(t):
+        return False
+    
+    return sorted(s) == sorted(t)
+
+# this is better option.
+'''Why this matters
+Sorting takes $O(n \log n)$ time.
+Hash Map takes $O(n)$ time because we only go through the strings once.'''
+
+def isAnagramBetterSol(s: str, t: str) -> bool:
+    if len(s) != len(t):
+        return False
+
+    countS, countT = {}, {}
+
+    for i in range(len(s)):
+        countS[s[i]] = 1 + countS.get(s[i], 0)
+        countT[t[i]] = 1 + countT.get(t[i], 0)
+    
+    return countS == countT
+
+
+# --- Reusable index over a word list ---
+
+# Rows of pairs compared per NumPy block; bounds the count matrices to a few MB
+BULK_BLOCK = 8192
+
+
+def signature(word):
+    """Hashable key equal for two words exactly when they are anagrams."""
+    if word.isascii() and len(word) <= MAX_COUNT_SIGNATURE_LENGTH:
+        return count_signature(word)   # prime product of character codes
+    return frozenset(Counter(word).items())
+
+
+def count_matrix(words):
+    """Per-word ASCII character counts as an (len(words), 128) NumPy array."""
+    import numpy as np
+
+    data = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8)
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+    rows = np.repeat(np.arange(len(words), dtype=np.int64) * 128, lengths)
+    return np.bincount(rows + data, minlength=len(words) * 128).reshape(len(words), 128)
+
+
+class AnagramIndex:
+    """
+    Anagram lookups against a fixed word list. Each word's signature is
+    computed once when the index is built, so queries only hash the query.
+    """
+
+    def __init__(self, words):
+        self.words = list(words)
+        self._signatures = {}
+        self._groups = {}
+        for word in self.words:
+            key = self._signatures.get(word)
+            if key is None:
+                key = self._signatures[word] = signature(word)
+            self._groups.setdefault(key, []).append(word)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self._signatures
+
+    def signature(self, word):
+        """Cached signature for indexed words, computed for anything else."""
+        key = self._signatures.get(word)
+        return signature(word) if key is None else key
+
+    def is_anagram(self, s, t):
+        if len(s) != len(t):
+            return False
+        return self.signature(s) == self.signature(t)
+
+    def anagrams_of(self, word):
+        """Indexed words that are anagrams of word, other than word itself."""
+        return [other for other in self._groups.get(self.signature(word), ()) if other != word]
+
+    def is_anagram_bulk(self, pairs):
+        """
+        Check many (s, t) pairs at once, returning a list of bools in input order.
+        Pairs of different lengths are rejected up front. With NumPy, the rest
+        are compared as rows of character-count matrices, BULK_BLOCK pairs at a
+        time; without it (and for non-ASCII blocks) signatures are compared pair
+        by pair.
+        """
+        pairs = list(pairs)
+        np = optional_import('numpy')  # without it, compare signatures pair by pair
+        results = [False] * len(pairs)
+        candidates = [i for i, (s, t) in enumerate(pairs) if len(s) == len(t)]
+        for start in range(0, len(candidates), BULK_BLOCK):
+            block = candidates[start:start + BULK_BLOCK]
+            left = [pairs[i][0] for i in block]
+            right = [pairs[i][1] for i in block]
+            if np is not None and ''.join(left).isascii() and ''.join(right).isascii():
+                same = (count_matrix(left) == count_matrix(right)).all(axis=1).tolist()
+            else:
+                same = [self.signature(s) == self.signature(t) for s, t in zip(left, right)]
+            for i, match in zip(block, same):
+                results[i] = match
+        return results
+
+
+# --- Benchmark ---
+
+def _benchmark_words(count, seed=3):
+    import random
+
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    words = []
+    for _ in range(count):
+        word = [rng.choice(letters) for _ in range(rng.randint(4, 10))]
+        words.append(''.join(word))
+        if rng.random() < 0.3:
+            rng.shuffle(word)
+            words.append(''.join(word))
+    return words
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def benchmark(dictionary_size=200_000, pair_count=200_000):
+    import random
+
+    words = _benchmark_words(dictionary_size)
+    rng = random.Random(5)
+    pairs = [(rng.choice(words), rng.choice(words)) for _ in range(pair_count // 2)]
+    pairs += [(word, ''.join(rng.sample(word, len(word)))) for word in rng.sample(words, pair_count // 2)]
+
+    index, build_s = _timed(lambda: AnagramIndex(words))
+    print(f'index of {len(words)} words built in {build_s:.3f}s')
+
+    print(f'{len(pairs)} pairs:')
+    expected, baseline = _timed(lambda: [isAnagram(s, t) for s, t in pairs])
+    for label, fn in [
+        ('isAnagram', lambda: expected),
+        ('isAnagramBetterSol', lambda: [isAnagramBetterSol(s, t) for s, t in pairs]),
+        ('AnagramIndex.is_anagram', lambda: [index.is_anagram(s, t) for s, t in pairs]),
+        ('AnagramIndex.is_anagram_bulk', lambda: index.is_anagram_bulk(pairs)),
+    ]:
+        result, seconds = _timed(fn) if label != 'isAnagram' else (expected, baseline)
+        status = 'ok' if result == expected else 'MISMATCH'
+        print(f'  {label:>28}: {seconds:.3f}s  ({baseline / seconds:.1f}x)  {status}')
+
+    texts = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz ') for _ in range(400)) for _ in range(5000)]
+    long_pairs = [(text, ''.join(rng.sample(text, len(text)))) for text in texts]
+    long_pairs += [(text, text[1:] + 'q') for text in texts]
+    print(f'{len(long_pairs)} pairs of 400-character texts:')
+    expected, baseline = _timed(lambda: [isAnagram(s, t) for s, t in long_pairs])
+    for label, fn in [
+        ('isAnagramBetterSol', lambda: [isAnagramBetterSol(s, t) for s, t in long_pairs]),
+        ('AnagramIndex.is_anagram_bulk', lambda: index.is_anagram_bulk(long_pairs)),
+    ]:
+        result, seconds = _timed(fn)
+        status = 'ok' if result == expected else 'MISMATCH'
+        print(f'  {label:>28}: {seconds:.3f}s  ({baseline / seconds:.1f}x vs isAnagram {baseline:.3f}s)  {status}')
+
+    queries = rng.sample(words, 20)
+    print(f'{len(queries)} queries against the whole dictionary:')
+    expected, baseline = _timed(lambda: [[w for w in words if w != q and isAnagram(q, w)] for q in queries])
+    for label, fn in [
+        ('isAnagramBetterSol scan', lambda: [[w for w in words if w != q and isAnagramBetterSol(q, w)] for q in queries]),
+        ('AnagramIndex.anagrams_of', lambda: [index.anagrams_of(q) for q in queries]),
+    ]:
+        result, seconds = _timed(fn)
+        status = 'ok' if result == expected else 'MISMATCH'
+        print(f'  {label:>28}: {seconds:.4f}s  ({baseline / seconds:.0f}x vs isAnagram scan {baseline:.2f}s)  {status}')
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Anagram checks')
+    parser.add_argument('--benchmark', action='store_true', help='compare against isAnagram and isAnagramBetterSol')
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark()
+    else:
+        print(isAnagram('anagram','anagram'))
+        print(isAnagramBetterSol('anagram','anagram'))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+'''Given an array of strings strs, group the anagrams together. You can return the answer in any order.
+Example: * Input: 
+strs = ["eat","tea","tan","ate","nat","bat"]
+Output:[["bat"],["nat","tan"],["ate","eat","tea"]]'''
+
+import gc
+import math
+import time
+import zlib
+import itertools
+from collections import defaultdict
+
+
+# --- Grouping engine ---
+
+# Count signature: every ASCII character maps to its own prime and a word's
+# key is the product of its characters' primes. By unique factorisation the
+# product encodes exactly how many times each character occurs, and it's
+# computed in one pass. a-z get the smallest primes so ordinary words stay
+# within machine-sized ints, which is what makes this beat sorting.
+def _first_primes(count):
+    primes = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+_PRIME_ORDER = [chr(code) for code in range(ord('a'), ord('z') + 1)] + [
+    chr(code) for code in range(128) if not ord('a') <= code <= ord('z')
+]
+_CHAR_PRIMES = dict(zip(_PRIME_ORDER, _first_primes(128)))
+
+# Longer words fall back to sorted keys before the products grow too large
+MAX_COUNT_SIGNATURE_LENGTH = 64
+CHUNK_SIZE = 50_000
+
+
+def signature(word):
+    """Key shared by all anagrams of word: prime-product count signature for short ASCII, sorted characters otherwise."""
+    if word.isascii() and len(word) <= MAX_COUNT_SIGNATURE_LENGTH:
+        return math.prod(map(_CHAR_PRIMES.__getitem__, word))
+    return ''.join(sorted(word))
+
+
+def _chunks(words, chunk_size):
+    iterator = iter(words)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _chunk_signatures(chunk):
+    # Check the length once per chunk; a non-ASCII character raises KeyError,
+    # which sends the whole chunk through the per-word path
+    if max(map(len, chunk)) <= MAX_COUNT_SIGNATURE_LENGTH:
+        prime = _CHAR_PRIMES.__getitem__
+        prod = math.prod
+        try:
+            return [prod(map(prime, word)) for word in chunk]
+        except KeyError:
+            pass
+    return [signature(word) for word in chunk]
+
+
+def _group_into(groups, words, chunk_size=4096):
+    for chunk in _chunks(words, chunk_size):
+        for key, word in zip(_chunk_signatures(chunk), chunk):
+            groups[key].append(word)
+    return groups
+
+
+def _shard_of(key, shards):
+    # Stable across processes, unlike hash() of a str
+    if isinstance(key, int):
+        return key % shards
+    return zlib.crc32(key.encode('utf-8', 'surrogatepass')) % shards
+
+
+def _group_chunk(args):
+    """Worker: group one chunk of words and split the groups by shard."""
+    words, shards = args
+    sharded = [{} for _ in range(shards)]
+    for key, group in _group_into(defaultdict(list), words, len(words)).items():
+        sharded[_shard_of(key, shards)][key] = group
+    return sharded
+
+
+def iter_anagram_groups(words, processes=1, chunk_size=CHUNK_SIZE):
+    """
+    Group an iterable of words (list, generator, file lines...) into anagram groups.
+    Yields each group as a list, words in input order within a group.
+
+    With processes > 1 the words are read in chunks, each worker groups its chunk
+    and splits the groups into one shard per process by signature hash, and the
+    shards are merged here. Groups then come out shard by shard.
+    """
+    if processes <= 1:
+        yield from _group_into(defaultdict(list), words).values()
+        return
+
+    from multiprocessing import Pool
+
+    merged = [{} for _ in range(processes)]
+    with Pool(processes) as pool:
+        tasks = ((chunk, processes) for chunk in _chunks(words, chunk_size))
+        for sharded in pool.imap(_group_chunk, tasks):
+            for shard, groups in zip(merged, sharded):
+                for key, group in groups.items():
+                    existing = shard.get(key)
+                    if existing is None:
+                        shard[key] = group
+                    else:
+                        existing.extend(group)
+
+    for shard in merged:
+        yield from shard.values()
+
+
+def group_anagrams(words, processes=1, chunk_size=CHUNK_SIZE):
+    """Return the anagram groups of an iterable of words as a list of lists."""
+    return list(iter_anagram_groups(words, processes, chunk_size))
+
+
+def read_words(path):
+    """Stream one word per line from a file, skipping blank lines."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            word = line.strip()
+            if word:
+                yield word
+
+
+def naive_group_anagrams(strs):
+    """Reference solution: sorted characters as the key."""
+    groups = {}
+    for word in strs:
+        key = ''.join(sorted(word))
+        if key in groups:
+            groups[key].append(word)
+        else:
+            groups[key] = [word]
+    return list(groups.values())
+
+
+# --- Benchmark ---
+
+def make_words(count, seed=1):
+    """Random lowercase words, each appearing with a few shuffled anagrams."""
+    import random
+
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    words = []
+    while len(words) < count:
+        word = [rng.choice(letters) for _ in range(rng.randint(3, 12))]
+        for _ in range(rng.randint(1, 4)):
+            rng.shuffle(word)
+            words.append(''.join(word))
+    del words[count:]
+    rng.shuffle(words)
+    return words
+
+
+def _canonical(groups):
+    return sorted(sorted(group) for group in groups)
+
+
+def benchmark(count=1_000_000, processes=2):
+    words = make_words(count)
+    results = {}
+    timings = {}
+    # Collector passes over the growing group lists would otherwise favour whichever runs first
+    gc.disable()
+    for label, run in [
+        ('naive sorted keys', lambda: naive_group_anagrams(words)),
+        ('count signatures', lambda: group_anagrams(words)),
+        (f'{processes} processes', lambda: group_anagrams(words, processes=processes)),
+    ]:
+        start = time.perf_counter()
+        results[label] = run()
+        timings[label] = time.perf_counter() - start
+    gc.enable()
+
+    expected = _canonical(results['naive sorted keys'])
+    baseline = timings['naive sorted keys']
+    print(f'{count} words, {len(expected)} groups')
+    for label, seconds in timings.items():
+        same = _canonical(results[label]) == expected
+        print(f'{label:>18}: {seconds:.3f}s  ({baseline / seconds:.2f}x)  {"ok" if same else "MISMATCH"}')
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Group anagrams')
+    parser.add_argument('path', nargs='?', help='file with one word per line')
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--benchmark', type=int, metavar='WORDS', help='compare against the naive solution')
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark(args.benchmark, max(args.processes, 2))
+    elif args.path:
+        for group in iter_anagram_groups(read_words(args.path), args.processes):
+            print(' '.join(group))
+    else:
+        strs = ["eat", "tea", "tan", "ate", "nat", "bat"]
+        print(group_anagrams(strs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+'''
+Fibonacci numbers.
+
+    fibonacci(n)      F(n); the original name, now backed by feb
+    feb(n)            F(n) by fast doubling, O(log n) big-int multiplications
+    feb_pair(n)       (F(n), F(n+1)), the seed for continuing a series from n
+    feb_series(...)   generator, O(1) additions per term
+    feb_mod(n, m)     F(n) mod m by 2x2 matrix exponentiation, small ints only
+    feb_cached(n)     feb behind a bounded LRU memo for repeated lookups
+'''
+import sys
+import time
+from functools import lru_cache
+
+
+def _fibonacci_naive(n):
+    # The original double recursion, O(phi^n); only the benchmark uses it now
+    # Base cases: first two numbers in sequence
+    if n == 0:
+        return 0
+    if n == 1:
+        return 1
+
+    # Recursive case: sum of previous two numbers
+    return _fibonacci_naive(n - 1) + _fibonacci_naive(n - 2)
+
+
+def feb_pair(n):
+    """Return (F(n), F(n+1)) using the fast doubling identities."""
+    if n < 0:
+        raise ValueError(f'n must be non-negative, got {n}')
+    a, b = 0, 1  # F(k), F(k+1) for k = the bits of n read so far
+    for bit in bin(n)[2:]:
+        # F(2k) = F(k) * (2F(k+1) - F(k)),  F(2k+1) = F(k)^2 + F(k+1)^2
+        a, b = a * (2 * b - a), a * a + b * b
+        if bit == '1':
+            a, b = b, a + b
+    return a, b
+
+
+def feb(n):
+    """Return the n-th Fibonacci number, F(0) = 0, F(1) = 1."""
+    return feb_pair(n)[0]
+
+
+def fibonacci(n):
+    """Return the n-th Fibonacci number; same as feb."""
+    return feb(n)
+
+
+# Bounded so a long-running process asking for many huge terms can't grow without limit
+feb_cached = lru_cache(maxsize=256)(feb)
+
+
+def feb_series(count=None, start=0):
+    """
+    Yield F(start), F(start + 1), ... (count terms, or forever if count is None).
+    Only the current two terms are kept; starting past 0 costs one feb_pair call.
+    """
+    a, b = feb_pair(start) if start else (0, 1)
+    remaining = count
+    while remaining is None or remaining > 0:
+        yield a
+        a, b = b, a + b
+        if remaining is not None:
+            remaining -= 1
+
+
+def _mat_mult(x, y, m):
+    return (
+        (x[0] * y[0] + x[1] * y[2]) % m,
+        (x[0] * y[1] + x[1] * y[3]) % m,
+        (x[2] * y[0] + x[3] * y[2]) % m,
+        (x[2] * y[1] + x[3] * y[3]) % m,
+    )
+
+
+def feb_mod(n, m):
+    """Return F(n) mod m using [[1, 1], [1, 0]]^n, keeping every entry below m."""
+    if n < 0:
+        raise ValueError(f'n must be non-negative, got {n}')
+    if m < 1:
+        raise ValueError(f'modulus must be positive, got {m}')
+    result = (1, 0, 0, 1)
+    base = (1, 1, 1, 0)
+    while n:
+        if n & 1:
+            result = _mat_mult(result, base, m)
+        base = _mat_mult(base, base, m)
+        n >>= 1
+    return result[1] % m  # the matrix power holds F(n) off the diagonal
+
+
+# --- Benchmark ---
+
+def _feb_loop(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def benchmark(n=1_000_000):
+    naive, naive_s = _timed(_fibonacci_naive, 27)
+    value, fast_s = _timed(feb, 27)
+    print(f'F(27): {naive_s:.3f}s naive recursion vs {fast_s * 1e6:.0f} us feb  '
+          f'{"ok" if value == naive else "MISMATCH"}')
+
+    value, seconds = _timed(feb, n)
+    print(f'feb({n}): {value.bit_length()} bits, {seconds:.3f}s')
+
+    check = min(n, 100_000)
+    expected, loop_s = _timed(_feb_loop, check)
+    value, fast_s = _timed(feb, check)
+    print(f'feb({check}): {fast_s:.4f}s vs {loop_s:.3f}s iterative loop  {"ok" if value == expected else "MISMATCH"}')
+
+    series, series_s = _timed(lambda: sum(1 for _ in feb_series(check)))
+    print(f'feb_series({check}): {series_s:.3f}s, {series_s / check * 1e9:.0f} ns/term')
+
+    m = 10**9 + 7
+    value, mod_s = _timed(feb_mod, 10**18, m)
+    print(f'feb_mod(10**18, {m}): {value} in {mod_s * 1e6:.0f} us  '
+          f'{"ok" if feb_mod(check, m) == expected % m else "MISMATCH"}')
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Fibonacci numbers')
+    parser.add_argument('n', nargs='?', type=int, help='print F(n)')
+    parser.add_argument('--mod', type=int, help='print F(n) mod MOD instead')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='time F(N) and compare against a loop')
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+    elif args.n is not None:
+        if hasattr(sys, 'set_int_max_str_digits'):
+            sys.set_int_max_str_digits(0)  # Python 3.11+ refuses to print huge ints by default
+        print(feb_mod(args.n, args.mod) if args.mod else feb(args.n))
+    else:
+        for i, value in enumerate(feb_series(10)):
+            print(f'F({i}) = {value}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+import os
+import sys
+import json
+
+from .fibonacci_numbers import feb_pair, feb_series, fibonacci
+
+CHUNK_TERMS = 1000
+
+
+def print_fibonacci_series(count, current=0):
+    # Print F(current)..F(count - 1), carrying the last two terms forward
+    # instead of recursing once per term
+    for value in feb_series(max(count - current, 0), start=current):
+        print(value, end=" ")
+
+
+# --- Streaming exporter ---
+
+def _lift_int_str_limit():
+    # Python 3.11+ refuses to str() ints over 4300 digits, and every term past
+    # about F(20577) is longer; this also runs as the pool workers' initializer
+    if hasattr(sys, 'set_int_max_str_digits'):
+        sys.set_int_max_str_digits(0)
+
+
+def iter_series_chunks(start, stop, chunk_terms=CHUNK_TERMS):
+    """
+    Yield (first_index, text) for terms F(start)..F(stop), one term per line,
+    chunk_terms terms per chunk. Only the current two terms and one chunk of
+    text are held in memory. Lifts the interpreter's int-to-str digit limit.
+    """
+    _lift_int_str_limit()
+    a, b = feb_pair(start)
+    index = start
+    while index <= stop:
+        end = min(index + chunk_terms, stop + 1)
+        lines = []
+        for _ in range(end - index):
+            lines.append(f'{a}\n')
+            a, b = b, a + b
+        yield index, ''.join(lines)
+        index = end
+
+
+def _render_chunk(bounds):
+    """Worker: render one chunk from its own fast-doubling seed."""
+    start, stop = bounds
+    return next(iter_series_chunks(start, stop, stop - start + 1))
+
+
+def iter_series_chunks_parallel(start, stop, chunk_terms=CHUNK_TERMS, processes=2):
+    """Same chunks as iter_series_chunks, rendered by a process pool and yielded in order."""
+    bounds = (
+        (first, min(first + chunk_terms - 1, stop))
+        for first in range(start, stop + 1, chunk_terms)
+    )
+    from multiprocessing import Pool
+
+    with Pool(processes, initializer=_lift_int_str_limit) as pool:
+        yield from pool.imap(_render_chunk, bounds)
+
+
+def read_checkpoint(path):
+    """Saved progress as a dict, or None if there is no checkpoint."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def write_checkpoint(path, state):
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)  # never leave a half-written checkpoint
+
+
+def export_fibonacci_series(out, start, stop, chunk_terms=CHUNK_TERMS, checkpoint=None, processes=1):
+    """
+    Write F(start)..F(stop) to the text stream out, one term per line.
+
+    With checkpoint, the next term index and the output offset are saved after
+    every chunk. A run that finds a checkpoint for the same range truncates out
+    to the saved offset (dropping a chunk cut short by a crash) and continues
+    from the saved term; without a checkpoint yet, out is truncated to empty.
+    out must be a seekable file. Returns the number of terms written by this run.
+    """
+    if start < 0 or stop < start - 1:
+        raise ValueError(f'invalid range [{start}, {stop}]')
+    first = start
+    if checkpoint:
+        state = read_checkpoint(checkpoint)
+        if state is not None:
+            if (state['start'], state['stop']) != (start, stop):
+                raise ValueError(
+                    f"checkpoint {checkpoint} is for [{state['start']}, {state['stop']}], not [{start}, {stop}]"
+                )
+            out.seek(state['offset'])
+            first = state['next']
+        else:
+            out.seek(0)  # a fresh run: drop whatever an earlier, unsaved attempt left
+        out.truncate()
+
+    if processes > 1:
+        chunks = iter_series_chunks_parallel(first, stop, chunk_terms, processes)
+    else:
+        chunks = iter_series_chunks(first, stop, chunk_terms)
+
+    written = 0
+    for index, text in chunks:
+        out.write(text)
+        terms = text.count('\n')
+        written += terms
+        if checkpoint:
+            out.flush()
+            write_checkpoint(checkpoint, {'start': start, 'stop': stop, 'next': index + terms, 'offset': out.tell()})
+    out.flush()
+    return written
+
+
+# --- Self-tests ---
+
+def test_large_terms():
+    import io
+
+    if hasattr(sys, 'set_int_max_str_digits'):
+        sys.set_int_max_str_digits(4300)  # the interpreter default, as a library caller would have
+    out = io.StringIO()
+    assert export_fibonacci_series(out, 20000, 21000) == 1001
+    lines = out.getvalue().splitlines()
+    assert len(lines) == 1001 and len(lines[-1]) > 4300
+    assert int(lines[1]) + int(lines[2]) == int(lines[3])
+
+
+def test_parallel_export():
+    import io
+
+    if hasattr(sys, 'set_int_max_str_digits'):
+        sys.set_int_max_str_digits(4300)
+    serial, parallel = io.StringIO(), io.StringIO()
+    export_fibonacci_series(serial, 20900, 21100, chunk_terms=50)
+    if hasattr(sys, 'set_int_max_str_digits'):
+        sys.set_int_max_str_digits(4300)  # the workers must lift it themselves
+    assert export_fibonacci_series(parallel, 20900, 21100, chunk_terms=50, processes=2) == 201
+    assert parallel.getvalue() == serial.getvalue()
+
+
+def test_print_long_series():
+    import io
+    from contextlib import redirect_stdout
+
+    count = sys.getrecursionlimit() + 200
+    out = io.StringIO()
+    with redirect_stdout(out):
+        print_fibonacci_series(count)
+    terms = out.getvalue().split()
+    assert len(terms) == count
+    assert terms[:6] == ['0', '1', '1', '2', '3', '5']
+    assert int(terms[-1]) == fibonacci(count - 1)
+
+
+def test_resume_from_checkpoint():
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out_path = os.path.join(tmp, 'series.txt')
+        checkpoint = os.path.join(tmp, 'series.json')
+        with open(out_path, 'w') as out:
+            out.write('stale\n')
+        with open(out_path, 'a') as out:
+            export_fibonacci_series(out, 0, 29, chunk_terms=10, checkpoint=checkpoint)
+        with open(out_path) as f:
+            expected = f.read()
+        assert expected.split() == [str(fibonacci(i)) for i in range(30)]
+
+        # Roll back to the end of the second chunk, as if the run had died in
+        # the third, and leave a partial chunk behind
+        state = read_checkpoint(checkpoint)
+        offset = len(''.join(f'{fibonacci(i)}\n' for i in range(20)))
+        write_checkpoint(checkpoint, dict(state, next=20, offset=offset))
+        with open(out_path, 'a') as out:
+            out.write('4181\n67')
+        with open(out_path, 'a') as out:
+            assert export_fibonacci_series(out, 0, 29, chunk_terms=10, checkpoint=checkpoint) == 10
+        with open(out_path) as f:
+            assert f.read() == expected
+    print("Fibonacci series tests passed! ✅")
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Stream Fibonacci terms to a file or stdout')
+    parser.add_argument('count', nargs='?', type=int, help='write the first COUNT terms')
+    parser.add_argument('--range', nargs=2, type=int, metavar=('A', 'B'), help='write terms A..B inclusive')
+    parser.add_argument('--output', help='file to write (default stdout)')
+    parser.add_argument('--chunk-terms', type=int, default=CHUNK_TERMS)
+    parser.add_argument('--checkpoint', help='resume file; requires --output')
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--test', action='store_true', help='run the self-tests')
+    args = parser.parse_args(argv)
+
+    if args.test:
+        test_large_terms()
+        test_parallel_export()
+        test_print_long_series()
+        test_resume_from_checkpoint()
+        return
+
+    if args.count is None and args.range is None:
+        # Print first 10 fibonacci numbers
+        print("Fibonacci series:")
+        print_fibonacci_series(10)
+        print()  # New line at the end
+        return
+    if args.checkpoint and not args.output:
+        parser.error('--checkpoint needs --output so the run can be resumed')
+
+    start, stop = args.range if args.range else (0, args.count - 1)
+    if args.output:
+        with open(args.output, 'a' if args.checkpoint else 'w') as out:  # export truncates to the checkpoint
+            export_fibonacci_series(out, start, stop, args.chunk_terms, args.checkpoint, args.processes)
+    else:
+        export_fibonacci_series(sys.stdout, start, stop, args.chunk_terms, processes=args.processes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,430 @@
+'''
+Given the head of a singly linked list, reverse the list, and return the reversed list.
+Example:
+Input: head = [1,2,3,4,5]
+Output: [5,4,3,2,1]
+'''
+import os
+import sys
+import mmap
+import time
+import struct
+from array import array
+
+from ._compat import optional_import
+
+
+class ListNode:
+    __slots__ = ('val', 'next')  # no per-node __dict__; matters at millions of nodes
+
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+# --- Helper Functions for Testing ---
+def iter_values(values):
+    """
+    Iterate any iterable. Buffers (memoryview, array, NumPy arrays, mmap) are
+    read through a memoryview, so no copy is made and items come out as plain
+    Python ints/floats instead of NumPy scalars.
+    """
+    if isinstance(values, (str, bytes, bytearray)):
+        return iter(values)
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return iter(values)
+    if view.ndim > 1:
+        view = view.cast('B').cast(view.format)  # flatten; needs a C-contiguous buffer
+    return iter(view)
+
+def create_linked_list(arr):
+    """Converts any iterable or buffer to a Linked List, streaming it without copies."""
+    dummy = ListNode()
+    curr = dummy
+    for val in iter_values(arr):
+        curr.next = ListNode(val)
+        curr = curr.next
+    return dummy.next
+
+def iter_nodes(head):
+    """Lazily yields the nodes of a Linked List."""
+    while head:
+        yield head
+        head = head.next
+
+def linked_list_to_list(head):
+    """Converts a Linked List back to a Python list for easy assertion."""
+    return [node.val for node in iter_nodes(head)]
+
+_INT_CODES = {1: 'b', 2: 'h', 4: 'i', 8: 'q'}
+
+def iter_file_values(path, width=8, signed=True, byteorder='little'):
+    """
+    Lazily yields fixed-width integers from a binary file through mmap; only
+    the pages being read are in memory.
+    """
+    code = _INT_CODES[width] if signed else _INT_CODES[width].upper()
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size % width:
+            raise ValueError(f'{path}: {size} bytes is not a multiple of {width}')
+        if not size:
+            return  # mmap can't map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if byteorder == sys.byteorder and struct.calcsize(code) == width:
+                values = memoryview(mapped).cast(code)
+            else:
+                values = struct.iter_unpack(('<' if byteorder == 'little' else '>') + code, mapped)
+            try:
+                if isinstance(values, memoryview):
+                    yield from values
+                else:
+                    for (value,) in values:
+                        yield value
+            finally:
+                # Drop the export before the mmap closes, even if iteration stopped early
+                if isinstance(values, memoryview):
+                    values.release()
+                del values
+
+def linked_list_from_file(path, width=8, signed=True, byteorder='little'):
+    """Builds a Linked List from a file of fixed-width integers."""
+    return create_linked_list(iter_file_values(path, width, signed, byteorder))
+
+# --- The Function to Test ---
+
+def reverseList(head):
+    prev = None
+    curr = head
+    while curr:
+        nxt = curr.next
+        curr.next = prev
+        prev = curr
+        curr = nxt
+    return prev
+
+# --- Array-backed linked list ---
+
+NIL = -1  # "no next node" index
+# Longest list ArrayLinkedList.reverse() reverses with a NumPy scatter. Its
+# temporaries (a copy of next, a mask and an index array) peak at about
+# 17 bytes per node, more than the list's own 16, so longer lists take the
+# in-place pointer walk with O(1) extra memory instead
+SCATTER_MAX_NODES = 1 << 20
+
+
+def _int64_array(values):
+    # Contiguous 64-bit integer buffers are copied in one memcpy; anything
+    # else is streamed item by item
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array('q', iter_values(values))
+    if view.format in ('q', 'l') and view.itemsize == 8 and view.c_contiguous:
+        val = array('q')
+        val.frombytes(view.cast('B'))
+        return val
+    return array('q', iter_values(view))
+
+
+class ArrayLinkedList:
+    """
+    Singly linked list of 64-bit ints stored as two parallel arrays:
+    val[i] is node i's value and next[i] the index of the node after it
+    (NIL at the tail). Every slot is part of the list; head is the index of
+    the first node. Node i costs 16 bytes instead of a Python object.
+    """
+    __slots__ = ('val', 'next', 'head')
+
+    def __init__(self, values=()):
+        self._link(_int64_array(values))
+
+    @classmethod
+    def _adopt(cls, val):
+        # Take ownership of an array('q') we built ourselves, skipping the copy
+        linked = cls.__new__(cls)
+        linked._link(val)
+        return linked
+
+    def _link(self, val):
+        # Lay the nodes out in slot order: next[i] = i + 1
+        n = len(val)
+        self.val = val
+        self.next = array('q')
+        np = optional_import('numpy')
+        if np is not None:
+            self.next.frombytes(memoryview(np.arange(1, n + 1, dtype=np.int64)).cast('B'))
+        else:
+            self.next.extend(range(1, n + 1))
+        if n:
+            self.next[-1] = NIL
+        self.head = 0 if n else NIL
+
+    @classmethod
+    def from_file(cls, path, width=8, signed=True, byteorder='little'):
+        """Load a file of fixed-width integers; native int64 files are a single copy out of the mmap."""
+        if width == 8 and signed and byteorder == sys.byteorder and os.path.getsize(path):
+            val = array('q')
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if len(mapped) % 8:
+                    raise ValueError(f'{path}: {len(mapped)} bytes is not a multiple of 8')
+                val.frombytes(mapped)
+            return cls._adopt(val)
+        return cls._adopt(array('q', iter_file_values(path, width, signed, byteorder)))
+
+    def __len__(self):
+        return len(self.val)
+
+    def __iter__(self):
+        val, nxt = self.val, self.next
+        curr = self.head
+        while curr != NIL:
+            yield val[curr]
+            curr = nxt[curr]
+
+    def to_list(self):
+        return list(self)
+
+    @classmethod
+    def from_nodes(cls, head):
+        """Copy a ListNode chain."""
+        return cls._adopt(array('q', (node.val for node in iter_nodes(head))))
+
+    def to_nodes(self):
+        """Build the equivalent ListNode chain and return its head."""
+        head = None
+        val, nxt = self.val, self.next
+        # Collect the order first so the chain can be built back to front
+        order = array('q')
+        curr = self.head
+        while curr != NIL:
+            order.append(curr)
+            curr = nxt[curr]
+        for i in reversed(order):
+            head = ListNode(val[i], head)
+        return head
+
+    def reverse(self):
+        """
+        Reverse the list by rewriting next; values don't move. Lists of up to
+        SCATTER_MAX_NODES nodes use a NumPy scatter (~17 B/node of temporaries);
+        longer ones, or any list without NumPy, are walked in place.
+        """
+        if len(self) < 2:
+            return self
+        nxt = self.next
+        np = optional_import('numpy') if len(self) <= SCATTER_MAX_NODES else None
+        if np is not None:
+            # Every slot is in the list, so each node's new next is whichever
+            # node pointed at it: one scatter instead of a Python-level walk
+            links = np.frombuffer(nxt, dtype=np.int64)
+            old = links.copy()
+            has_next = old != NIL
+            links[old[has_next]] = np.flatnonzero(has_next)
+            links[self.head] = NIL
+            self.head = int(np.flatnonzero(~has_next)[0])
+            return self
+
+        prev = NIL
+        curr = self.head
+        while curr != NIL:
+            following = nxt[curr]
+            nxt[curr] = prev
+            prev = curr
+            curr = following
+        self.head = prev
+        return self
+
+    def reverse_k_group(self, k):
+        """
+        Reverse each run of k nodes in place; a shorter run at the end keeps its order.
+        """
+        if k < 1:
+            raise ValueError(f'k must be positive, got {k}')
+        nxt = self.next
+        new_head = NIL
+        group_tail = NIL  # last node of the previous (already reversed) group
+        curr = self.head
+        while curr != NIL:
+            # Find the start of the next group, or stop if fewer than k nodes remain
+            following = curr
+            for _ in range(k):
+                if following == NIL:
+                    break
+                following = nxt[following]
+            else:
+                # Reverse curr.. k nodes, pointing the group's new tail at `following`
+                prev = following
+                node = curr
+                for _ in range(k):
+                    after = nxt[node]
+                    nxt[node] = prev
+                    prev = node
+                    node = after
+                if group_tail == NIL:
+                    new_head = prev
+                else:
+                    nxt[group_tail] = prev
+                group_tail = curr
+                curr = following
+                continue
+            break
+        if new_head != NIL:
+            self.head = new_head
+        return self
+
+
+# --- The Test Function ---
+
+def test_reverse():
+    # Case 1: Standard list
+    input_arr = [1, 2, 3, 4, 5]
+    head = create_linked_list(input_arr)
+    reversed_head = reverseList(head)
+    assert linked_list_to_list(reversed_head) == [5, 4, 3, 2, 1]
+    
+    # Case 2: Single element
+    head = create_linked_list([1])
+    reversed_head = reverseList(head)
+    assert linked_list_to_list(reversed_head) == [1]
+    
+    # Case 3: Empty list
+    head = create_linked_list([])
+    reversed_head = reverseList(head)
+    assert linked_list_to_list(reversed_head) == []
+    
+    print("All tests passed! ✅")
+
+
+def test_array_linked_list():
+    for values in ([1, 2, 3, 4, 5], [1], []):
+        linked = ArrayLinkedList(values)
+        assert linked.reverse().to_list() == values[::-1]
+        assert linked.reverse().to_list() == values
+        assert linked_list_to_list(linked.to_nodes()) == values
+        assert ArrayLinkedList.from_nodes(create_linked_list(values)).to_list() == values
+
+    for k, expected in [
+        (1, [1, 2, 3, 4, 5]),
+        (2, [2, 1, 4, 3, 5]),
+        (3, [3, 2, 1, 4, 5]),
+        (5, [5, 4, 3, 2, 1]),
+        (6, [1, 2, 3, 4, 5]),
+    ]:
+        assert ArrayLinkedList([1, 2, 3, 4, 5]).reverse_k_group(k).to_list() == expected
+
+    # Reversal has to follow the links, not the slot order
+    linked = ArrayLinkedList([1, 2, 3, 4, 5, 6, 7]).reverse_k_group(3)
+    assert linked.reverse().to_list() == [7, 4, 5, 6, 1, 2, 3]
+
+    print("ArrayLinkedList tests passed! ✅")
+
+
+def test_streaming_builders():
+    import tempfile
+
+    np = optional_import('numpy')
+    values = [5, -3, 0, 7, 2**40]
+    assert linked_list_to_list(create_linked_list(iter(values))) == values
+    assert linked_list_to_list(create_linked_list(memoryview(array('q', values)))) == values
+    assert [node.val for node in iter_nodes(create_linked_list(range(3)))] == [0, 1, 2]
+    assert ArrayLinkedList(array('q', values)).to_list() == values
+    assert ArrayLinkedList(iter(values)).to_list() == values
+    if np is not None:
+        matrix = np.arange(6, dtype=np.int32).reshape(2, 3)
+        assert linked_list_to_list(create_linked_list(matrix)) == [0, 1, 2, 3, 4, 5]
+        assert type(create_linked_list(np.array([1])).val) is int
+        assert ArrayLinkedList(np.array(values)).to_list() == values
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'values.bin')
+        with open(path, 'wb') as f:
+            f.write(struct.pack('<5q', *values))
+        assert linked_list_to_list(linked_list_from_file(path)) == values
+        assert ArrayLinkedList.from_file(path).to_list() == values
+
+        with open(path, 'wb') as f:
+            f.write(struct.pack('>3H', 1, 2, 65535))
+        assert list(iter_file_values(path, width=2, signed=False, byteorder='big')) == [1, 2, 65535]
+        assert ArrayLinkedList.from_file(path, width=2, signed=False, byteorder='big').to_list() == [1, 2, 65535]
+
+        open(path, 'wb').close()
+        assert linked_list_from_file(path) is None
+        assert ArrayLinkedList.from_file(path).to_list() == []
+
+    print("Streaming builder tests passed! ✅")
+
+
+# --- Benchmark ---
+
+def _measure(build):
+    # Timed and traced separately: tracemalloc slows allocation down a lot
+    import tracemalloc
+
+    tracemalloc.start()
+    result = build()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    start = time.perf_counter()
+    result = build()
+    return result, time.perf_counter() - start, memory
+
+
+def benchmark(n=1_000_000):
+    import tempfile
+
+    values = range(n)
+    print(f'{n} nodes')
+
+    head, build_s, memory = _measure(lambda: create_linked_list(list(values)))
+    start = time.perf_counter()
+    head = reverseList(head)
+    reverse_s = time.perf_counter() - start
+    print(f'  ListNode:        build {build_s:.2f}s  {memory / n:5.1f} B/node  reverse {reverse_s:.3f}s')
+    del head
+
+    linked, build_s, memory = _measure(lambda: ArrayLinkedList(values))
+    start = time.perf_counter()
+    linked.reverse()
+    reverse_s = time.perf_counter() - start
+    start = time.perf_counter()
+    linked.reverse_k_group(64)
+    k_group_s = time.perf_counter() - start
+    print(f'  ArrayLinkedList: build {build_s:.2f}s  {memory / n:5.1f} B/node  reverse {reverse_s:.3f}s  '
+          f'reverse_k_group(64) {k_group_s:.3f}s')
+    del linked
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'values.bin')
+        with open(path, 'wb') as f:
+            f.write(array('q', values))
+        for label, load in [
+            ('linked_list_from_file', lambda: linked_list_from_file(path)),
+            ('ArrayLinkedList.from_file', lambda: ArrayLinkedList.from_file(path)),
+        ]:
+            loaded, load_s, memory = _measure(load)
+            print(f'  {label}: {load_s:.3f}s  {memory / n:5.1f} B/node')
+            del loaded
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Linked list reversal')
+    parser.add_argument('--benchmark', type=int, metavar='NODES', help='compare ListNode and ArrayLinkedList')
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+    else:
+        # Run the tests
+        test_reverse()
+        test_array_linked_list()
+        test_streaming_builders()
+
+
+if __name__ == "__main__":
+    main()
+
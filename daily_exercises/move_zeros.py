@@ -0,0 +1,210 @@
+import time
+
+from ._compat import optional_import
+
+def moveZeroes(nums):
+    k = 0  # position to put next non-zero
+
+    for i in range(len(nums)):
+        if nums[i] != 0:
+            # Only swap when i and k are different to avoid useless swaps
+            if i != k:
+                nums[i], nums[k] = nums[k], nums[i]
+            k += 1
+
+
+# --- Buffers: array.array, NumPy arrays, memoryviews, np.memmap ---
+
+# Below this many elements the plain Python loop beats NumPy's per-call
+# overhead (see benchmark()); python move-zeros.py --benchmark re-measures it
+CROSSOVER = 64
+# Elements compacted per step; bounds the temporaries to a few chunk-sized arrays
+CHUNK_SIZE = 1 << 16
+
+
+def _is_zero(value):
+    return value == 0
+
+
+def _move_to_end_small(nums, predicate):
+    # Stable partition with one Python-level pass; fine for small inputs
+    kept = [value for value in nums if not predicate(value)]
+    matched = [value for value in nums if predicate(value)]
+    if isinstance(nums, list):
+        nums[:] = kept + matched
+    else:  # array and memoryview slices only take their own type
+        for i, value in enumerate(kept + matched):
+            nums[i] = value
+    return len(kept)
+
+
+def move_to_end(nums, predicate=None, fill=None, chunk_size=CHUNK_SIZE):
+    """
+    Move every element matching predicate to the end of nums, in place,
+    keeping the relative order of both the kept and the moved elements.
+    Returns the number of kept elements. The default predicate matches 0.
+
+    nums can be a list or any writable buffer (array.array, NumPy array,
+    memoryview, np.memmap). Lists and inputs shorter than CROSSOVER take the
+    Python path (moveZeroes for the default predicate). Larger buffers are
+    compacted chunk_size elements at a time with a NumPy boolean mask, so no
+    full-size temporary is made. predicate must then also accept an array
+    chunk and return a mask, as `lambda x: x < 0` or np.isnan do.
+
+    The moved elements are refilled with `fill` when every match has the
+    same value (0 for the default predicate). Otherwise each chunk is
+    partitioned in place and neighbouring runs are merged with block
+    rotations: O(n log(n / chunk_size)) moves, still within a few chunks of
+    extra memory however many elements match.
+    """
+    if predicate is None:
+        predicate = _is_zero
+        fill = 0
+
+    np = optional_import('numpy')  # without it, everything takes the Python path
+    if np is not None and getattr(nums, 'ndim', 1) > 1:
+        nums = _flat_view(np, nums)
+    if isinstance(nums, list) or len(nums) < CROSSOVER or np is None:
+        if predicate is _is_zero:
+            moveZeroes(nums)
+            return sum(1 for value in nums if value != 0)
+        return _move_to_end_small(nums, predicate)
+
+    return _compact_chunked(np, np.asarray(nums), predicate, fill, chunk_size)
+
+
+def _flat_view(np, nums):
+    # 1-d view of a multi-dimensional buffer; compacting a copy would be silently lost
+    view = np.asarray(nums)
+    flat = view.reshape(-1)
+    if not np.shares_memory(flat, view):
+        raise ValueError('multi-dimensional input must be contiguous')
+    return flat
+
+
+def _compact_chunked(np, view, predicate, fill, chunk_size):
+    if fill is None:
+        return _partition_chunked(np, view, predicate, chunk_size)
+    n = len(view)
+    write = 0
+    for start in range(0, n, chunk_size):
+        chunk = view[start:start + chunk_size]
+        mask = np.asarray(predicate(chunk), dtype=bool)
+        kept = chunk[~mask]  # a copy, so the write below can't clobber unread values
+        view[write:write + len(kept)] = kept
+        write += len(kept)
+
+    for start in range(write, n, chunk_size):
+        view[start:start + chunk_size] = fill
+    return write
+
+
+def _partition_chunked(np, view, predicate, chunk_size):
+    # Stable partition of every chunk on its own, giving runs of
+    # (start, end, kept) that read kept values then matches
+    runs = []
+    for start in range(0, len(view), chunk_size):
+        chunk = view[start:start + chunk_size]
+        mask = np.asarray(predicate(chunk), dtype=bool)
+        kept, matched = chunk[~mask], chunk[mask]
+        chunk[:len(kept)] = kept
+        chunk[len(kept):] = matched
+        runs.append((start, start + len(chunk), len(kept)))
+
+    # Merge neighbouring runs pairwise: rotating the left run's matches past
+    # the right run's kept values joins them into one partitioned run
+    while len(runs) > 1:
+        merged = []
+        for i in range(0, len(runs) - 1, 2):
+            (lo, mid, left_kept), (_, hi, right_kept) = runs[i], runs[i + 1]
+            _rotate(view, lo + left_kept, mid, mid + right_kept, chunk_size)
+            merged.append((lo, hi, left_kept + right_kept))
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+    return runs[0][2] if runs else 0
+
+
+def _rotate(view, lo, mid, hi, chunk_size):
+    # Swap view[lo:mid] and view[mid:hi] with three reversals
+    if lo < mid < hi:
+        _reverse(view, lo, mid, chunk_size)
+        _reverse(view, mid, hi, chunk_size)
+        _reverse(view, lo, hi, chunk_size)
+
+
+def _reverse(view, lo, hi, chunk_size):
+    # Swap blocks from both ends inward, copying one block at a time
+    while hi - lo > 1:
+        step = min(chunk_size, (hi - lo) // 2)
+        left = view[lo:lo + step].copy()
+        view[lo:lo + step] = view[hi - step:hi][::-1]
+        view[hi - step:hi] = left[::-1]
+        lo += step
+        hi -= step
+
+
+# --- Benchmark ---
+
+def _time_best(fn, make_input, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        data = make_input()
+        start = time.perf_counter()
+        fn(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(sizes=(16, 64, 256, 1024, 4096, 65536, 1 << 20, 1 << 24)):
+    """Time the Python loop against chunked NumPy compaction on array('d') inputs with ~30% zeros."""
+    from array import array
+
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    print(f'{"n":>10} {"loop":>12} {"chunked":>12}')
+    crossover = None
+    for n in sizes:
+        values = rng.integers(0, 10, size=n).astype(np.float64)
+        values[values < 3] = 0
+        make_input = lambda: array('d', values.tobytes())
+        repeat = max(3, min(200, 200_000 // n))
+        loop_s = _time_best(moveZeroes, make_input, repeat) if n <= 1 << 20 else None
+        chunked_s = _time_best(
+            lambda data: _compact_chunked(np, np.asarray(data), _is_zero, 0, CHUNK_SIZE), make_input, repeat
+        )
+        if crossover is None and loop_s is not None and chunked_s < loop_s:
+            crossover = n
+        loop_text = f'{loop_s * 1e3:10.3f}ms' if loop_s is not None else f'{"-":>12}'
+        print(f'{n:>10} {loop_text} {chunked_s * 1e3:10.3f}ms')
+    print(f'chunked compaction wins from n = {crossover} (CROSSOVER = {CROSSOVER})')
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Move zeroes to the end')
+    parser.add_argument('--benchmark', action='store_true', help='find where chunked compaction beats the loop')
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark()
+        return
+
+    # Example usage:
+    nums1 = [0, 1, 0, 3, 12]
+    moveZeroes(nums1)
+    print(nums1)  # [1, 3, 12, 0, 0]
+
+    nums2 = [0]
+    moveZeroes(nums2)
+    print(nums2)  # [0]
+
+    nums3 = [1, 2, 3]
+    moveZeroes(nums3)
+    print(nums3)  # [1, 2, 3]
+
+
+if __name__ == "__main__":
+    main()
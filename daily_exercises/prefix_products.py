@@ -0,0 +1,287 @@
+'''
+A great warm-up medium that uses arrays + prefix products (very common pattern) is:
+
+LeetCode: 238. Product of Array Except Self (Medium)​
+
+Given an integer array nums, return an array answer such that answer[i] is the product of all the elements of nums except nums[i].
+
+The solution must run in O(n) time and without using division.
+
+Example:
+
+Input: nums = [1,2,3,4]
+              [1,1,2,6]
+              [6*4]
+Output: [24,12,8,6]
+'''
+import os
+import time
+
+# NumPy is imported inside the functions that use it, so importing this module
+# (and productExceptSelf) stays cheap and works without NumPy installed
+
+def productExceptSelf(nums):
+    answers = [1] * len(nums)
+
+    # find left multiples
+    left_multiple = 1
+    for i in range(len(nums)):
+        answers[i] = left_multiple
+        left_multiple = left_multiple * nums[i]
+    
+    # nums : [1,2,3,4]
+    # left : [1,1,2,6]
+    # right: [1x12x2,1x3,2x4,6x1]
+    # [48,24,8,6]
+    right_multiple = 1
+    # find right multiples
+    for i in range(len(nums) - 1, -1, -1):
+        answers[i] = answers[i] * right_multiple
+        right_multiple = right_multiple * nums[i]
+    
+    return answers
+
+
+# --- Vectorized and out-of-core versions ---
+
+# Elements per block; small enough that each block's passes stay in cache
+CHUNK_SIZE = 1 << 14
+
+
+def _exclusive(inclusive, identity):
+    import numpy as np
+    out = np.empty_like(inclusive)
+    out[0] = identity
+    out[1:] = inclusive[:-1]
+    return out
+
+
+def _cumprod_mod(x, mod):
+    """Inclusive prefix products mod `mod`, by log2(n) vectorized doubling passes."""
+    import numpy as np
+    out = np.mod(x, mod).astype(np.uint64)
+    shift = 1
+    while shift < len(out):
+        # Residues stay below 2**32, so each product fits in uint64
+        out[shift:] = out[shift:] * out[:-shift] % np.uint64(mod)
+        shift *= 2
+    return out
+
+
+def _chunk_cumprod(x, mod):
+    import numpy as np
+    return np.cumprod(x) if mod is None else _cumprod_mod(x, mod)
+
+
+def _product(src, start, stop, chunk_size, mod, dtype):
+    # Product of src[start:stop], read chunk by chunk. Exact-mode products are
+    # kept in 1-element arrays so they wrap like the rest of the output
+    # instead of raising scalar overflow warnings.
+    import numpy as np
+    total = np.ones(1, dtype=dtype) if mod is None else 1
+    for first in range(start, stop, chunk_size):
+        chunk = np.asarray(src[first:min(first + chunk_size, stop)])
+        if not len(chunk):
+            continue
+        if mod is None:
+            total = total * np.prod(chunk, keepdims=True, dtype=dtype)
+        else:
+            total = total * int(_cumprod_mod(chunk, mod)[-1]) % mod
+    return total
+
+
+def product_except_self_chunked(src, dst, chunk_size=CHUNK_SIZE, mod=None):
+    """
+    Fill dst[i] with the product of every src element except src[i], without division.
+    src and dst can be NumPy arrays or np.memmap files larger than RAM: both are
+    read in chunk_size blocks, with one running product carried between blocks.
+
+    Integer products wrap around like any int64 NumPy arithmetic; pass mod
+    (at most 2**32) to get exact results modulo mod instead.
+    """
+    import numpy as np
+    if mod is not None and not 1 <= mod <= 1 << 32:
+        raise ValueError(f'mod must be between 1 and 2**32, got {mod}')
+    n = len(src)
+    if n == 0:
+        return dst
+
+    # Zero fast path: with two or more zeros every product is 0, with one zero
+    # only that position is non-zero
+    zeros = 0
+    zero_at = None
+    for first in range(0, n, chunk_size):
+        found = np.flatnonzero(np.asarray(src[first:first + chunk_size]) == 0)
+        if len(found) and zero_at is None:
+            zero_at = first + int(found[0])
+        zeros += len(found)
+        if zeros > 1:
+            break
+    if zeros:
+        for first in range(0, n, chunk_size):
+            dst[first:first + chunk_size] = 0
+        if zeros == 1:
+            left = _product(src, 0, zero_at, chunk_size, mod, dst.dtype)
+            right = _product(src, zero_at + 1, n, chunk_size, mod, dst.dtype)
+            dst[zero_at:zero_at + 1] = left * right if mod is None else left * right % mod
+        return dst
+
+    # Forward pass: dst = exclusive prefix products
+    carry = np.ones(1, dtype=dst.dtype) if mod is None else 1
+    for first in range(0, n, chunk_size):
+        chunk = np.asarray(src[first:first + chunk_size])
+        inclusive = _chunk_cumprod(chunk, mod)
+        prefix = _exclusive(inclusive, 1)
+        if mod is None:
+            dst[first:first + len(chunk)] = prefix * carry
+            carry = carry * inclusive[-1:]
+        else:
+            dst[first:first + len(chunk)] = prefix * np.uint64(carry) % np.uint64(mod)
+            carry = carry * int(inclusive[-1]) % mod
+
+    # Backward pass: multiply in the exclusive suffix products
+    carry = np.ones(1, dtype=dst.dtype) if mod is None else 1
+    for last in range(n, 0, -chunk_size):
+        first = max(last - chunk_size, 0)
+        chunk = np.asarray(src[first:last])[::-1]
+        inclusive = _chunk_cumprod(chunk, mod)
+        suffix = _exclusive(inclusive, 1)[::-1]
+        if mod is None:
+            dst[first:last] = dst[first:last] * (suffix * carry)
+            carry = carry * inclusive[-1:]
+        else:
+            suffix = suffix * np.uint64(carry) % np.uint64(mod)
+            dst[first:last] = dst[first:last].astype(np.uint64) * suffix % np.uint64(mod)
+            carry = carry * int(inclusive[-1]) % mod
+    return dst
+
+
+def product_except_self(nums, mod=None, log_space=False):
+    """
+    Vectorized productExceptSelf for lists, array.array or NumPy input.
+
+    Returns an int64/float64 array (or uint64 residues with mod). With
+    log_space=True returns (sign, logabs) arrays like np.linalg.slogdet, so
+    products far beyond float range stay representable: the product except
+    self is sign * exp(logabs).
+    """
+    import numpy as np
+    nums = np.asarray(nums)
+    if log_space:
+        return _product_except_self_log(nums)
+    if mod is not None:
+        out = np.empty(len(nums), dtype=np.uint64)
+    else:
+        out = np.empty(len(nums), dtype=np.result_type(nums.dtype, np.int64))
+    return product_except_self_chunked(nums, out, mod=mod)
+
+
+def _product_except_self_log(nums):
+    import numpy as np
+    if len(nums) == 0:
+        return np.empty(0, dtype=np.int8), np.empty(0)
+    with np.errstate(divide='ignore'):
+        logs = np.log(np.abs(nums.astype(np.float64)))
+    negative = (nums < 0).astype(np.int64)
+
+    is_zero = nums == 0
+    zeros = int(np.count_nonzero(is_zero))
+    if zeros:
+        logabs = np.full(len(nums), -np.inf)
+        sign = np.zeros(len(nums), dtype=np.int8)
+        if zeros == 1:
+            z = int(np.argmax(is_zero))
+            logabs[z] = logs[:z].sum() + logs[z + 1:].sum()
+            sign[z] = -1 if (negative.sum() - negative[z]) % 2 else 1
+        return sign, logabs
+
+    # Exclusive prefix + suffix sums of the logs (and of the negative counts)
+    logabs = _exclusive(np.cumsum(logs), 0.0) + _exclusive(np.cumsum(logs[::-1]), 0.0)[::-1]
+    negatives = _exclusive(np.cumsum(negative), 0) + _exclusive(np.cumsum(negative[::-1]), 0)[::-1]
+    sign = np.where(negatives % 2, -1, 1).astype(np.int8)
+    return sign, logabs
+
+
+def product_except_self_file(src_path, dst_path, dtype='int64', chunk_size=CHUNK_SIZE, mod=None):
+    """Out-of-core productExceptSelf between raw binary files of dtype values."""
+    import numpy as np
+    src = np.memmap(src_path, dtype=dtype, mode='r')
+    dst = np.memmap(dst_path, dtype=np.uint64 if mod else np.result_type(dtype, np.int64), mode='w+', shape=src.shape)
+    product_except_self_chunked(src, dst, chunk_size, mod)
+    dst.flush()
+    return dst
+
+
+# --- Benchmark ---
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def _python_mod(nums, mod):
+    # Exact reference: productExceptSelf's two passes with Python ints, reduced mod m
+    answers = [1] * len(nums)
+    left = 1
+    for i, x in enumerate(nums):
+        answers[i] = left
+        left = left * x % mod
+    right = 1
+    for i in range(len(nums) - 1, -1, -1):
+        answers[i] = answers[i] * right % mod
+        right = right * nums[i] % mod
+    return answers
+
+
+def benchmark(n=10_000_000, chunk_size=CHUNK_SIZE):
+    import tempfile
+
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    nums = rng.integers(1, 1000, size=n)
+    mod = 1_000_000_007
+
+    # The original's products of 10^5 random values grow to huge ints, so time it on +-1
+    small = rng.choice([-1, 1], size=100_000).tolist()
+    _, original_s = _timed(lambda: productExceptSelf(small))
+    print(f'productExceptSelf, 10^5: {original_s:.3f}s '
+          f'-> ~{original_s * n / len(small):.0f}s projected for {n}')
+
+    _, exact_s = _timed(lambda: product_except_self(nums))
+    print(f'product_except_self, int64, {n}: {exact_s:.3f}s')
+
+    result, mod_s = _timed(lambda: product_except_self(nums, mod=mod))
+    ok = product_except_self(nums[:100_000], mod=mod).tolist() == _python_mod(nums[:100_000].tolist(), mod)
+    print(f'product_except_self, mod 1e9+7, {n}: {mod_s:.3f}s  {"ok" if ok else "MISMATCH"}')
+
+    _, log_s = _timed(lambda: product_except_self(nums.astype(np.float64), log_space=True))
+    print(f'product_except_self, log space, {n}: {log_s:.3f}s')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src_path = os.path.join(tmp, 'nums.bin')
+        dst_path = os.path.join(tmp, 'out.bin')
+        nums.astype(np.int64).tofile(src_path)
+        dst, file_s = _timed(lambda: product_except_self_file(src_path, dst_path, chunk_size=chunk_size, mod=mod))
+        ok = np.array_equal(dst, result)
+        del dst
+        print(f'product_except_self_file, mod, {n} via memmap in {chunk_size}-element chunks: {file_s:.3f}s  '
+              f'{"ok" if ok else "MISMATCH"}')
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Product of array except self')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='time the versions on N elements')
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+    else:
+        print(productExceptSelf([1,2,3,4]))
+
+
+if __name__ == "__main__":
+    main()
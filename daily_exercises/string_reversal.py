@@ -0,0 +1,311 @@
+import mmap
+import time
+import unicodedata
+
+from ._compat import optional_import
+
+def reverse_string(s):
+    ans = ""
+    for i in s:
+        ans = i + ans  # Prepend the character to the current result
+    return ans
+
+
+# --- Linear reversal ---
+
+ZWJ = '‍'
+# Characters that never start a grapheme cluster of their own
+_EXTENDERS = frozenset(
+    ['‌', ZWJ]
+    + [chr(c) for c in range(0xFE00, 0xFE10)]     # variation selectors
+    + [chr(c) for c in range(0x1F3FB, 0x1F400)]   # emoji skin-tone modifiers
+    + [chr(c) for c in range(0xE0020, 0xE0080)]   # emoji tag sequences
+)
+
+
+def _is_regional_indicator(ch):
+    return '\U0001F1E6' <= ch <= '\U0001F1FF'
+
+
+def _extends(ch):
+    return ch in _EXTENDERS or unicodedata.category(ch) in ('Mn', 'Mc', 'Me')
+
+
+def _split_graphemes(s):
+    # Approximates UAX #29 for the common cases: combining marks, ZWJ emoji
+    # sequences, modifiers and flag pairs stay attached to their base
+    clusters = []
+    for ch in s:
+        if clusters:
+            last = clusters[-1]
+            if (
+                _extends(ch)
+                or last[-1] == ZWJ
+                or (_is_regional_indicator(ch) and _is_regional_indicator(last[-1])
+                    and len(last) % 2 == 1 and all(map(_is_regional_indicator, last)))
+            ):
+                clusters[-1] = last + ch
+                continue
+        clusters.append(ch)
+    return clusters
+
+
+def graphemes(s):
+    """Split s into user-perceived characters, with the `regex` module's \\X when it's installed."""
+    regex = optional_import('regex')
+    if regex is not None:
+        return regex.findall(r'\X', s)
+    return _split_graphemes(s)
+
+
+def reverse_text(s, graphemes_aware=False):
+    """
+    Reverse s in O(n). By default this reverses code points with a slice;
+    with graphemes_aware=True, accented letters, emoji sequences and flags
+    are kept intact instead of having their combining parts split off.
+    """
+    if not graphemes_aware:
+        return s[::-1]
+    return ''.join(reversed(graphemes(s)))
+
+
+# --- Palindromes ---
+
+# Characters compared per step; mismatches are found within the first block
+BLOCK_SIZE = 4096
+# Bytes decoded per step when reading files
+FILE_BLOCK_SIZE = 1 << 20
+
+
+def normalize_text(s):
+    """Case-fold s and drop accents and everything that isn't a letter or digit."""
+    # NFKD works char by char, which is_palindrome relies on; the combining
+    # marks it splits off are then dropped by the isalnum filter
+    return ''.join(filter(str.isalnum, unicodedata.normalize('NFKD', s).casefold()))
+
+
+def _identity(s):
+    return s
+
+
+def _blocks_equal(front, back, length, prepare):
+    """
+    Two-pointer comparison, a block at a time from each end.
+
+    front yields (end, text) for consecutive blocks from the start and back
+    yields (start, text) for consecutive blocks from the end, where end and
+    start are positions in the source. prepare maps a block to the text
+    compared (normalization); it must work char by char, so a block's
+    prepared text is the concatenation of its characters' prepared text.
+    """
+    front = iter(front)
+    back = iter(back)
+    front_end, back_start = 0, length
+    # Everything before front_done / from back_done on has been compared
+    front_done, back_done = 0, length
+    head = tail = ''
+    while front_done < back_done:
+        if not head:
+            front_done = front_end
+            if front_done >= back_done:
+                break
+            front_end, text = next(front)
+            head = prepare(text)
+            continue
+        if not tail:
+            back_done = back_start
+            if front_done >= back_done:
+                break
+            back_start, text = next(back)
+            tail = prepare(text)[::-1]
+            continue
+        # Once both sides' compared regions meet, at least half of the
+        # prepared text has been matched against its mirror image
+        m = min(len(head), len(tail))
+        if head[:m] != tail[:m]:
+            return False
+        head, tail = head[m:], tail[m:]
+    return True
+
+
+def is_palindrome(s, normalize=False, block_size=BLOCK_SIZE):
+    """
+    Check whether s reads the same backwards, stopping at the first
+    mismatching block instead of reversing the whole string first.
+    With normalize=True, case, accents, punctuation and spaces are ignored
+    ("A man, a plan, a canal: Panama" is a palindrome).
+    """
+    n = len(s)
+    front = ((min(i + block_size, n), s[i:i + block_size]) for i in range(0, n, block_size))
+    back = ((max(j - block_size, 0), s[max(j - block_size, 0):j]) for j in range(n, 0, -block_size))
+    return _blocks_equal(front, back, n, normalize_text if normalize else _identity)
+
+
+# --- Files, through mmap ---
+
+def _is_continuation(byte):
+    return byte & 0xC0 == 0x80
+
+
+def _utf8_front_blocks(mm, block_size):
+    # Cut points are moved back onto the start of a UTF-8 sequence
+    n = len(mm)
+    start = 0
+    while start < n:
+        end = min(start + block_size, n)
+        while end < n and _is_continuation(mm[end]):
+            end -= 1
+        if end == start:  # block_size shorter than one sequence
+            end += 1
+            while end < n and _is_continuation(mm[end]):
+                end += 1
+        yield end, mm[start:end].decode('utf-8')
+        start = end
+
+
+def _utf8_back_blocks(mm, block_size):
+    end = len(mm)
+    while end > 0:
+        start = max(end - block_size, 0)
+        while start < end and _is_continuation(mm[start]):
+            start += 1
+        if start == end:
+            start -= 1
+            while start > 0 and _is_continuation(mm[start]):
+                start -= 1
+        yield start, mm[start:end].decode('utf-8')
+        end = start
+
+
+def _open_mmap(f):
+    # mmap refuses empty files
+    if f.seek(0, 2) == 0:
+        return b''
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def is_palindrome_file(path, normalize=False, block_size=FILE_BLOCK_SIZE):
+    """
+    is_palindrome for a UTF-8 text file of any size. The file is mapped
+    with mmap and read block by block from both ends, so only about two
+    blocks are decoded at a time and a mismatch stops the scan early.
+    """
+    with open(path, 'rb') as f:
+        mm = _open_mmap(f)
+        try:
+            return _blocks_equal(
+                _utf8_front_blocks(mm, block_size),
+                _utf8_back_blocks(mm, block_size),
+                len(mm),
+                normalize_text if normalize else _identity,
+            )
+        finally:
+            if isinstance(mm, mmap.mmap):
+                mm.close()
+
+
+def _leading_clusters(clusters):
+    # How many clusters at the start of a block may still change once the text
+    # before it is known: the first one, plus any flag run, since flags pair up
+    # counting from the start of the run
+    keep = min(1, len(clusters))
+    while (
+        keep < len(clusters)
+        and all(map(_is_regional_indicator, clusters[keep - 1]))
+        and _is_regional_indicator(clusters[keep][0])
+    ):
+        keep += 1
+    return keep
+
+
+def reverse_file(src, dst, graphemes_aware=False, block_size=FILE_BLOCK_SIZE):
+    """
+    Write the reversed UTF-8 text of src to dst, reading src through mmap
+    from its end one block at a time. Returns the number of bytes written.
+
+    With graphemes_aware=True, the first cluster of every block (or its
+    leading run of flags) is carried over to the block before it, so
+    clusters cut by a block boundary are reversed whole.
+    """
+    written = 0
+    with open(src, 'rb') as f, open(dst, 'wb') as out:
+        mm = _open_mmap(f)
+        try:
+            carry = ''
+            for _, text in _utf8_back_blocks(mm, block_size):
+                if graphemes_aware:
+                    clusters = graphemes(text + carry)
+                    keep = _leading_clusters(clusters)
+                    carry = ''.join(clusters[:keep])
+                    chunk = ''.join(reversed(clusters[keep:]))
+                else:
+                    chunk = text[::-1]
+                written += out.write(chunk.encode('utf-8'))
+            written += out.write(''.join(reversed(graphemes(carry))).encode('utf-8'))
+        finally:
+            if isinstance(mm, mmap.mmap):
+                mm.close()
+    return written
+
+
+# --- Benchmark ---
+
+def _time_best(fn, arg, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(sizes=(1_000, 10_000, 100_000, 400_000)):
+    """Time the prepend loop against slicing, and the reversal-based palindrome check against is_palindrome."""
+    print(f'{"n":>9} {"prepend":>12} {"slice":>12} {"reverse ==":>12} {"is_palindrome":>14} {"mismatch":>10}')
+    for n in sizes:
+        half = ('abcdefghij' * (n // 20 + 1))[:n // 2]
+        text = half + half[::-1]
+        broken = 'x' + text[1:]
+        prepend_s = _time_best(reverse_string, text, repeat=1 if n > 100_000 else 3)
+        slice_s = _time_best(reverse_text, text)
+        check_s = _time_best(lambda s: s == reverse_string(s), text, repeat=1 if n > 100_000 else 3)
+        palindrome_s = _time_best(is_palindrome, text)
+        mismatch_s = _time_best(is_palindrome, broken)
+        print(
+            f'{n:>9} {prepend_s * 1e3:10.2f}ms {slice_s * 1e3:10.3f}ms '
+            f'{check_s * 1e3:10.2f}ms {palindrome_s * 1e3:12.3f}ms {mismatch_s * 1e3:8.3f}ms'
+        )
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Reverse strings and check palindromes')
+    parser.add_argument('--benchmark', action='store_true', help='compare the prepend loop with linear reversal')
+    parser.add_argument('--check', metavar='FILE', help='report whether a UTF-8 text file is a palindrome')
+    parser.add_argument('--reverse', nargs=2, metavar=('SRC', 'DST'), help='write the reversed text of SRC to DST')
+    parser.add_argument('--normalize', action='store_true', help='ignore case, spaces and punctuation with --check')
+    parser.add_argument('--graphemes', action='store_true', help='keep grapheme clusters intact with --reverse')
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark()
+        return
+    if args.check:
+        print(is_palindrome_file(args.check, normalize=args.normalize))
+        return
+    if args.reverse:
+        reverse_file(*args.reverse, graphemes_aware=args.graphemes)
+        return
+
+    output = reverse_string('Hello')
+    print(f'output:{output}')
+
+    # check if Palindrome
+    val_to_check="level"
+    assert is_palindrome(val_to_check)
+    print("Palindrome check passed!")
+
+
+if __name__ == "__main__":
+    main()
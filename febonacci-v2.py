@@ -1,8 +1,5 @@
-def feb(n):
-    # lets make this 
-    pass
+# Entry point for daily_exercises/fibonacci_numbers.py
+from daily_exercises.fibonacci_numbers import main
 
-
-
-for i in range(5):
-    print(i)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,8 @@
-def fibonacci(n):
-    print(f'function got called:{n}')
-    # Base cases: first two numbers in sequence
-    if n == 0:        
-        return 0
-    if n == 1:
-        return 1
-    
-    # Recursive case: sum of previous two numbers
-    return fibonacci(n - 1) + fibonacci(n - 2)
+# Fibonacci numbers, now in daily_exercises/fibonacci_numbers.py (fast doubling)
+from daily_exercises.fibonacci_numbers import fibonacci
 
-# Test the function
-print("Fibonacci numbers:")
-for i in range(8):
-    print(f"F({i}) = {fibonacci(i)}")        
\ No newline at end of file
+if __name__ == "__main__":
+    # Test the function
+    print("Fibonacci numbers:")
+    for i in range(8):
+        print(f"F({i}) = {fibonacci(i)}")
@@ -1,6 +1,7 @@
-nums = [1,2,3,4]
-for i in range(len(nums)):
-    print(f'i:{i} and nums[i]:{nums[i]}') 
+if __name__ == "__main__":
+    nums = [1,2,3,4]
+    for i in range(len(nums)):
+        print(f'i:{i} and nums[i]:{nums[i]}')
 
-for i in range(len(nums) - 1, -1 , -1):
-    print(f'i:{i} and nums[i]:{nums[i]}')
+    for i in range(len(nums) - 1, -1 , -1):
+        print(f'i:{i} and nums[i]:{nums[i]}')
@@ -0,0 +1,74 @@
+"""
+Batch quote generation for the Daily Quote Lambda function
+Packs many personalized quote requests into a single prompt and parses
+the structured answer back into a per-name map
+"""
+
+import re
+import json
+
+# Upper bound on names accepted in one batch request
+MAX_BATCH_NAMES = 25
+
+# Token budget per requested quote (two sentences plus JSON overhead)
+TOKENS_PER_QUOTE = 90
+
+_JSON_OBJECT = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def dedupe_names(names, sanitize):
+    """
+    Sanitize names and drop empties and duplicates, keeping first-seen order
+    """
+    unique = []
+    seen = set()
+    for raw in names:
+        name = sanitize(raw)
+        if name and name not in seen:
+            seen.add(name)
+            unique.append(name)
+    return unique
+
+
+def build_batch_request(names, adapter):
+    """
+    Build a request body for adapter's model asking for one quote per name as JSON
+    """
+    name_list = '\n'.join(f"- {name}" for name in names)
+    prompt = f"""Generate a personalized energizing daily quote for each person listed below.
+    Each quote should be exactly two sentences long, motivational, and inspiring.
+    Address the person directly by name in their quote.
+    Focus on positivity, growth, and achievement.
+
+    People:
+{name_list}
+
+    Respond with only a JSON object that maps each name exactly as written above to its quote."""
+
+    return adapter.build_request(prompt, max_tokens=TOKENS_PER_QUOTE * len(names), temperature=0.7, top_p=0.9)
+
+
+def parse_batch_response(text, names):
+    """
+    Parse the model's batch answer text into {name: quote}
+    Names the model dropped or mangled are simply absent from the result
+    """
+    match = _JSON_OBJECT.search(text)
+    if not match:
+        return {}
+
+    try:
+        data = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+
+    # Match keys case-insensitively since the model may re-case names
+    wanted = {name.lower(): name for name in names}
+    quotes = {}
+    for key, quote in data.items():
+        name = wanted.get(str(key).strip().lower())
+        if name and isinstance(quote, str) and quote.strip():
+            quotes[name] = quote.strip()
+    return quotes
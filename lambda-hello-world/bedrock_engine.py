@@ -0,0 +1,201 @@
+"""
+Async Bedrock invocation engine for the Daily Quote Lambda function
+Runs many invoke_model calls concurrently while staying inside the account's
+Bedrock request (RPM) and token (TPM) quotas
+"""
+
+import json
+import time
+import random
+import logging
+import threading
+from circuit_breaker import CircuitOpenError
+
+logger = logging.getLogger()
+
+# asyncio is imported inside the async methods: it is only needed by the batch
+# and pool paths, and importing it adds tens of milliseconds to cold starts.
+# botocore.exceptions is likewise imported only once a call has failed
+
+# Error codes that mean "slow down and try again"
+RETRYABLE_ERROR_CODES = {
+    'ThrottlingException',
+    'TooManyRequestsException',
+    'ServiceUnavailableException',
+    'ModelNotReadyException'
+}
+# Stream error events spell the same codes in camel case (throttlingException)
+_RETRYABLE_CODES = {code.lower() for code in RETRYABLE_ERROR_CODES}
+
+
+def is_throttling_error(error):
+    """
+    Return True for Bedrock errors that are worth retrying after a backoff
+    """
+    from botocore.exceptions import ClientError
+
+    if not isinstance(error, ClientError):
+        return False
+    return error.response.get('Error', {}).get('Code', '').lower() in _RETRYABLE_CODES
+
+
+def backoff_delay(attempt, base_delay=0.25, max_delay=8.0, rng=random.random):
+    """
+    Exponential backoff with full jitter: uniform in [0, min(max_delay, base * 2^attempt)]
+    """
+    return rng() * min(max_delay, base_delay * (2 ** attempt))
+
+
+def estimate_tokens(request_body):
+    """
+    Rough token cost of a request: prompt characters / 4 plus the output budget
+    Understands both the Nova (messages) and Titan (inputText) body formats
+    """
+    if 'inputText' in request_body:
+        prompt_chars = len(request_body['inputText'])
+        output_tokens = request_body.get('textGenerationConfig', {}).get('maxTokenCount', 0)
+        return prompt_chars // 4 + output_tokens
+    prompt_chars = sum(
+        len(part.get('text', ''))
+        for message in request_body.get('messages', [])
+        for part in message.get('content', [])
+    )
+    output_tokens = request_body.get('inferenceConfig', {}).get('max_new_tokens', 0)
+    return prompt_chars // 4 + output_tokens
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at rate_per_minute
+    acquire() waits (asynchronously) until enough tokens are available
+    """
+
+    def __init__(self, rate_per_minute, capacity=None, clock=time.monotonic):
+        self.rate = float(rate_per_minute) / 60.0
+        self.capacity = float(capacity if capacity is not None else rate_per_minute)
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, amount=1):
+        """
+        Take amount tokens if available; otherwise return the seconds to wait
+        Returns 0 on success
+        """
+        # A request larger than the bucket can never fit, let it drain the bucket instead
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            self._refill(self.clock())
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return 0
+            return (amount - self.tokens) / self.rate if self.rate > 0 else float('inf')
+
+    async def acquire(self, amount=1):
+        import asyncio
+        while True:
+            wait = self.try_acquire(amount)
+            if wait == 0:
+                return
+            await asyncio.sleep(wait)
+
+
+class AsyncBedrockEngine:
+    """
+    Concurrent invoke_model runner with bounded concurrency, client-side rate
+    limiting and exponential backoff with jitter on throttling
+
+    client_provider is a callable returning the Bedrock runtime client so the
+    client can be swapped (e.g. for fake_bedrock.FakeBedrockClient) at any time.
+    With a breaker, calls fail fast with CircuitOpenError while it is open.
+    observer(model_id, latency, error) is told the outcome of every call.
+    """
+
+    def __init__(self, client_provider, max_concurrency=4, requests_per_minute=50,
+                 tokens_per_minute=20000, max_retries=3, base_delay=0.25, max_delay=8.0,
+                 breaker=None, observer=None):
+        self.client_provider = client_provider
+        self.breaker = breaker
+        self.observer = observer
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_retries = max(0, int(max_retries))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        # A thread semaphore bounds in-flight calls across event loops and threads
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self.throttle_count = 0
+
+    def _invoke_blocking(self, model_id, body):
+        with self._slots:
+            response = self.client_provider().invoke_model(
+                modelId=model_id,
+                body=body,
+                contentType='application/json'
+            )
+            return json.loads(response['body'].read())
+
+    async def invoke(self, model_id, request_body):
+        """
+        Invoke model_id with request_body and return the decoded response body
+        Retries throttling errors with backoff, raises everything else
+        """
+        import asyncio
+        body = json.dumps(request_body)
+        tokens = estimate_tokens(request_body)
+
+        for attempt in range(self.max_retries + 1):
+            if self.request_bucket:
+                await self.request_bucket.acquire(1)
+            if self.token_bucket:
+                await self.token_bucket.acquire(tokens)
+            if self.breaker and not self.breaker.allow_request():
+                raise CircuitOpenError(f"Circuit open for {model_id}")
+            start = time.perf_counter()
+            try:
+                result = await asyncio.to_thread(self._invoke_blocking, model_id, body)
+            except Exception as e:
+                if self.observer:
+                    self.observer(model_id, time.perf_counter() - start, e)
+                throttled = is_throttling_error(e)
+                if self.breaker:
+                    if throttled:
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.release()
+                if not throttled or attempt == self.max_retries:
+                    raise
+                self.throttle_count += 1
+                delay = backoff_delay(attempt, self.base_delay, self.max_delay)
+                logger.warning(f"Bedrock throttling, retrying in {delay:.2f} seconds (attempt {attempt + 1}/{self.max_retries})")
+                await asyncio.sleep(delay)
+                continue
+            if self.observer:
+                self.observer(model_id, time.perf_counter() - start)
+            if self.breaker:
+                self.breaker.record_success()
+            return result
+
+    async def invoke_all(self, model_id, request_bodies):
+        """
+        Invoke every request body concurrently
+        Returns results in order, with exceptions in place of failed calls
+        """
+        import asyncio
+        return await asyncio.gather(
+            *(self.invoke(model_id, body) for body in request_bodies),
+            return_exceptions=True
+        )
+
+    def run_all(self, model_id, request_bodies):
+        """
+        Synchronous wrapper around invoke_all for Lambda handler code
+        """
+        import asyncio
+        return asyncio.run(self.invoke_all(model_id, list(request_bodies)))
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Load and latency benchmark for the Daily Quote Lambda function
+
+Drives lambda_handler in-process with a configurable mix of GET/POST/OPTIONS
+and personalized/anonymous events against fake_bedrock.FakeBedrockClient, which
+injects model latency and throttling. Reports latency percentiles, requests/sec
+and cache/breaker hit rates as JSON.
+
+Usage:
+    python benchmarks/load_benchmark.py --requests 500 --latency 0.05,0.2 --throttle-rate 0.05
+    python benchmarks/load_benchmark.py --max-p95-ms 250 --output load.json
+
+With --max-p95-ms, --max-model-p95-ms or --min-rps the script exits with
+status 1 when the run is slower than the threshold, so it can gate a deploy.
+--max-model-p95-ms gates the modelCall phase alone, so a run dominated by cache
+hits cannot hide a regression on the model path; give it --names large enough
+that most personalized requests miss the cache.
+"""
+
+import io
+import os
+import sys
+import json
+import math
+import time
+import random
+import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+LAMBDA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, LAMBDA_DIR)
+
+import lambda_function  # noqa: E402
+from fake_bedrock import FakeBedrockClient  # noqa: E402
+from quote_cache import QuoteCache  # noqa: E402
+from request_metrics import PHASES  # noqa: E402
+
+NAMES = ['Alice', 'Bob', 'Carol', 'Dave', 'Eve', 'Frank', 'Grace', 'Heidi', 'Ivan', 'Judy']
+
+
+def parse_mix(text):
+    """
+    Parse 'GET=70,POST=20,OPTIONS=10' into {method: weight}
+    """
+    mix = {}
+    for part in text.split(','):
+        method, _, weight = part.partition('=')
+        method = method.strip().upper()
+        if method not in ('GET', 'POST', 'OPTIONS'):
+            raise ValueError(f"Unsupported method in mix: {method}")
+        mix[method] = float(weight or 1)
+    return mix
+
+
+def parse_latency(text):
+    """
+    Parse '0.05' or '0.05,0.2' into a FakeBedrockClient latency
+    """
+    parts = [float(part) for part in text.split(',')]
+    return tuple(parts) if len(parts) == 2 else parts[0]
+
+
+def build_events(count, mix, personalized_ratio, name_pool, rng):
+    """
+    Build a reproducible list of API Gateway events
+    """
+    methods = list(mix)
+    weights = [mix[method] for method in methods]
+    names = NAMES[:name_pool] if name_pool <= len(NAMES) else [f"User{i}" for i in range(name_pool)]
+
+    events = []
+    for _ in range(count):
+        method = rng.choices(methods, weights)[0]
+        name = rng.choice(names) if rng.random() < personalized_ratio else None
+        if method == 'OPTIONS':
+            events.append({'httpMethod': 'OPTIONS', 'queryStringParameters': None, 'body': None})
+        elif method == 'POST':
+            events.append({'httpMethod': 'POST', 'queryStringParameters': None,
+                           'body': json.dumps({'name': name} if name else {})})
+        else:
+            events.append({'httpMethod': 'GET', 'queryStringParameters': {'name': name} if name else None,
+                           'body': None})
+    return events
+
+
+def percentile(sorted_values, pct):
+    """
+    Nearest-rank percentile of an already sorted list
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def invoke(event):
+    start = time.perf_counter()
+    response = lambda_function.lambda_handler(event, None)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    body = json.loads(response['body']) if response.get('body') else {}
+    return event['httpMethod'], elapsed_ms, response['statusCode'], body
+
+
+def run_load(requests=200, concurrency=1, mix=None, personalized_ratio=0.5, name_pool=5,
+             latency=0.0, throttle_rate=0.0, cache_size=None, seed=42):
+    """
+    Run one load test and return the report dict
+    """
+    rng = random.Random(seed)
+    events = build_events(requests, mix or {'GET': 70, 'POST': 20, 'OPTIONS': 10},
+                          personalized_ratio, name_pool, rng)
+
+    fake = FakeBedrockClient(latency=latency, throttle_rate=throttle_rate, seed=seed)
+    previous = lambda_function.set_bedrock_client(fake)
+    previous_cache = lambda_function.quote_cache
+    if cache_size is not None:
+        lambda_function.quote_cache = QuoteCache(max_size=cache_size)
+    lambda_function.quote_cache.clear()
+    lambda_function.bedrock_breaker.reset()
+    lambda_function.model_router.reset()
+    # Collect the handler's EMF records instead of printing them
+    emf_records = io.StringIO()
+    previous_stream = lambda_function.request_metrics.stream
+    lambda_function.request_metrics.stream = emf_records
+    try:
+        start = time.perf_counter()
+        if concurrency > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = list(executor.map(invoke, events))
+        else:
+            results = [invoke(event) for event in events]
+        duration = time.perf_counter() - start
+        circuit = lambda_function.bedrock_breaker.snapshot()
+        cache = lambda_function.quote_cache.stats()
+    finally:
+        lambda_function.set_bedrock_client(previous)
+        lambda_function.quote_cache = previous_cache
+        lambda_function.request_metrics.stream = previous_stream
+
+    latencies = sorted(elapsed for _, elapsed, _, _ in results)
+    by_method = {}
+    for method, elapsed, _, _ in results:
+        by_method.setdefault(method, []).append(elapsed)
+
+    status_codes = {}
+    sources = {}
+    quote_responses = 0
+    cache_hits = 0
+    for _, _, status, body in results:
+        status_codes[str(status)] = status_codes.get(str(status), 0) + 1
+        if 'quote' in body:
+            quote_responses += 1
+            source = body.get('source', 'unknown')
+            sources[source] = sources.get(source, 0) + 1
+            cache_hits += source == 'cache'
+
+    records = [json.loads(line) for line in emf_records.getvalue().splitlines()]
+    phases = {}
+    for phase in PHASES:
+        values = sorted(record[f"{phase}Ms"] for record in records if record.get(f"{phase}Ms"))
+        if values:
+            phases[phase] = summarize(values)
+
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'durationS': round(duration, 3),
+        'requestsPerSecond': round(requests / duration, 1) if duration else None,
+        'latencyMs': summarize(latencies),
+        'byMethod': {method: summarize(sorted(values)) for method, values in by_method.items()},
+        'phasesMs': phases,
+        'statusCodes': status_codes,
+        'sources': sources,
+        'cache': dict(cache, hitRate=round(cache_hits / quote_responses, 3) if quote_responses else 0.0),
+        'breaker': dict(
+            circuit,
+            shortCircuitRate=round(circuit['shortCircuits'] / quote_responses, 3) if quote_responses else 0.0
+        ),
+        'bedrock': {
+            'calls': fake.call_count,
+            'throttled': fake.throttled,
+            'latency': latency,
+            'throttleRate': throttle_rate
+        }
+    }
+
+
+def summarize(sorted_values):
+    return {
+        'count': len(sorted_values),
+        'p50': round(percentile(sorted_values, 50), 2),
+        'p95': round(percentile(sorted_values, 95), 2),
+        'p99': round(percentile(sorted_values, 99), 2),
+        'max': round(sorted_values[-1], 2),
+        'mean': round(sum(sorted_values) / len(sorted_values), 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=200, help='number of handler invocations')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='worker threads (a real container serves one request at a time)')
+    parser.add_argument('--mix', default='GET=70,POST=20,OPTIONS=10', help='method weights')
+    parser.add_argument('--personalized', type=float, default=0.5, help='share of requests with a name')
+    parser.add_argument('--names', type=int, default=5, help='number of distinct names')
+    parser.add_argument('--latency', default='0.0', help='fake model latency in seconds, or min,max')
+    parser.add_argument('--cache-size', type=int, help='quote cache size for the run (default: QUOTE_CACHE_SIZE)')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='probability of a throttled call')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='write the JSON report to this file')
+    parser.add_argument('--max-p95-ms', type=float, help='fail if p95 latency exceeds this')
+    parser.add_argument('--max-model-p95-ms', type=float,
+                        help='fail if the p95 of the modelCall phase exceeds this (or no model call was made)')
+    parser.add_argument('--min-rps', type=float, help='fail if throughput falls below this')
+    parser.add_argument('--verbose', action='store_true', help='keep the handler log output')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+
+    report = run_load(
+        requests=args.requests,
+        concurrency=args.concurrency,
+        mix=parse_mix(args.mix),
+        personalized_ratio=args.personalized,
+        name_pool=args.names,
+        latency=parse_latency(args.latency),
+        throttle_rate=args.throttle_rate,
+        cache_size=args.cache_size,
+        seed=args.seed
+    )
+
+    failures = []
+    if args.max_p95_ms is not None and report['latencyMs']['p95'] > args.max_p95_ms:
+        failures.append(f"p95 {report['latencyMs']['p95']}ms > {args.max_p95_ms}ms")
+    if args.max_model_p95_ms is not None:
+        model_call = report['phasesMs'].get('modelCall')
+        if model_call is None:
+            failures.append('no modelCall phase recorded; every request was served without the model')
+        elif model_call['p95'] > args.max_model_p95_ms:
+            failures.append(f"modelCall p95 {model_call['p95']}ms > {args.max_model_p95_ms}ms")
+    if args.min_rps is not None and report['requestsPerSecond'] < args.min_rps:
+        failures.append(f"{report['requestsPerSecond']} req/s < {args.min_rps} req/s")
+    report['regressions'] = failures
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    print(output)
+
+    if failures:
+        print('Benchmark regression: ' + '; '.join(failures), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the Daily Quote Lambda function
+
+Every run starts a fresh interpreter (like a new Lambda container) and records:
+- import time of lambda_function from `python -X importtime`
+- Bedrock client construction time (real boto3 client, no network call)
+- first and second lambda_handler invocation time against a fake Bedrock client
+
+Usage:
+    python benchmarks/startup_benchmark.py --runs 10 --output startup.json
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+LAMBDA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Executed in a fresh interpreter for every run
+CHILD_SCRIPT = """
+import json, time
+start = time.perf_counter()
+import lambda_function
+import_ms = (time.perf_counter() - start) * 1000
+
+start = time.perf_counter()
+lambda_function.create_bedrock_client()
+client_ms = (time.perf_counter() - start) * 1000
+
+from fake_bedrock import FakeBedrockClient
+lambda_function.set_bedrock_client(FakeBedrockClient())
+event = {'httpMethod': 'GET', 'queryStringParameters': {'name': 'Alice'}, 'body': None}
+
+start = time.perf_counter()
+lambda_function.lambda_handler(event, None)
+first_invoke_ms = (time.perf_counter() - start) * 1000
+
+start = time.perf_counter()
+lambda_function.lambda_handler(event, None)
+warm_invoke_ms = (time.perf_counter() - start) * 1000
+
+print(json.dumps({
+    'import_ms': import_ms,
+    'client_init_ms': client_ms,
+    'first_invoke_ms': first_invoke_ms,
+    'warm_invoke_ms': warm_invoke_ms
+}))
+"""
+
+
+def parse_importtime(stderr, top=10):
+    """
+    Parse `-X importtime` output into (lambda_function cumulative us, slowest modules)
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_part, cumulative_us, module = line.split('|', 2)
+        self_us = int(self_part.split(':')[1])
+        rows.append((module.rstrip(), self_us, int(cumulative_us)))
+
+    total = next((cumulative for module, _, cumulative in rows if module.strip() == 'lambda_function'), None)
+    slowest = sorted(rows, key=lambda row: row[2], reverse=True)[:top]
+    return total, [
+        {'module': module.strip(), 'selfUs': self_us, 'cumulativeUs': cumulative}
+        for module, self_us, cumulative in slowest
+    ]
+
+
+def run_once():
+    """
+    Start one fresh interpreter and collect its timings
+    """
+    env = dict(os.environ, AWS_DEFAULT_REGION=os.environ.get('AWS_DEFAULT_REGION', 'us-east-1'))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', CHILD_SCRIPT],
+        cwd=LAMBDA_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    importtime_us, slowest = parse_importtime(result.stderr)
+    timings['importtime_ms'] = importtime_us / 1000 if importtime_us is not None else None
+    return timings, slowest
+
+
+def summarize(values):
+    values = [v for v in values if v is not None]
+    return {
+        'min': round(min(values), 2),
+        'median': round(statistics.median(values), 2),
+        'max': round(max(values), 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='number of fresh interpreters to start')
+    parser.add_argument('--output', help='write the JSON report to this file')
+    args = parser.parse_args()
+
+    runs = []
+    slowest = None
+    for _ in range(args.runs):
+        timings, modules = run_once()
+        runs.append(timings)
+        slowest = slowest or modules
+
+    report = {
+        'runs': args.runs,
+        'python': sys.version.split()[0],
+        'coldInitMs': summarize([r['import_ms'] for r in runs]),
+        'importtimeMs': summarize([r['importtime_ms'] for r in runs]),
+        'clientInitMs': summarize([r['client_init_ms'] for r in runs]),
+        'firstInvokeMs': summarize([r['first_invoke_ms'] for r in runs]),
+        'warmInvokeMs': summarize([r['warm_invoke_ms'] for r in runs]),
+        'slowestImports': slowest
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
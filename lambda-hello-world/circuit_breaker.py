@@ -0,0 +1,114 @@
+"""
+Circuit breaker for Bedrock calls in the Daily Quote Lambda function
+After repeated throttling the breaker opens and requests go straight to the
+fallback quote until a cool-down has passed and a single probe succeeds
+"""
+
+import time
+import threading
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling Bedrock while the circuit is open
+    """
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker
+
+    closed: requests flow, consecutive throttles are counted
+    open: requests are rejected until cooldown seconds have passed
+    half_open: exactly one probe request is let through; its outcome closes
+    or re-opens the circuit
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=3, cooldown=30.0, clock=time.monotonic):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = float(cooldown)
+        self.clock = clock
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.short_circuits = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        """
+        Return True if a Bedrock call may be made now
+        """
+        with self._lock:
+            if self.state == self.OPEN and self.clock() - self.opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+
+            self.short_circuits += 1
+            return False
+
+    def record_success(self):
+        """
+        A call succeeded: close the circuit and reset the failure count
+        """
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """
+        A call was throttled: count it and open the circuit at the threshold
+        A failed half-open probe re-opens the circuit immediately
+        """
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or (
+                    self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold):
+                self.state = self.OPEN
+                self.opened_at = self.clock()
+                self.trips += 1
+            self._probe_in_flight = False
+
+    def release(self):
+        """
+        A call failed for a reason unrelated to throttling
+        Frees the half-open probe slot without changing the state
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    def reset(self):
+        """
+        Return to the initial closed state and clear the counters
+        """
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.trips = 0
+            self.short_circuits = 0
+            self.opened_at = None
+            self._probe_in_flight = False
+
+    def snapshot(self):
+        """
+        Return breaker state and counters for the response body
+        """
+        with self._lock:
+            return {
+                'state': self.state,
+                'consecutiveFailures': self.consecutive_failures,
+                'trips': self.trips,
+                'shortCircuits': self.short_circuits
+            }
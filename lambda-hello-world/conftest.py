@@ -0,0 +1,16 @@
+import pytest
+
+
+class FakeClock:
+    """Callable stand-in for time.time / time.monotonic; tests set .now to move time"""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
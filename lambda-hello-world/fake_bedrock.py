@@ -0,0 +1,118 @@
+"""
+Local stand-in for the Bedrock runtime client
+Returns Nova- or Titan-format responses (by model ID) with configurable latency
+and throttling so the quote pipeline can be exercised offline
+"""
+
+import io
+import re
+import json
+import time
+import random
+import threading
+from botocore.exceptions import ClientError
+
+
+def throttling_error(operation='InvokeModel'):
+    """
+    Build the ClientError Bedrock raises when a quota is exceeded
+    """
+    return ClientError(
+        {'Error': {'Code': 'ThrottlingException', 'Message': 'Too many requests, please wait before trying again.'}},
+        operation
+    )
+
+
+def is_titan_model(model_id):
+    return 'amazon.titan-text' in model_id
+
+
+class FakeBedrockClient:
+    """
+    Drop-in replacement for boto3.client('bedrock-runtime')
+
+    latency: seconds slept per call (or a (min, max) tuple)
+    throttle_rate: probability that a call raises ThrottlingException
+    responder: callable(model_id, request_body) -> text, defaults to a canned quote
+    chunk_delay: seconds slept between streamed chunks
+    """
+
+    def __init__(self, latency=0.0, throttle_rate=0.0, responder=None, seed=None, chunk_delay=0.0):
+        self.latency = latency
+        self.chunk_delay = chunk_delay
+        self.throttle_rate = throttle_rate
+        self.responder = responder or self.default_responder
+        self.calls = []
+        self.throttled = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def default_responder(model_id, request_body):
+        return "Today is yours to shape. Take one bold step and watch momentum build."
+
+    def _wait(self):
+        latency = self.latency
+        if isinstance(latency, tuple):
+            latency = self._random.uniform(*latency)
+        if latency:
+            time.sleep(latency)
+
+    def invoke_model(self, modelId, body, contentType='application/json', **kwargs):
+        request_body = json.loads(body)
+        with self._lock:
+            self.calls.append((modelId, request_body))
+            throttled = self._random.random() < self.throttle_rate
+            if throttled:
+                self.throttled += 1
+        self._wait()
+        if throttled:
+            raise throttling_error()
+
+        text = self.responder(modelId, request_body)
+        if is_titan_model(modelId):
+            payload = {'inputTextTokenCount': 0, 'results': [{'outputText': text, 'completionReason': 'FINISH'}]}
+        else:
+            payload = {'output': {'message': {'content': [{'text': text}]}}}
+        return {'body': io.BytesIO(json.dumps(payload).encode()), 'contentType': 'application/json'}
+
+    def invoke_model_with_response_stream(self, modelId, body, contentType='application/json', **kwargs):
+        """
+        Return a Nova- or Titan-style event stream that yields the response word by word
+        """
+        request_body = json.loads(body)
+        with self._lock:
+            self.calls.append((modelId, request_body))
+            throttled = self._random.random() < self.throttle_rate
+            if throttled:
+                self.throttled += 1
+        self._wait()
+        if throttled:
+            raise throttling_error('InvokeModelWithResponseStream')
+
+        text = self.responder(modelId, request_body)
+        if is_titan_model(modelId):
+            return {'body': self._titan_stream_events(text), 'contentType': 'application/json'}
+        return {'body': self._stream_events(text), 'contentType': 'application/json'}
+
+    def _titan_stream_events(self, text):
+        for index, piece in enumerate(re.findall(r'\S+\s*', text)):
+            if index and self.chunk_delay:
+                time.sleep(self.chunk_delay)
+            yield self._chunk({'outputText': piece, 'index': 0})
+
+    def _stream_events(self, text):
+        yield self._chunk({'messageStart': {'role': 'assistant'}})
+        for index, piece in enumerate(re.findall(r'\S+\s*', text)):
+            if index and self.chunk_delay:
+                time.sleep(self.chunk_delay)
+            yield self._chunk({'contentBlockDelta': {'delta': {'text': piece}, 'contentBlockIndex': 0}})
+        yield self._chunk({'messageStop': {'stopReason': 'end_turn'}})
+
+    @staticmethod
+    def _chunk(payload):
+        return {'chunk': {'bytes': json.dumps(payload).encode()}}
+
+    @property
+    def call_count(self):
+        return len(self.calls)
@@ -0,0 +1,169 @@
+"""
+Offline fallback quotes for the Daily Quote Lambda function
+A corpus of pre-written quotes packed into fallback_quotes.bin and memory-mapped
+on first use. The slot for a request is picked from a hash of the name and UTC
+date, so a user keeps the same fallback all day while different users see
+different quotes. Personalized quotes are stored pre-split around the name so
+templating is two slices and a concatenation.
+
+File layout (little-endian):
+    header   b'DQFB', uint16 version, uint32 count
+    index    count x (uint32 offset, uint16 generic, uint16 prefix, uint16 suffix)
+    data     per entry: generic quote, template prefix, template suffix (UTF-8)
+
+Rebuild the binary after editing fallback_quotes.txt:
+    python fallback_corpus.py
+"""
+
+import os
+import mmap
+import struct
+import logging
+import threading
+
+from quote_cache import utc_today
+
+logger = logging.getLogger()
+
+CORPUS_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_PATH = os.path.join(CORPUS_DIR, 'fallback_quotes.bin')
+SOURCE_PATH = os.path.join(CORPUS_DIR, 'fallback_quotes.txt')
+
+MAGIC = b'DQFB'
+VERSION = 1
+_HEADER = struct.Struct('<4sHI')
+_RECORD = struct.Struct('<IHHH')
+
+# Used only if the corpus file is missing or unreadable
+DEFAULT_GENERIC = "Every new day is a chance to transform your dreams into reality. Embrace the possibilities and make today extraordinary!"
+DEFAULT_TEMPLATE = ("Hey ", ", every new day is a chance to transform your dreams into reality! Embrace the possibilities and make today extraordinary.")
+
+
+def read_source(path=SOURCE_PATH):
+    """
+    Parse the text source into (generic, prefix, suffix) entries
+    """
+    entries = []
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.rstrip('\n')
+            if not line.strip() or line.startswith('#'):
+                continue
+            generic, template = line.split('\t')
+            if template.count('{name}') != 1:
+                raise ValueError(f"Line {line_number}: template needs exactly one {{name}}")
+            prefix, suffix = template.split('{name}')
+            entries.append((generic, prefix, suffix))
+    return entries
+
+
+def pack_corpus(entries):
+    """
+    Pack (generic, prefix, suffix) entries into the binary corpus format
+    """
+    data = bytearray()
+    index = bytearray()
+    data_start = _HEADER.size + _RECORD.size * len(entries)
+    for generic, prefix, suffix in entries:
+        parts = [part.encode('utf-8') for part in (generic, prefix, suffix)]
+        index += _RECORD.pack(data_start + len(data), *(len(part) for part in parts))
+        for part in parts:
+            data += part
+    return _HEADER.pack(MAGIC, VERSION, len(entries)) + bytes(index) + bytes(data)
+
+
+class FallbackCorpus:
+    """
+    Read-only view over a packed corpus (memory-mapped file or bytes)
+    """
+
+    def __init__(self, buffer):
+        magic, version, count = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a fallback quote corpus")
+        if count == 0:
+            raise ValueError("Fallback quote corpus is empty")
+        self._buffer = buffer
+        self.count = count
+
+    @classmethod
+    def open(cls, path=None):
+        with open(path or CORPUS_PATH, 'rb') as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def entry(self, slot):
+        """
+        Return (generic, prefix, suffix) for a slot
+        """
+        offset, generic_len, prefix_len, suffix_len = _RECORD.unpack_from(
+            self._buffer, _HEADER.size + _RECORD.size * slot
+        )
+        prefix_start = offset + generic_len
+        suffix_start = prefix_start + prefix_len
+        buffer = self._buffer
+        return (
+            buffer[offset:prefix_start].decode('utf-8'),
+            buffer[prefix_start:suffix_start].decode('utf-8'),
+            buffer[suffix_start:suffix_start + suffix_len].decode('utf-8')
+        )
+
+    def slot_for(self, name=None, day=None):
+        """
+        Deterministic slot for a name (or anonymous) on a UTC day
+        """
+        import hashlib
+
+        key = f"{day or utc_today()}:{(name or '').strip().lower()}".encode('utf-8')
+        digest = hashlib.blake2b(key, digest_size=8).digest()
+        return int.from_bytes(digest, 'little') % self.count
+
+    def quote(self, name=None, day=None):
+        """
+        Return the fallback quote for a name on a UTC day
+        """
+        generic, prefix, suffix = self.entry(self.slot_for(name, day))
+        name = name.strip() if name else ''
+        return prefix + name + suffix if name else generic
+
+
+_corpus = None
+_corpus_lock = threading.Lock()
+
+
+def get_corpus():
+    """
+    Return the corpus, loading it on first use (None if it cannot be loaded)
+    """
+    global _corpus
+    if _corpus is None:
+        with _corpus_lock:
+            if _corpus is None:
+                try:
+                    _corpus = FallbackCorpus.open()
+                except (OSError, ValueError, struct.error) as e:
+                    logger.warning(f"Fallback corpus unavailable, using built-in quote: {str(e)}")
+                    _corpus = False
+    return _corpus or None
+
+
+def fallback_quote(name=None, day=None):
+    """
+    Return today's fallback quote for name from the corpus
+    """
+    corpus = get_corpus()
+    if corpus is not None:
+        return corpus.quote(name, day)
+    name = name.strip() if name else ''
+    return DEFAULT_TEMPLATE[0] + name + DEFAULT_TEMPLATE[1] if name else DEFAULT_GENERIC
+
+
+def main():
+    entries = read_source()
+    packed = pack_corpus(entries)
+    with open(CORPUS_PATH, 'wb') as f:
+        f.write(packed)
+    print(f"Wrote {len(entries)} quotes ({len(packed)} bytes) to {CORPUS_PATH}")
+
+
+if __name__ == '__main__':
+    main()
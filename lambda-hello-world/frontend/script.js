@@ -7,19 +7,89 @@
 const CONFIG = {
     API_ENDPOINT: 'https://clx8580ut5.execute-api.us-east-1.amazonaws.com/Prod/quote/',
     REQUEST_TIMEOUT: 30000, // 30 seconds
+    STREAMING: true, // Render quote text as it arrives when the browser supports it
     MIN_NAME_LENGTH: 1,
-    MAX_NAME_LENGTH: 50
+    MAX_NAME_LENGTH: 50,
+    CACHE_PREFIX: 'dailyQuote:', // localStorage key prefix for cached quotes
+    CACHE_FRESH_MS: 10 * 60 * 1000, // Cached quotes older than this are revalidated in the background
+    CACHE_MAX_ENTRIES: 20
 };
 
 // Application State
 const AppState = {
     isLoading: false,
+    isStreaming: false,
     currentQuote: null,
     userName: '',
     error: null,
     lastRequestTime: null
 };
 
+// Requests currently on the wire, keyed like the cache, so duplicates share one
+const InFlightRequests = new Map();
+
+/**
+ * Client-side quote cache in localStorage, keyed by name and UTC date
+ * Quotes change at midnight UTC, so yesterday's entries are never read again
+ */
+const QuoteStore = {
+    key(name) {
+        const day = new Date().toISOString().slice(0, 10);
+        return `${CONFIG.CACHE_PREFIX}${day}:${(name || '').trim().toLowerCase()}`;
+    },
+
+    read(name) {
+        try {
+            const raw = window.localStorage.getItem(this.key(name));
+            return raw ? JSON.parse(raw) : null;
+        } catch (error) {
+            // Storage disabled (private mode) or corrupt entry
+            return null;
+        }
+    },
+
+    write(name, data) {
+        try {
+            window.localStorage.setItem(this.key(name), JSON.stringify({ data, savedAt: Date.now() }));
+            this.prune();
+        } catch (error) {
+            console.warn('Unable to cache quote:', error);
+        }
+    },
+
+    isFresh(entry) {
+        return Boolean(entry) && Date.now() - entry.savedAt < CONFIG.CACHE_FRESH_MS;
+    },
+
+    /**
+     * Drop entries from other days and keep only the newest CACHE_MAX_ENTRIES
+     */
+    prune() {
+        const today = this.key('').slice(0, -1);
+        const entries = [];
+
+        for (let i = window.localStorage.length - 1; i >= 0; i--) {
+            const key = window.localStorage.key(i);
+            if (!key || !key.startsWith(CONFIG.CACHE_PREFIX)) continue;
+
+            if (!key.startsWith(today)) {
+                window.localStorage.removeItem(key);
+                continue;
+            }
+            try {
+                entries.push({ key, savedAt: JSON.parse(window.localStorage.getItem(key)).savedAt || 0 });
+            } catch (error) {
+                window.localStorage.removeItem(key);
+            }
+        }
+
+        entries
+            .sort((a, b) => b.savedAt - a.savedAt)
+            .slice(CONFIG.CACHE_MAX_ENTRIES)
+            .forEach(({ key }) => window.localStorage.removeItem(key));
+    }
+};
+
 // DOM Elements
 const Elements = {
     form: null,
@@ -174,15 +244,28 @@ function clearInputError() {
 
 /**
  * Generate quote from API
+ * Today's cached quote is shown instantly and revalidated in the background when stale
  */
 async function generateQuote(name) {
+    const cached = QuoteStore.read(name);
+    if (cached) {
+        AppState.currentQuote = cached.data;
+        AppState.error = null;
+        displayQuote(cached.data, name, { fromCache: true });
+
+        if (!QuoteStore.isFresh(cached)) {
+            revalidateQuote(name);
+        }
+        return;
+    }
+
     try {
         // Set loading state
         setLoadingState(true);
         hideAllSections();
 
-        // Make API request
-        const quote = await fetchQuoteFromAPI(name);
+        // Make API request, streaming the text in when possible
+        const quote = await fetchQuoteOnce(name, (text) => renderStreamingText(text, name));
 
         // Update state
         AppState.currentQuote = quote;
@@ -196,10 +279,53 @@ async function generateQuote(name) {
         AppState.error = error.message;
         showError(error.message);
     } finally {
+        AppState.isStreaming = false;
         setLoadingState(false);
     }
 }
 
+/**
+ * Fetch a quote, sharing the request with any identical one already in flight
+ * Successful model quotes are written to the client-side cache
+ */
+function fetchQuoteOnce(name, onText) {
+    const key = QuoteStore.key(name);
+    if (InFlightRequests.has(key)) {
+        return InFlightRequests.get(key);
+    }
+
+    const request = (onText && supportsStreaming()
+        ? fetchQuoteStream(name, onText)
+        : fetchQuoteFromAPI(name))
+        .then((data) => {
+            // Fallback quotes are served while the model is busy, so don't keep them
+            if (data.source !== 'fallback') {
+                QuoteStore.write(name, data);
+            }
+            return data;
+        })
+        .finally(() => InFlightRequests.delete(key));
+
+    InFlightRequests.set(key, request);
+    return request;
+}
+
+/**
+ * Refresh a cached quote in the background and show it if it changed
+ */
+function revalidateQuote(name) {
+    return fetchQuoteOnce(name)
+        .then((data) => {
+            const stillShowing = AppState.userName === name &&
+                Elements.quoteSection.classList.contains('show');
+            if (stillShowing && AppState.currentQuote && data.quote !== AppState.currentQuote.quote) {
+                AppState.currentQuote = data;
+                displayQuote(data, name);
+            }
+        })
+        .catch((error) => console.warn('Background refresh failed:', error.message));
+}
+
 /**
  * Fetch quote from API
  */
@@ -242,22 +368,161 @@ async function fetchQuoteFromAPI(name) {
 
     } catch (error) {
         clearTimeout(timeoutId);
+        throw toFriendlyError(error);
+    }
+}
+
+/**
+ * Check whether quotes can be streamed in this browser
+ */
+function supportsStreaming() {
+    return CONFIG.STREAMING &&
+        typeof TextDecoder !== 'undefined' &&
+        typeof ReadableStream !== 'undefined' &&
+        'getReader' in ReadableStream.prototype;
+}
+
+/**
+ * Fetch quote from API as Server-Sent Events
+ * onText(text) is called with the full text received so far after every chunk
+ */
+async function fetchQuoteStream(name, onText) {
+    const controller = new AbortController();
+    const timeoutId = setTimeout(() => controller.abort(), CONFIG.REQUEST_TIMEOUT);
+
+    try {
+        // Prepare request URL with name and stream parameters
+        const url = new URL(CONFIG.API_ENDPOINT);
+        if (name) {
+            url.searchParams.append('name', name);
+        }
+        url.searchParams.append('stream', 'true');
+
+        const response = await fetch(url.toString(), {
+            method: 'GET',
+            headers: {
+                'Accept': 'text/event-stream',
+            },
+            signal: controller.signal
+        });
+
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status} ${response.statusText}`);
+        }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let text = '';
+        let result = null;
+
+        const handleEvent = (rawEvent) => {
+            const event = parseSSEEvent(rawEvent);
+            if (!event) return;
+
+            if (event.type === 'chunk') {
+                text += event.data.text || '';
+                onText(text);
+            } else if (event.type === 'reset') {
+                text = '';
+            } else if (event.type === 'done') {
+                result = event.data;
+            }
+        };
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+
+            buffer += decoder.decode(value, { stream: true });
+
+            // Events are separated by a blank line
+            let separator;
+            while ((separator = buffer.indexOf('\n\n')) !== -1) {
+                handleEvent(buffer.slice(0, separator));
+                buffer = buffer.slice(separator + 2);
+            }
+        }
+        if (buffer.trim()) {
+            handleEvent(buffer);
+        }
+
+        clearTimeout(timeoutId);
+
+        // Validate the final event
+        if (!result || !result.quote) {
+            throw new Error('Invalid response from server');
+        }
+
+        return result;
+
+    } catch (error) {
+        clearTimeout(timeoutId);
+        throw toFriendlyError(error);
+    }
+}
 
-        // Handle different error types
-        if (error.name === 'AbortError') {
-            throw new Error('Request timed out. Please try again.');
-        } else if (error instanceof TypeError && error.message.includes('fetch')) {
-            throw new Error('Unable to connect to the server. Please check your internet connection.');
-        } else {
-            throw error;
+/**
+ * Parse one Server-Sent Event into { type, data }
+ */
+function parseSSEEvent(rawEvent) {
+    let type = 'message';
+    const dataLines = [];
+
+    rawEvent.split('\n').forEach((line) => {
+        if (line.startsWith('event:')) {
+            type = line.slice(6).trim();
+        } else if (line.startsWith('data:')) {
+            dataLines.push(line.slice(5).trim());
         }
+    });
+
+    if (!dataLines.length) return null;
+
+    try {
+        return { type, data: JSON.parse(dataLines.join('\n')) };
+    } catch (error) {
+        console.warn('Ignoring malformed stream event:', rawEvent);
+        return null;
+    }
+}
+
+/**
+ * Map fetch failures to user-facing messages
+ */
+function toFriendlyError(error) {
+    // Handle different error types
+    if (error.name === 'AbortError') {
+        return new Error('Request timed out. Please try again.');
+    } else if (error instanceof TypeError && error.message.includes('fetch')) {
+        return new Error('Unable to connect to the server. Please check your internet connection.');
+    }
+    return error;
+}
+
+/**
+ * Show partial quote text while it streams in
+ */
+function renderStreamingText(text, name) {
+    Elements.quoteText.textContent = text;
+
+    if (!AppState.isStreaming) {
+        AppState.isStreaming = true;
+        Elements.quoteFor.textContent = name ? `Personalized for ${name}` : 'Daily inspiration';
+        Elements.quoteModel.textContent = '';
+        showQuoteSection();
+
+        // The first words are on screen, the overlay is no longer needed
+        Elements.loadingOverlay.classList.remove('show');
+        Elements.loadingOverlay.setAttribute('aria-hidden', 'true');
     }
 }
 
 /**
  * Display quote in UI
+ * fromCache marks a quote re-shown from the client-side cache rather than just fetched
  */
-function displayQuote(quoteData, name) {
+function displayQuote(quoteData, name, { fromCache = false } = {}) {
     // Update quote text
     Elements.quoteText.textContent = quoteData.quote;
 
@@ -274,7 +539,9 @@ function displayQuote(quoteData, name) {
     showQuoteSection();
 
     // Announce to screen readers
-    announceToScreenReader(`New quote generated: ${quoteData.quote}`);
+    announceToScreenReader(fromCache
+        ? `Today's quote: ${quoteData.quote}`
+        : `New quote generated: ${quoteData.quote}`);
 }
 
 /**
@@ -290,6 +557,8 @@ function showError(message) {
 
 /**
  * Handle new quote request
+ * The API serves one quote per name and UTC day, so this re-shows today's quote
+ * from the client-side cache (revalidating it when stale) until the day changes
  */
 async function handleNewQuote() {
     if (AppState.isLoading) return;
@@ -327,7 +596,7 @@ function setLoadingState(isLoading) {
     // Show/hide loading overlay for longer requests
     if (isLoading) {
         setTimeout(() => {
-            if (AppState.isLoading) {
+            if (AppState.isLoading && !AppState.isStreaming) {
                 Elements.loadingOverlay.classList.add('show');
                 Elements.loadingOverlay.setAttribute('aria-hidden', 'false');
             }
@@ -0,0 +1,71 @@
+"""
+HTTP caching helpers for the Daily Quote Lambda function
+Deterministic ETags from the quote and UTC date, Cache-Control headers that
+expire at midnight UTC and If-None-Match matching for conditional GETs
+"""
+
+import time
+
+from quote_cache import utc_today, next_utc_midnight, seconds_until_midnight_utc
+
+
+def make_etag(quote, day=None):
+    """
+    Return a strong ETag for a quote served on a given UTC day
+    """
+    import hashlib
+
+    day = day or utc_today()
+    digest = hashlib.sha256(f"{day}\n{quote}".encode('utf-8')).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match, etag):
+    """
+    Check an If-None-Match header value against an ETag (weak comparison)
+    """
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    wanted = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == wanted:
+            return True
+    return False
+
+
+def get_header(event, name):
+    """
+    Return a request header from an API Gateway event, ignoring case
+    """
+    headers = (event or {}).get('headers') or {}
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def cache_headers(quote, personalized, source, now=None):
+    """
+    Build ETag, Cache-Control and Expires headers for a quote response
+
+    Anonymous quotes are public until midnight UTC, personalized ones private
+    to the browser. Fallback quotes must be revalidated so a throttled moment
+    is not cached for the rest of the day.
+    """
+    headers = {
+        'ETag': make_etag(quote, utc_today(now)),
+        'Access-Control-Expose-Headers': 'ETag'
+    }
+    if source == 'fallback':
+        headers['Cache-Control'] = 'no-cache'
+    else:
+        visibility = 'private' if personalized else 'public'
+        headers['Cache-Control'] = f"{visibility}, max-age={seconds_until_midnight_utc(now)}"
+        headers['Expires'] = time.strftime('%a, %d %b %Y %H:%M:%S GMT', time.gmtime(next_utc_midnight(now)))
+    return headers
@@ -1,174 +1,559 @@
+import os
 import json
-import boto3
+import time
 import logging
-from botocore.exceptions import ClientError
+import threading
+from quote_cache import QuoteCache, DynamoDBCacheBackend, make_cache_key
+from batch_quotes import MAX_BATCH_NAMES, dedupe_names, build_batch_request, parse_batch_response
+from bedrock_engine import AsyncBedrockEngine, backoff_delay, is_throttling_error
+from circuit_breaker import CircuitBreaker
+from quote_stream import iter_stream_text, encode_events
+from model_router import ModelRouter, adapter_for
+from request_metrics import RequestMetrics, phase, set_property
+from http_cache import cache_headers, etag_matches, get_header, make_etag
+from single_flight import SingleFlight
+from name_sanitizer import sanitize_name_input
+from fallback_corpus import fallback_quote
 
-# Set up logging
+# Set up logging; LOG_LEVEL=DEBUG also logs every incoming event
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
 
-# Initialize Bedrock client
-bedrock_client = boto3.client('bedrock-runtime', region_name='us-east-1')
+# Per-request phase timings, emitted as CloudWatch EMF for a sample of requests
+request_metrics = RequestMetrics(
+    namespace=os.environ.get('METRICS_NAMESPACE', 'DailyQuote'),
+    sample_rate=float(os.environ.get('METRICS_SAMPLE_RATE', '1'))
+)
+
+# Bedrock client, created on first use (see get_bedrock_client) so cold starts
+# do not pay for importing boto3 and building the client up front
+bedrock_client = None
+_bedrock_client_lock = threading.Lock()
+
+# Bedrock client tuning: short connect timeout, bounded read timeout, TCP
+# keep-alive and a connection pool sized for the async engine. botocore's own
+# retries are disabled because generate_quote and the engine retry themselves.
+BEDROCK_REGION = os.environ.get('BEDROCK_REGION', 'us-east-1')
+BEDROCK_CONNECT_TIMEOUT = float(os.environ.get('BEDROCK_CONNECT_TIMEOUT', '2'))
+BEDROCK_READ_TIMEOUT = float(os.environ.get('BEDROCK_READ_TIMEOUT', '10'))
+
+# Models the router may use, in order of preference. Amazon Nova 2 Lite
+# (newest model) first, then models we have fallen back to by hand before
+MODEL_IDS = [
+    model_id.strip()
+    for model_id in os.environ.get(
+        'BEDROCK_MODELS',
+        'us.amazon.nova-2-lite-v1:0,us.amazon.nova-micro-v1:0,amazon.titan-text-express-v1'
+    ).split(',')
+    if model_id.strip()
+]
+
+# Retry budget for the synchronous single-quote path
+MAX_RETRIES = int(os.environ.get('BEDROCK_MAX_RETRIES', '2'))
+
+def create_bedrock_client():
+    """
+    Build a Bedrock runtime client with a tuned botocore configuration
+    """
+    import boto3
+    from botocore.config import Config
+    
+    config = Config(
+        region_name=BEDROCK_REGION,
+        connect_timeout=BEDROCK_CONNECT_TIMEOUT,
+        read_timeout=BEDROCK_READ_TIMEOUT,
+        tcp_keepalive=True,
+        max_pool_connections=int(os.environ.get('BEDROCK_MAX_CONCURRENCY', '4')) * 2,
+        retries={'max_attempts': 1, 'mode': 'standard'}
+    )
+    return boto3.client('bedrock-runtime', config=config)
+
+def get_bedrock_client():
+    """
+    Return the Bedrock runtime client, creating and caching it on first use
+    """
+    global bedrock_client
+    if bedrock_client is None:
+        with _bedrock_client_lock:
+            if bedrock_client is None:
+                bedrock_client = create_bedrock_client()
+    return bedrock_client
+
+def set_bedrock_client(client):
+    """
+    Swap the Bedrock runtime client, e.g. for fake_bedrock.FakeBedrockClient in offline tests
+    Returns the previous client
+    """
+    global bedrock_client
+    previous, bedrock_client = bedrock_client, client
+    return previous
+
+# Circuit breaker around Bedrock, persisted in module scope across warm invocations
+bedrock_breaker = CircuitBreaker(
+    failure_threshold=int(os.environ.get('BREAKER_FAILURE_THRESHOLD', '3')),
+    cooldown=float(os.environ.get('BREAKER_COOLDOWN_SECONDS', '30'))
+)
+
+# Latency-aware model router; throttled models cool down while others serve
+model_router = ModelRouter(
+    [adapter_for(model_id) for model_id in MODEL_IDS],
+    cooldown=float(os.environ.get('MODEL_COOLDOWN_SECONDS', '60')),
+    is_throttle=is_throttling_error
+)
+
+# Concurrent invocation engine shared by the batch and pool paths
+# Quotas persist across warm invocations so bursts cannot exceed the account limits
+bedrock_engine = AsyncBedrockEngine(
+    get_bedrock_client,
+    max_concurrency=int(os.environ.get('BEDROCK_MAX_CONCURRENCY', '4')),
+    requests_per_minute=int(os.environ.get('BEDROCK_RPM', '50')),
+    tokens_per_minute=int(os.environ.get('BEDROCK_TPM', '20000')),
+    max_retries=MAX_RETRIES,
+    breaker=bedrock_breaker,
+    observer=model_router.observe
+)
+
+# Daily quote cache, survives across warm invocations of this container
+# Set QUOTE_CACHE_TABLE to share cached quotes between containers via DynamoDB
+quote_cache = QuoteCache(
+    max_size=int(os.environ.get('QUOTE_CACHE_SIZE', '256')),
+    backend=DynamoDBCacheBackend(os.environ['QUOTE_CACHE_TABLE']) if os.environ.get('QUOTE_CACHE_TABLE') else None
+)
+
+# Pre-generated generic quotes for anonymous requests, enabled by QUOTE_POOL_PATH
+# (imported only when enabled so sqlite3 stays off the cold-start path)
+quote_pool = None
+if os.environ.get('QUOTE_POOL_PATH'):
+    from quote_pool import QuotePool
+    quote_pool = QuotePool(
+        os.environ['QUOTE_POOL_PATH'],
+        capacity=int(os.environ.get('QUOTE_POOL_SIZE', '50')),
+        low_watermark=int(os.environ.get('QUOTE_POOL_LOW_WATERMARK', '10'))
+    )
+
+# Identical concurrent requests share one generation per name and day.
+# QUOTE_LEASE_PATH adds a SQLite lease so processes coalesce with each other too
+quote_lease = None
+if os.environ.get('QUOTE_LEASE_PATH'):
+    from quote_lease import SQLiteLease
+    quote_lease = SQLiteLease(
+        os.environ['QUOTE_LEASE_PATH'],
+        ttl=float(os.environ.get('QUOTE_LEASE_TTL_SECONDS', '15'))
+    )
+quote_flight = SingleFlight(lease=quote_lease, wait_timeout=float(os.environ.get('QUOTE_LEASE_TTL_SECONDS', '15')))
 
 def get_energizing_quote(name=None):
     """
     Generate an energizing daily quote using Amazon Bedrock
-    Uses Titan Text Express (cheapest model)
+    The model is picked by model_router, falling back to a pre-written quote
     """
-    import time
-    import random
-    
-    max_retries = 1
-    base_delay = 1
-    
-    for attempt in range(max_retries):
+    quote, _ = generate_quote(name)
+    return quote
+
+def generate_quote(name=None):
+    """
+    Generate a quote and report where it came from
+    Returns (quote, source) where source is 'bedrock' or 'fallback'
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        # Skip the round-trip entirely while Bedrock is known to be throttling
+        if not bedrock_breaker.allow_request():
+            logger.info("Circuit breaker open, skipping Bedrock")
+            break
+        
         try:
-            # Create personalized prompt based on whether name is provided
-            if name and name.strip():
-                prompt = f"""Generate a personalized energizing daily quote for {name.strip()}. 
-                The quote should be exactly two sentences long, motivational, and inspiring.
-                Address {name.strip()} directly in the quote to make it personal and uplifting.
-                Focus on positivity, growth, and achievement.
-                
-                Personalized Quote for {name.strip()}:"""
-            else:
-                prompt = """Generate an energizing daily quote that motivates and inspires. 
-                The quote should be exactly two sentences long and focus on positivity, growth, or achievement.
-                Make it uplifting and powerful.
-                
-                Quote:"""
-            
-            # Request body for Amazon Nova 2 Lite
-            request_body = {
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "text": prompt
-                            }
-                        ]
-                    }
-                ],
-                "inferenceConfig": {
-                    "max_new_tokens": 100,
-                    "temperature": 0.7,
-                    "top_p": 0.9,
-                    "stop_sequences": ["\n\n"]
-                }
-            }
-            
-            # Call Bedrock with Amazon Nova 2 Lite inference profile (newest model)
-            response = bedrock_client.invoke_model(
-                modelId='us.amazon.nova-2-lite-v1:0',
-                body=json.dumps(request_body),
-                contentType='application/json'
-            )
-            
-            # Parse response (Nova 2 format)
-            response_body = json.loads(response['body'].read())
-            quote = response_body['output']['message']['content'][0]['text'].strip()
-            
-            # Clean up the quote (remove any extra formatting)
-            quote = quote.replace('Quote:', '').replace(f'Personalized Quote for {name.strip() if name else ""}:', '').strip()
-            
+            quote = request_quote_from_bedrock(name)
+            bedrock_breaker.record_success()
             logger.info(f"Generated quote for {name or 'anonymous'}")
-            return quote
+            return quote, 'bedrock'
             
-        except ClientError as e:
-            error_code = e.response.get('Error', {}).get('Code', '')
+        except Exception as e:
+            if not is_throttling_error(e):
+                bedrock_breaker.release()
+                logger.error(f"Bedrock error: {str(e)}")
+                break
+            bedrock_breaker.record_failure()
             
-            if error_code == 'ThrottlingException' and attempt < max_retries - 1:
-                # Exponential backoff with jitter
-                delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
-                logger.warning(f"Bedrock throttling, retrying in {delay:.2f} seconds (attempt {attempt + 1}/{max_retries})")
+            if attempt < MAX_RETRIES:
+                # Exponential backoff with full jitter
+                delay = backoff_delay(attempt)
+                logger.warning(f"Bedrock throttling, retrying in {delay:.2f} seconds (attempt {attempt + 1}/{MAX_RETRIES})")
                 time.sleep(delay)
                 continue
-            else:
-                logger.error(f"Bedrock API error: {str(e)}")
-                break
-                
-        except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
+            logger.error(f"Bedrock API error: {str(e)}")
             break
     
     # Fallback quotes if all retries failed
     logger.info("Using fallback quote due to API issues")
+    return get_fallback_quote(name), 'fallback'
+
+def generate_daily_quote(name=None):
+    """
+    Generate today's quote for name and cache it, sharing a single in-flight
+    generation with concurrent requests for the same name
+    Returns (quote, source)
+    """
+    def generate():
+        quote, source = generate_quote(name)
+        # Only cache real model output so a throttled day retries Bedrock
+        if source == 'bedrock':
+            quote_cache.set(name, quote)
+        return quote, source
+    
+    (quote, source), shared = quote_flight.do(make_cache_key(name), generate)
+    set_property('coalesced', shared)
+    # A result from another process's lease is not in this process's cache yet
+    if shared and source == 'bedrock':
+        quote_cache.set(name, quote)
+    return quote, source
+
+def build_quote_prompt(name=None):
+    """
+    Build the prompt for a personalized or generic quote
+    """
+    # Create personalized prompt based on whether name is provided
     if name and name.strip():
-        return f"Hey {name.strip()}, every new day is a chance to transform your dreams into reality! Embrace the possibilities and make today extraordinary."
+        prompt = f"""Generate a personalized energizing daily quote for {name.strip()}. 
+        The quote should be exactly two sentences long, motivational, and inspiring.
+        Address {name.strip()} directly in the quote to make it personal and uplifting.
+        Focus on positivity, growth, and achievement.
+        
+        Personalized Quote for {name.strip()}:"""
     else:
-        return "Every new day is a chance to transform your dreams into reality. Embrace the possibilities and make today extraordinary!"
+        prompt = """Generate an energizing daily quote that motivates and inspires. 
+        The quote should be exactly two sentences long and focus on positivity, growth, or achievement.
+        Make it uplifting and powerful.
+        
+        Quote:"""
+    return prompt
+
+def build_quote_request(name=None, adapter=None):
+    """
+    Build the request body for a quote in the format of adapter's model
+    (defaults to the model the router currently prefers)
+    """
+    adapter = adapter or model_router.select()
+    return adapter.build_request(
+        build_quote_prompt(name),
+        max_tokens=100,
+        temperature=0.7,
+        top_p=0.9,
+        stop_sequences=["\n\n"]
+    )
+
+def parse_quote_response(response_body, name=None, adapter=None):
+    """
+    Extract and clean the quote text from a response body of adapter's model
+    """
+    adapter = adapter or model_router.select()
+    return clean_quote_text(adapter.parse_response(response_body), name)
+
+def clean_quote_text(quote, name=None):
+    """
+    Remove prompt echoes and extra whitespace from generated quote text
+    """
+    # Clean up the quote (remove any extra formatting)
+    quote = quote.strip()
+    return quote.replace('Quote:', '').replace(f'Personalized Quote for {name.strip() if name else ""}:', '').strip()
+
+def request_quote_from_bedrock(name=None):
+    """
+    Get a quote from the best available model, failing over on throttling
+    Raises on any error so callers can decide whether to retry or fall back
+    """
+    def parse(adapter, response_body):
+        with phase('parseResponse'):
+            return parse_quote_response(response_body, name, adapter)
+
+    with phase('modelCall'):
+        quote, adapter = model_router.invoke(
+            get_bedrock_client(),
+            lambda adapter: build_quote_request(name, adapter),
+            parse
+        )
+    set_property('model', adapter.model_id)
+    return quote
+
+def request_quote_stream_from_bedrock(name=None):
+    """
+    Stream text deltas for a quote from the best available model
+    Fails over to the next candidate on throttling until the first chunk has
+    arrived; later errors are raised, since text has already been sent
+    Uses the same request body as the non-streaming path
+    """
+    last_error = None
+    for adapter in model_router.candidates():
+        start = time.perf_counter()
+        started = False
+        try:
+            response = get_bedrock_client().invoke_model_with_response_stream(
+                modelId=adapter.model_id,
+                body=json.dumps(build_quote_request(name, adapter)),
+                contentType='application/json'
+            )
+            for text in iter_stream_text(response, adapter.parse_stream_chunk):
+                started = True
+                yield text
+        except Exception as e:
+            model_router.observe(adapter.model_id, time.perf_counter() - start, e)
+            if started or not is_throttling_error(e):
+                raise
+            logger.warning(f"Model {adapter.model_id} throttled, failing over")
+            last_error = e
+            continue
+        model_router.observe(adapter.model_id, time.perf_counter() - start)
+        set_property('model', adapter.model_id)
+        return
+    raise last_error
+
+def stream_quote_events(name=None):
+    """
+    Yield quote events as they become available:
+    {'type': 'chunk', 'text': ...} for each piece of text,
+    {'type': 'reset'} if a stream fails part-way and the text must be discarded,
+    and a final {'type': 'done', 'quote': ..., 'source': ...}
+    Concurrent streams for the same name share one model call; the ones that
+    join it receive the finished quote as a single chunk
+    """
+    cached = quote_cache.get(name)
+    if cached is not None:
+        yield {'type': 'chunk', 'text': cached}
+        yield {'type': 'done', 'quote': cached, 'source': 'cache'}
+        return
+    
+    (quote, source), shared = yield from quote_flight.do_stream(
+        make_cache_key(name), lambda: stream_generated_quote(name)
+    )
+    set_property('coalesced', shared)
+    if shared:
+        if source == 'bedrock':
+            quote_cache.set(name, quote)
+        yield {'type': 'chunk', 'text': quote}
+    yield {'type': 'done', 'quote': quote, 'source': source}
+
+def stream_generated_quote(name=None):
+    """
+    Yield chunk and reset events for a new quote from Bedrock, or the fallback
+    Returns (quote, source) and caches quotes that came from the model
+    """
+    parts = []
+    if bedrock_breaker.allow_request():
+        try:
+            for text in request_quote_stream_from_bedrock(name):
+                if not parts:
+                    text = text.lstrip()
+                    if not text:
+                        continue
+                parts.append(text)
+                yield {'type': 'chunk', 'text': text}
+            bedrock_breaker.record_success()
+            
+            quote = clean_quote_text(''.join(parts), name)
+            if quote:
+                quote_cache.set(name, quote)
+                return quote, 'bedrock'
+        except Exception as e:
+            if is_throttling_error(e):
+                bedrock_breaker.record_failure()
+            else:
+                bedrock_breaker.release()
+            logger.error(f"Bedrock streaming error: {str(e)}")
+    else:
+        logger.info("Circuit breaker open, skipping Bedrock stream")
+    
+    # Fallback quote replaces anything streamed so far
+    if parts:
+        yield {'type': 'reset'}
+    quote = get_fallback_quote(name)
+    yield {'type': 'chunk', 'text': quote}
+    return quote, 'fallback'
+
+def wants_stream(event):
+    """
+    Return True when the request asks for a streamed response (?stream=true)
+    """
+    params = event.get('queryStringParameters') or {}
+    return str(params.get('stream', '')).lower() in ('1', 'true', 'yes')
+
+def build_stream_response(name, event, context):
+    """
+    Return quote events as SSE (default) or NDJSON (?format=ndjson)
+    The Python Lambda runtime buffers the body, so API Gateway delivers it in one
+    piece; a streaming-capable front (Function URL with response streaming or
+    a Lambda Web Adapter) can send stream_quote_events() as it is produced
+    """
+    params = event.get('queryStringParameters') or {}
+    fmt = 'ndjson' if params.get('format') == 'ndjson' else 'sse'
+    
+    events = []
+    for quote_event in stream_quote_events(name):
+        if quote_event['type'] == 'done':
+            quote_event = dict(
+                quote_event,
+                timestamp=context.aws_request_id if context else 'local-test',
+                model=model_router.select().model_id,
+                personalized=bool(name and name.strip())
+            )
+        events.append(quote_event)
+    
+    content_type, body = encode_events(events, fmt)
+    return {
+        'statusCode': 200,
+        'headers': {
+            'Content-Type': content_type,
+            'Cache-Control': 'no-cache',
+            'Access-Control-Allow-Origin': '*',
+            'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+            'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Amz-Date, X-Api-Key, X-Amz-Security-Token'
+        },
+        'body': body
+    }
+
+def get_fallback_quote(name=None):
+    """
+    Return the offline quote used when Bedrock is unavailable
+    Picked from the bundled corpus by name and UTC date
+    """
+    with phase('fallback'):
+        return fallback_quote(name)
 
 def lambda_handler(event, context):
     """
     AWS Lambda function that returns an energizing daily quote from Bedrock
     Supports personalization via name parameter
     """
+    with request_metrics.record() as timer:
+        if timer:
+            timer.set_property('requestId', context.aws_request_id if context else 'local-test')
+            timer.set_property('method', (event or {}).get('httpMethod', 'GET'))
+        return handle_request(event, context)
+
+def handle_request(event, context):
+    """
+    Route one API Gateway event to the preflight, batch, streaming or quote response
+    """
     try:
-        # Log the incoming event for debugging
-        logger.info(f"Received event: {json.dumps(event)}")
+        # Serializing the whole event is costly, so only do it when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Received event: {json.dumps(event)}")
         
         # Handle OPTIONS request for CORS preflight
         if event.get('httpMethod') == 'OPTIONS':
+            set_property('Source', 'preflight')
             return {
                 'statusCode': 200,
                 'headers': {
                     'Access-Control-Allow-Origin': '*',
                     'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-                    'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Amz-Date, X-Api-Key, X-Amz-Security-Token',
+                    'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Amz-Date, X-Api-Key, X-Amz-Security-Token, If-None-Match',
                     'Access-Control-Max-Age': '600'
                 },
                 'body': ''
             }
         
-        # Extract name from query parameters or POST body
-        name = None
-        
-        # Check query string parameters
-        if event.get('queryStringParameters'):
-            name = event['queryStringParameters'].get('name')
-            logger.info(f"Name from query parameters: {name}")
+        with phase('parseEvent'):
+            # Batch mode: POST body with a list of names
+            batch_names = get_batch_names(event)
+            
+            # Extract name from query parameters or POST body
+            name = None
+            
+            # Check query string parameters
+            if batch_names is None and event.get('queryStringParameters'):
+                name = event['queryStringParameters'].get('name')
+                logger.info(f"Name from query parameters: {name}")
+            
+            # Check POST body if no query parameter
+            if batch_names is None and not name and event.get('body'):
+                try:
+                    body = json.loads(event['body'])
+                    name = body.get('name')
+                    logger.info(f"Name from POST body: {name}")
+                except (json.JSONDecodeError, TypeError):
+                    logger.info("No valid JSON body found")
+                    pass
         
-        # Check POST body if no query parameter
-        if not name and event.get('body'):
-            try:
-                body = json.loads(event['body'])
-                name = body.get('name')
-                logger.info(f"Name from POST body: {name}")
-            except (json.JSONDecodeError, TypeError):
-                logger.info("No valid JSON body found")
-                pass
+        if batch_names is not None:
+            set_property('Source', 'batch')
+            return handle_batch_request(batch_names, context)
         
         # Sanitize name input to prevent prompt injection
         if name:
             original_name = name
-            name = sanitize_name_input(name)
+            with phase('sanitize'):
+                name = sanitize_name_input(name)
             logger.info(f"Name after sanitization: '{original_name}' -> '{name}'")
         else:
             logger.info("No name parameter found")
+        set_property('personalized', bool(name))
+        
+        # Streaming mode sends the quote as a sequence of text chunks
+        if wants_stream(event):
+            set_property('Source', 'stream')
+            return build_stream_response(name, event, context)
+        
+        is_get = event.get('httpMethod', 'GET') == 'GET'
+        personalized = bool(name and name.strip())
+        daily_quote = None
+        source = 'cache'
+        cache_hit = False
         
-        # Generate the daily quote (personalized or generic)
-        daily_quote = get_energizing_quote(name)
-        logger.info(f"Generated quote for name '{name}'")
+        # Conditional GET: answer 304 from the cache without touching the model
+        if_none_match = get_header(event, 'If-None-Match') if is_get else None
+        if if_none_match:
+            daily_quote = quote_cache.get(name)
+            cache_hit = daily_quote is not None
+            if cache_hit and etag_matches(if_none_match, make_etag(daily_quote)):
+                set_property('Source', 'not_modified')
+                return not_modified_response(daily_quote, personalized)
+        
+        # Serve today's quote from the cache when it is there
+        if daily_quote is None and not if_none_match:
+            daily_quote = quote_cache.get(name)
+            cache_hit = daily_quote is not None
+        
+        # Anonymous misses take a pre-generated quote from the pool when available;
+        # it becomes today's anonymous quote so later requests (and ETags) match it
+        if daily_quote is None and not name:
+            daily_quote = take_pooled_quote()
+            if daily_quote is not None:
+                quote_cache.set(None, daily_quote)
+                source = 'pool'
+        
+        # Otherwise generate it
+        if daily_quote is None:
+            daily_quote, source = generate_daily_quote(name)
+            logger.info(f"Generated quote for name '{name}'")
+        set_property('Source', source)
+        
+        headers = {
+            'Content-Type': 'application/json',
+            'Access-Control-Allow-Origin': '*',
+            'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+            'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Amz-Date, X-Api-Key, X-Amz-Security-Token, If-None-Match'
+        }
+        # GETs can be reused by browsers and CDNs until the quote changes at midnight UTC
+        if is_get:
+            headers.update(cache_headers(daily_quote, personalized, source))
         
         return {
             'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Amz-Date, X-Api-Key, X-Amz-Security-Token'
-            },
+            'headers': headers,
             'body': json.dumps({
                 'quote': daily_quote,
                 'timestamp': context.aws_request_id if context else 'local-test',
-                'model': 'us.amazon.nova-2-lite-v1:0',
-                'personalized': bool(name and name.strip())
+                'model': model_router.select().model_id,
+                'personalized': personalized,
+                'source': source,
+                'cache': dict(quote_cache.stats(), hit=cache_hit),
+                'circuit': bedrock_breaker.snapshot(),
+                'models': model_router.snapshot()
             })
         }
         
     except Exception as e:
         logger.error(f"Lambda handler error: {str(e)}")
+        set_property('Source', 'error')
         return {
             'statusCode': 500,
             'headers': {
@@ -181,23 +566,174 @@ def lambda_handler(event, context):
             })
         }
 
-def sanitize_name_input(name):
+def not_modified_response(quote, personalized):
     """
-    Sanitize name input to prevent prompt injection and ensure safety
+    Build the 304 response for a conditional GET whose ETag still matches
     """
-    if not name or not isinstance(name, str):
+    headers = {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET, POST, OPTIONS'
+    }
+    headers.update(cache_headers(quote, personalized, 'cache'))
+    return {
+        'statusCode': 304,
+        'headers': headers,
+        'body': ''
+    }
+
+def get_batch_names(event):
+    """
+    Return the 'names' value of a JSON POST body, or None when this is not a batch request
+    """
+    if not event.get('body'):
         return None
+    try:
+        body = json.loads(event['body'])
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if isinstance(body, dict) and 'names' in body:
+        return body['names']
+    return None
+
+def get_batch_quotes(names):
+    """
+    Generate quotes for already sanitized, unique names with a single Bedrock call
+    Cached names are skipped and names the model drops fall back to individual generation
+    Returns (quotes, stats)
+    """
+    quotes = {}
+    stats = {'fromCache': 0, 'fromBatch': 0, 'individual': 0}
     
-    # Remove excessive whitespace and limit length
-    name = name.strip()[:50]  # Limit to 50 characters
+    for name in names:
+        cached = quote_cache.get(name)
+        if cached is not None:
+            quotes[name] = cached
+            stats['fromCache'] += 1
     
-    # Remove potentially harmful characters but keep basic punctuation
-    import re
-    # Allow letters, spaces, hyphens, apostrophes, and basic punctuation
-    name = re.sub(r'[^\w\s\-\'\.]', '', name)
+    pending = [name for name in names if name not in quotes]
+    if pending:
+        adapter = model_router.select()
+        try:
+            with phase('modelCall'):
+                result = bedrock_engine.run_all(adapter.model_id, [build_batch_request(pending, adapter)])[0]
+            if isinstance(result, Exception):
+                raise result
+            with phase('parseResponse'):
+                generated = parse_batch_response(adapter.parse_response(result), pending)
+        except Exception as e:
+            logger.error(f"Batch quote generation failed: {str(e)}")
+            generated = {}
+        
+        for name, quote in generated.items():
+            quotes[name] = quote
+            quote_cache.set(name, quote)
+        stats['fromBatch'] = len(generated)
+        logger.info(f"Batch generated {len(generated)} of {len(pending)} quotes")
+    
+    # Names the model dropped are generated individually, concurrently
+    dropped = [name for name in names if name not in quotes]
+    if dropped:
+        adapter = model_router.select()
+        with phase('modelCall'):
+            results = bedrock_engine.run_all(adapter.model_id, [build_quote_request(name, adapter) for name in dropped])
+        for name, result in zip(dropped, results):
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                with phase('parseResponse'):
+                    quote = parse_quote_response(result, name, adapter)
+                quote_cache.set(name, quote)
+            except Exception as e:
+                logger.error(f"Individual quote for '{name}' failed: {str(e)}")
+                quote = get_fallback_quote(name)
+            quotes[name] = quote
+            stats['individual'] += 1
+    
+    return quotes, stats
+
+def handle_batch_request(raw_names, context):
+    """
+    Build the API response for a batch POST body of the form {"names": [...]}
+    """
+    headers = {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Amz-Date, X-Api-Key, X-Amz-Security-Token'
+    }
+    
+    if not isinstance(raw_names, list):
+        return {
+            'statusCode': 400,
+            'headers': headers,
+            'body': json.dumps({'error': 'Invalid request', 'message': "'names' must be a list"})
+        }
     
-    # Remove multiple consecutive spaces
-    name = re.sub(r'\s+', ' ', name)
+    names = dedupe_names(raw_names, sanitize_name_input)
+    if len(names) > MAX_BATCH_NAMES:
+        return {
+            'statusCode': 400,
+            'headers': headers,
+            'body': json.dumps({'error': 'Invalid request', 'message': f"At most {MAX_BATCH_NAMES} names per batch"})
+        }
+    
+    quotes, stats = get_batch_quotes(names)
+    
+    return {
+        'statusCode': 200,
+        'headers': headers,
+        'body': json.dumps({
+            'quotes': quotes,
+            'timestamp': context.aws_request_id if context else 'local-test',
+            'model': model_router.select().model_id,
+            'personalized': True,
+            'batch': dict(stats, requested=len(raw_names), unique=len(names)),
+            'circuit': bedrock_breaker.snapshot()
+        })
+    }
+
+def take_pooled_quote():
+    """
+    Pop a generic quote from the pool and start a background refill when it runs low
+    Returns None when the pool is disabled, empty or unavailable
+    """
+    if quote_pool is None:
+        return None
+    try:
+        quote = quote_pool.take()
+        if quote_pool.needs_refill():
+            quote_pool.refill_in_background(generate_generic_quotes, batch=True)
+        return quote
+    except Exception as e:
+        logger.error(f"Quote pool error: {str(e)}")
+        return None
+
+def generate_generic_quotes(count):
+    """
+    Generate up to count generic quotes concurrently through the invocation engine
+    Failed calls are dropped, so fewer quotes may come back
+    """
+    adapter = model_router.select()
+    request_body = build_quote_request(None, adapter)
+    quotes = []
+    for result in bedrock_engine.run_all(adapter.model_id, [request_body] * count):
+        if isinstance(result, Exception):
+            logger.warning(f"Generic quote generation failed: {str(result)}")
+            continue
+        try:
+            quotes.append(parse_quote_response(result, None, adapter))
+        except (KeyError, IndexError, TypeError) as e:
+            logger.warning(f"Unexpected quote response: {str(e)}")
+    return quotes
+
+def refill_handler(event, context):
+    """
+    Entry point that tops the quote pool up to capacity
+    Intended for a scheduled invocation or a manual warm-up
+    """
+    if quote_pool is None:
+        return {'added': 0, 'size': 0, 'enabled': False}
     
-    # Return None if name becomes empty after sanitization
-    return name if name and len(name.strip()) > 0 else None
\ No newline at end of file
+    target = (event or {}).get('target')
+    added = quote_pool.refill_many(generate_generic_quotes, target=target)
+    return {'added': added, 'size': quote_pool.size(), 'enabled': True}
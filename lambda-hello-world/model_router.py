@@ -0,0 +1,258 @@
+"""
+Multi-model routing for the Daily Quote Lambda function
+Each Bedrock model gets an adapter that knows its request and response format.
+The router tracks an EWMA of latency and error rate per model, prefers the
+fastest healthy one and fails over to the next model on throttling.
+"""
+
+import json
+import time
+import logging
+import threading
+
+logger = logging.getLogger()
+
+
+class ModelAdapter:
+    """
+    Request/response format of one Bedrock model
+    """
+
+    def __init__(self, model_id):
+        self.model_id = model_id
+
+    def build_request(self, prompt, max_tokens=100, temperature=0.7, top_p=0.9, stop_sequences=None):
+        raise NotImplementedError
+
+    def parse_response(self, response_body):
+        raise NotImplementedError
+
+    def parse_stream_chunk(self, payload):
+        """
+        Return the text carried by one decoded stream chunk, or None
+        """
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.model_id!r})"
+
+
+class NovaAdapter(ModelAdapter):
+    """
+    Amazon Nova messages format (Nova 2 Lite, Nova Micro, ...)
+    """
+
+    def build_request(self, prompt, max_tokens=100, temperature=0.7, top_p=0.9, stop_sequences=None):
+        inference_config = {
+            "max_new_tokens": max_tokens,
+            "temperature": temperature,
+            "top_p": top_p
+        }
+        if stop_sequences:
+            inference_config["stop_sequences"] = list(stop_sequences)
+        return {
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "text": prompt
+                        }
+                    ]
+                }
+            ],
+            "inferenceConfig": inference_config
+        }
+
+    def parse_response(self, response_body):
+        return response_body['output']['message']['content'][0]['text']
+
+    def parse_stream_chunk(self, payload):
+        return payload.get('contentBlockDelta', {}).get('delta', {}).get('text')
+
+
+class TitanAdapter(ModelAdapter):
+    """
+    Amazon Titan Text format (inputText / results[0].outputText)
+    """
+
+    def build_request(self, prompt, max_tokens=100, temperature=0.7, top_p=0.9, stop_sequences=None):
+        config = {
+            "maxTokenCount": max_tokens,
+            "temperature": temperature,
+            "topP": top_p
+        }
+        if stop_sequences:
+            config["stopSequences"] = list(stop_sequences)
+        return {
+            "inputText": prompt,
+            "textGenerationConfig": config
+        }
+
+    def parse_response(self, response_body):
+        return response_body['results'][0]['outputText']
+
+    def parse_stream_chunk(self, payload):
+        return payload.get('outputText')
+
+
+def adapter_for(model_id):
+    """
+    Pick the adapter class for a Bedrock model or inference profile ID
+    """
+    base_id = model_id.split('.', 1)[1] if model_id.startswith(('us.', 'eu.', 'apac.')) else model_id
+    if base_id.startswith('amazon.nova'):
+        return NovaAdapter(model_id)
+    if base_id.startswith('amazon.titan-text'):
+        return TitanAdapter(model_id)
+    raise ValueError(f"No adapter for model {model_id}")
+
+
+class ModelStats:
+    """
+    Exponentially weighted latency and error rate of one model
+    """
+
+    def __init__(self):
+        self.latency = None
+        self.error_rate = 0.0
+        self.calls = 0
+        self.failures = 0
+        self.cooldown_until = 0.0
+
+
+class ModelRouter:
+    """
+    Latency-aware router over a list of model adapters
+
+    Models in cool-down (recently throttled) or with an error EWMA at or above
+    error_threshold are unhealthy. Healthy models are ordered by latency EWMA,
+    unmeasured ones keep their configured order after the measured ones, and
+    unhealthy models are only tried as a last resort.
+
+    Crossing error_threshold also starts a cool-down. When a cool-down ends
+    the model's error EWMA is reset, so the next request probes it again
+    instead of leaving it behind the others for the life of the container.
+    """
+
+    def __init__(self, adapters, alpha=0.3, error_threshold=0.5, cooldown=60.0,
+                 is_throttle=None, clock=time.monotonic):
+        if not adapters:
+            raise ValueError("ModelRouter needs at least one adapter")
+        self.adapters = list(adapters)
+        self.alpha = alpha
+        self.error_threshold = error_threshold
+        self.cooldown = cooldown
+        self.is_throttle = is_throttle or (lambda error: False)
+        self.clock = clock
+        self.stats = {adapter.model_id: ModelStats() for adapter in self.adapters}
+        self._lock = threading.Lock()
+
+    def is_healthy(self, model_id, now=None):
+        stats = self.stats[model_id]
+        now = self.clock() if now is None else now
+        if stats.cooldown_until and stats.cooldown_until <= now:
+            # Cool-down over: forget the errors that caused it and probe again
+            stats.cooldown_until = 0.0
+            stats.error_rate = 0.0
+        return stats.cooldown_until <= now and stats.error_rate < self.error_threshold
+
+    def candidates(self):
+        """
+        Return adapters in the order they should be tried
+        """
+        with self._lock:
+            now = self.clock()
+            order = {adapter.model_id: index for index, adapter in enumerate(self.adapters)}
+
+            def key(adapter):
+                latency = self.stats[adapter.model_id].latency
+                return (latency is None, latency or 0.0, order[adapter.model_id])
+
+            healthy = [a for a in self.adapters if self.is_healthy(a.model_id, now)]
+            unhealthy = [a for a in self.adapters if not self.is_healthy(a.model_id, now)]
+            # Last-resort models: the one whose cool-down ends first goes first
+            unhealthy.sort(key=lambda a: self.stats[a.model_id].cooldown_until)
+            return sorted(healthy, key=key) + unhealthy
+
+    def select(self):
+        """
+        Return the adapter new requests should use
+        """
+        return self.candidates()[0]
+
+    def observe(self, model_id, latency, error=None):
+        """
+        Record the outcome of one call; throttled models enter a cool-down
+        """
+        if model_id not in self.stats:
+            return
+        with self._lock:
+            stats = self.stats[model_id]
+            stats.calls += 1
+            failed = error is not None
+            stats.error_rate = self.alpha * (1.0 if failed else 0.0) + (1 - self.alpha) * stats.error_rate
+            if failed:
+                stats.failures += 1
+                if self.is_throttle(error) or stats.error_rate >= self.error_threshold:
+                    stats.cooldown_until = self.clock() + self.cooldown
+            else:
+                stats.latency = latency if stats.latency is None else (
+                    self.alpha * latency + (1 - self.alpha) * stats.latency
+                )
+
+    def invoke(self, client, build_request, parse_response=None):
+        """
+        Call the best model, failing over to the next candidate on throttling
+
+        build_request(adapter) returns the request body for that model and
+        parse_response(adapter, response_body) the result (defaults to the text).
+        Returns (result, adapter); re-raises the last error when every model fails.
+        """
+        parse_response = parse_response or (lambda adapter, body: adapter.parse_response(body))
+        last_error = None
+
+        for adapter in self.candidates():
+            start = time.perf_counter()
+            try:
+                response = client.invoke_model(
+                    modelId=adapter.model_id,
+                    body=json.dumps(build_request(adapter)),
+                    contentType='application/json'
+                )
+                result = parse_response(adapter, json.loads(response['body'].read()))
+            except Exception as e:
+                self.observe(adapter.model_id, time.perf_counter() - start, e)
+                if not self.is_throttle(e):
+                    raise
+                logger.warning(f"Model {adapter.model_id} throttled, failing over")
+                last_error = e
+                continue
+
+            self.observe(adapter.model_id, time.perf_counter() - start)
+            return result, adapter
+
+        raise last_error
+
+    def reset(self):
+        """
+        Forget all measurements and cool-downs
+        """
+        with self._lock:
+            self.stats = {adapter.model_id: ModelStats() for adapter in self.adapters}
+
+    def snapshot(self):
+        """
+        Return per-model routing statistics
+        """
+        with self._lock:
+            now = self.clock()
+            return {
+                model_id: {
+                    'latencyMs': round(stats.latency * 1000, 1) if stats.latency is not None else None,
+                    'errorRate': round(stats.error_rate, 3),
+                    'calls': stats.calls,
+                    'healthy': self.is_healthy(model_id, now)
+                }
+                for model_id, stats in self.stats.items()
+            }
@@ -0,0 +1,86 @@
+"""
+Name sanitization for the Daily Quote Lambda function
+Keeps letters, digits, underscores, whitespace, hyphens, apostrophes and dots,
+collapses whitespace runs to one space and limits names to 50 characters.
+ASCII names (the common case) take a single bytes.translate pass; other names
+fall back to the precompiled regular expressions.
+"""
+
+import re
+
+MAX_NAME_LENGTH = 50
+
+# Regex implementation, used for non-ASCII names and as the reference for parity
+_DISALLOWED_NAME_CHARS = re.compile(r'[^\w\s\-\'\.]')
+_WHITESPACE_RUN = re.compile(r'\s+')
+
+
+def _build_ascii_tables():
+    """
+    Build a bytes.translate table that turns every ASCII whitespace character
+    into a space, and the characters outside [\\w\\s\\-'.] to delete, matching
+    what the regexes do for ASCII input
+    """
+    table = bytearray(range(256))
+    delete = bytearray()
+    for code in range(128):
+        char = chr(code)
+        if char.isspace():
+            table[code] = ord(' ')
+        elif not (char.isalnum() or char in "_-'."):
+            delete.append(code)
+    return bytes(table), bytes(delete)
+
+
+_ASCII_TABLE, _ASCII_DELETE = _build_ascii_tables()
+
+
+def sanitize_name_regex(name):
+    """
+    Reference implementation: two regex passes over the trimmed name
+    """
+    if not name or not isinstance(name, str):
+        return None
+    return _sanitize_trimmed_regex(name.strip()[:MAX_NAME_LENGTH])
+
+
+def _sanitize_trimmed_regex(name):
+    name = _DISALLOWED_NAME_CHARS.sub('', name)
+    name = _WHITESPACE_RUN.sub(' ', name)
+    return name if name and len(name.strip()) > 0 else None
+
+
+def sanitize_name_input(name):
+    """
+    Sanitize name input to prevent prompt injection and ensure safety
+    Returns None when nothing usable is left
+    """
+    if not name or not isinstance(name, str):
+        return None
+
+    name = name.strip()[:MAX_NAME_LENGTH]
+    if not name.isascii():
+        return _sanitize_trimmed_regex(name)
+
+    # One pass drops disallowed characters and turns whitespace into spaces
+    name = name.encode('ascii').translate(_ASCII_TABLE, _ASCII_DELETE).decode('ascii')
+    words = name.split()
+    if not words:
+        return None
+
+    # Removed characters can leave a space at either end; keep it like the regex does
+    collapsed = ' '.join(words)
+    if name[0] == ' ':
+        collapsed = ' ' + collapsed
+    if name[-1] == ' ':
+        collapsed += ' '
+    return collapsed
+
+
+def sanitize_names(names):
+    """
+    Lazily sanitize an iterable of names, yielding one result (or None) per input
+    """
+    sanitize = sanitize_name_input
+    for name in names:
+        yield sanitize(name)
@@ -0,0 +1,194 @@
+"""
+Daily quote cache for the Daily Quote Lambda function
+Keeps generated quotes in the warm container (bounded LRU) and optionally in a
+shared backend so every container serves the same quote for a name and day
+"""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+logger = logging.getLogger()
+
+
+def utc_today(now=None):
+    """
+    Return the current UTC date as YYYY-MM-DD
+    """
+    now = time.time() if now is None else now
+    return datetime.fromtimestamp(now, tz=timezone.utc).strftime('%Y-%m-%d')
+
+
+def next_utc_midnight(now=None):
+    """
+    Return the epoch timestamp of the next midnight UTC
+    """
+    now = time.time() if now is None else now
+    current = datetime.fromtimestamp(now, tz=timezone.utc)
+    midnight = (current + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return midnight.timestamp()
+
+
+def seconds_until_midnight_utc(now=None):
+    """
+    Return the whole number of seconds left until midnight UTC
+    """
+    now = time.time() if now is None else now
+    return max(0, int(next_utc_midnight(now) - now))
+
+
+def make_cache_key(name, day=None):
+    """
+    Build the cache key from an already sanitized name and the UTC date
+    Anonymous requests share a single key per day
+    """
+    day = day or utc_today()
+    return f"{day}:{name or ''}"
+
+
+class QuoteCache:
+    """
+    Bounded LRU cache of daily quotes with entries expiring at midnight UTC
+
+    backend is any object with get(key) and set(key, quote, expires_at)
+    methods (for example DynamoDBCacheBackend); it is consulted on a local miss
+    """
+
+    def __init__(self, max_size=256, backend=None, clock=time.time):
+        self.max_size = max(1, int(max_size))
+        self.backend = backend
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        """
+        Return the cached quote for name today, or None on a miss
+        """
+        now = self.clock()
+        key = make_cache_key(name, utc_today(now))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                quote, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return quote
+                del self._entries[key]
+
+        quote = self._backend_get(key)
+        with self._lock:
+            if quote is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._store(key, quote, next_utc_midnight(now))
+        return quote
+
+    def set(self, name, quote):
+        """
+        Cache quote for name until midnight UTC (locally and in the backend)
+        """
+        now = self.clock()
+        key = make_cache_key(name, utc_today(now))
+        expires_at = next_utc_midnight(now)
+        self._store(key, quote, expires_at)
+        if self.backend is not None:
+            try:
+                self.backend.set(key, quote, expires_at)
+            except Exception as e:
+                # The shared backend is best effort, the local copy still serves
+                logger.warning(f"Quote cache backend write failed: {str(e)}")
+
+    def clear(self):
+        """
+        Drop all local entries and reset the counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """
+        Return hit/miss counters for the response metadata
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'maxSize': self.max_size,
+                'evictions': self.evictions
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _store(self, key, quote, expires_at):
+        with self._lock:
+            self._entries[key] = (quote, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _backend_get(self, key):
+        if self.backend is None:
+            return None
+        try:
+            return self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Quote cache backend read failed: {str(e)}")
+            return None
+
+
+class DynamoDBCacheBackend:
+    """
+    Shared quote cache stored in a DynamoDB table
+    The table needs a string partition key named 'cacheKey' and TTL enabled on 'expiresAt'
+    """
+
+    def __init__(self, table_name, client=None, clock=time.time):
+        self.table_name = table_name
+        self.clock = clock
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            import boto3
+            self._client = boto3.client('dynamodb')
+        return self._client
+
+    def get(self, key):
+        response = self.client.get_item(
+            TableName=self.table_name,
+            Key={'cacheKey': {'S': key}},
+            ConsistentRead=False
+        )
+        item = response.get('Item')
+        if not item:
+            return None
+        # DynamoDB deletes expired items lazily, so check the TTL ourselves
+        if float(item['expiresAt']['N']) <= self.clock():
+            return None
+        return item['quote']['S']
+
+    def set(self, key, quote, expires_at):
+        self.client.put_item(
+            TableName=self.table_name,
+            Item={
+                'cacheKey': {'S': key},
+                'quote': {'S': quote},
+                'expiresAt': {'N': str(int(expires_at))}
+            }
+        )
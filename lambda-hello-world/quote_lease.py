@@ -0,0 +1,99 @@
+"""
+Cross-process lease for request coalescing in the Daily Quote Lambda function
+The store is a local SQLite file, standing in for a shared lock table.
+"""
+
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+
+
+class SQLiteLease:
+    """
+    Cross-process lease table in a local SQLite file
+
+    The process that acquires a key's lease generates the result and stores it
+    with complete(); other processes poll wait() until the result appears, the
+    lease is released or it expires after ttl seconds. Results are JSON encoded
+    and kept for ttl seconds so the rest of the burst can reuse them.
+    """
+
+    def __init__(self, path, ttl=15.0, poll_interval=0.05, clock=time.time):
+        self.path = path
+        self.ttl = ttl
+        self.poll_interval = poll_interval
+        self.clock = clock
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS leases ('
+            'key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL, result TEXT)'
+        )
+
+    def acquire(self, key):
+        """
+        Take the lease for key unless another live lease or fresh result exists
+        """
+        now = self.clock()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute('SELECT expires_at FROM leases WHERE key = ?', (key,)).fetchone()
+                acquired = row is None or row[0] <= now
+                if acquired:
+                    self._conn.execute(
+                        'INSERT OR REPLACE INTO leases (key, owner, expires_at, result) VALUES (?, ?, ?, NULL)',
+                        (key, self.owner, now + self.ttl)
+                    )
+                    self._conn.execute('DELETE FROM leases WHERE expires_at <= ?', (now,))
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return acquired
+
+    def complete(self, key, result):
+        """
+        Publish the result for a lease this process holds
+        """
+        with self._lock:
+            self._conn.execute(
+                'UPDATE leases SET result = ?, expires_at = ? WHERE key = ? AND owner = ?',
+                (json.dumps(result), self.clock() + self.ttl, key, self.owner)
+            )
+
+    def release(self, key):
+        """
+        Give up a lease without a result so a waiting process can take over
+        """
+        with self._lock:
+            self._conn.execute(
+                'DELETE FROM leases WHERE key = ? AND owner = ? AND result IS NULL', (key, self.owner)
+            )
+
+    def wait(self, key, timeout):
+        """
+        Poll for the result of another process; None if it never arrives
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT result, expires_at FROM leases WHERE key = ?', (key,)
+                ).fetchone()
+            if row is None or row[1] <= self.clock():
+                return None
+            if row[0] is not None:
+                return json.loads(row[0])
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(self.poll_interval)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
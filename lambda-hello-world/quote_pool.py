@@ -0,0 +1,136 @@
+"""
+Pre-generated pool of generic quotes for the Daily Quote Lambda function
+Anonymous requests take a quote from the pool instead of waiting on Bedrock.
+The store is a local SQLite file, standing in for a shared store.
+"""
+
+import sqlite3
+import logging
+import threading
+
+logger = logging.getLogger()
+
+
+class QuotePool:
+    """
+    FIFO pool of generic quotes persisted in SQLite
+
+    take() pops the oldest quote, refill() tops the pool back up to capacity
+    using a generator callable that returns one quote or raises
+    """
+
+    def __init__(self, path, capacity=50, low_watermark=10):
+        self.path = path
+        self.capacity = max(1, int(capacity))
+        self.low_watermark = min(max(0, int(low_watermark)), self.capacity)
+        self._lock = threading.Lock()
+        self._refill_lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS quotes (id INTEGER PRIMARY KEY AUTOINCREMENT, quote TEXT NOT NULL)'
+        )
+
+    def take(self):
+        """
+        Remove and return the oldest quote, or None if the pool is empty
+        """
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute('SELECT id, quote FROM quotes ORDER BY id LIMIT 1').fetchone()
+                if row is not None:
+                    self._conn.execute('DELETE FROM quotes WHERE id = ?', (row[0],))
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return row[1] if row else None
+
+    def add(self, quotes):
+        """
+        Append quotes to the pool
+        """
+        with self._lock:
+            self._conn.executemany('INSERT INTO quotes (quote) VALUES (?)', [(q,) for q in quotes])
+
+    def size(self):
+        """
+        Return the number of quotes currently in the pool
+        """
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM quotes').fetchone()[0]
+
+    def needs_refill(self):
+        """
+        Return True once the pool has dropped below its low watermark
+        """
+        return self.size() < self.low_watermark
+
+    def refill(self, generator, target=None):
+        """
+        Generate quotes until the pool holds target (default capacity) quotes
+        Stops at the first generator error so a throttled model is not hammered
+        Returns the number of quotes added
+        """
+        target = self.capacity if target is None else min(int(target), self.capacity)
+        if not self._refill_lock.acquire(blocking=False):
+            logger.info("Quote pool refill already running")
+            return 0
+
+        added = 0
+        try:
+            missing = target - self.size()
+            for _ in range(max(0, missing)):
+                try:
+                    quote = generator()
+                except Exception as e:
+                    logger.warning(f"Quote pool refill stopped: {str(e)}")
+                    break
+                self.add([quote])
+                added += 1
+        finally:
+            self._refill_lock.release()
+
+        logger.info(f"Quote pool refilled with {added} quotes")
+        return added
+
+    def refill_many(self, generate_many, target=None):
+        """
+        Top the pool up with one call to generate_many(count), which returns a
+        list of quotes (possibly shorter than count) and is free to run concurrently
+        Returns the number of quotes added
+        """
+        target = self.capacity if target is None else min(int(target), self.capacity)
+        if not self._refill_lock.acquire(blocking=False):
+            logger.info("Quote pool refill already running")
+            return 0
+
+        try:
+            missing = target - self.size()
+            quotes = list(generate_many(missing)) if missing > 0 else []
+            self.add(quotes)
+        except Exception as e:
+            logger.warning(f"Quote pool refill failed: {str(e)}")
+            quotes = []
+        finally:
+            self._refill_lock.release()
+
+        logger.info(f"Quote pool refilled with {len(quotes)} quotes")
+        return len(quotes)
+
+    def refill_in_background(self, generator, batch=False):
+        """
+        Start a daemon thread that refills the pool unless one is already running
+        With batch=True generator is used as refill_many's generate_many
+        Returns the thread, or None if a refill is in progress
+        """
+        if self._refill_lock.locked():
+            return None
+        target = self.refill_many if batch else self.refill
+        thread = threading.Thread(target=target, args=(generator,), daemon=True)
+        thread.start()
+        return thread
+
+    def close(self):
+        self._conn.close()
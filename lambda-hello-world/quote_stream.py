@@ -0,0 +1,69 @@
+"""
+Streaming helpers for the Daily Quote Lambda function
+Decodes Bedrock InvokeModelWithResponseStream events and
+encodes quote events as Server-Sent Events or newline-delimited JSON
+"""
+
+import json
+
+SSE_CONTENT_TYPE = 'text/event-stream'
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
+
+def iter_stream_text(response, parse_chunk=None):
+    """
+    Yield text deltas from an InvokeModelWithResponseStream response
+    parse_chunk(payload) extracts the text of one decoded chunk (Nova format by default)
+    """
+    parse_chunk = parse_chunk or _nova_chunk_text
+    for event in response['body']:
+        chunk = event.get('chunk')
+        if not chunk:
+            # Modeled stream errors arrive as events instead of chunks, keyed by
+            # their error code in camel case (throttlingException)
+            for key, value in event.items():
+                if key.endswith('Exception'):
+                    raise _stream_error(key, value)
+            continue
+        text = parse_chunk(json.loads(chunk['bytes']))
+        if text:
+            yield text
+
+
+def _stream_error(code, value):
+    # Raised as the ClientError the non-streaming call would have raised, so
+    # throttling checks and failover treat both the same way
+    from botocore.exceptions import ClientError
+
+    return ClientError(
+        {'Error': {'Code': code, 'Message': (value or {}).get('message', '')}},
+        'InvokeModelWithResponseStream'
+    )
+
+
+def _nova_chunk_text(payload):
+    return payload.get('contentBlockDelta', {}).get('delta', {}).get('text')
+
+
+def format_sse(event):
+    """
+    Encode an event dict ({'type': ..., ...}) as one Server-Sent Event
+    """
+    data = {key: value for key, value in event.items() if key != 'type'}
+    return f"event: {event['type']}\ndata: {json.dumps(data)}\n\n"
+
+
+def format_ndjson(event):
+    """
+    Encode an event dict as one line of newline-delimited JSON
+    """
+    return json.dumps(event) + '\n'
+
+
+def encode_events(events, fmt='sse'):
+    """
+    Encode a sequence of events into (content_type, body) for the chosen format
+    """
+    if fmt == 'ndjson':
+        return NDJSON_CONTENT_TYPE, ''.join(format_ndjson(event) for event in events)
+    return SSE_CONTENT_TYPE, ''.join(format_sse(event) for event in events)
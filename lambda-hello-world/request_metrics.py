@@ -0,0 +1,151 @@
+"""
+Per-request timing for the Daily Quote Lambda function
+Times the phases of one invocation and emits them as a single CloudWatch
+Embedded Metric Format (EMF) record, optionally for a sample of requests only
+"""
+
+import sys
+import json
+import time
+import random
+import threading
+from contextlib import contextmanager
+
+# Phases reported for every sampled invocation, in this order
+PHASES = ('parseEvent', 'sanitize', 'modelCall', 'parseResponse', 'fallback')
+
+_local = threading.local()
+
+
+class RequestTimer:
+    """
+    Accumulates exclusive time per phase for one invocation
+
+    Phases may nest (response parsing happens inside the model call); time
+    spent in the inner phase is not counted again for the outer one, so the
+    phases add up to at most the total.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.started = clock()
+        self.durations = {}
+        self.properties = {}
+        self._stack = []
+
+    def enter(self, phase):
+        now = self.clock()
+        if self._stack:
+            self._pause(now)
+        self._stack.append([phase, now])
+
+    def exit(self):
+        now = self.clock()
+        self._pause(now)
+        self._stack.pop()
+        if self._stack:
+            self._stack[-1][1] = now
+
+    def _pause(self, now):
+        phase, start = self._stack[-1]
+        self.durations[phase] = self.durations.get(phase, 0.0) + (now - start)
+
+    def set_property(self, key, value):
+        self.properties[key] = value
+
+    def total(self):
+        return self.clock() - self.started
+
+    def to_emf(self, namespace, dimensions=('Source',), timestamp=None):
+        """
+        Build the EMF record: phase durations in milliseconds plus properties
+        """
+        record = {
+            '_aws': {
+                'Timestamp': int((timestamp or time.time()) * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': namespace,
+                    'Dimensions': [list(dimensions)],
+                    'Metrics': [
+                        {'Name': f"{phase}Ms", 'Unit': 'Milliseconds'}
+                        for phase in PHASES + ('total',)
+                    ]
+                }]
+            }
+        }
+        for phase in PHASES:
+            record[f"{phase}Ms"] = round(self.durations.get(phase, 0.0) * 1000, 3)
+        record['totalMs'] = round(self.total() * 1000, 3)
+        for dimension in dimensions:
+            record.setdefault(dimension, 'unknown')
+        record.update(self.properties)
+        return record
+
+
+class RequestMetrics:
+    """
+    Starts a timer per invocation and writes the sampled ones to stdout as EMF
+
+    sample_rate is the share of invocations that are timed and emitted
+    (0 disables metrics, 1 records every request).
+    """
+
+    def __init__(self, namespace='DailyQuote', sample_rate=1.0, stream=None, rng=None):
+        self.namespace = namespace
+        self.sample_rate = sample_rate
+        self.stream = stream
+        self._random = rng or random.Random()
+
+    @contextmanager
+    def record(self):
+        """
+        Time the enclosed invocation; yields the timer, or None when not sampled
+        """
+        if self.sample_rate <= 0 or (self.sample_rate < 1 and self._random.random() >= self.sample_rate):
+            yield None
+            return
+
+        timer = RequestTimer()
+        previous = getattr(_local, 'timer', None)
+        _local.timer = timer
+        try:
+            yield timer
+        finally:
+            _local.timer = previous
+            self.emit(timer)
+
+    def emit(self, timer):
+        stream = self.stream or sys.stdout
+        stream.write(json.dumps(timer.to_emf(self.namespace)) + '\n')
+
+
+def current_timer():
+    """
+    Return the timer of the invocation running on this thread, if it is sampled
+    """
+    return getattr(_local, 'timer', None)
+
+
+@contextmanager
+def phase(name):
+    """
+    Attribute the enclosed block to a phase of the current invocation
+    """
+    timer = getattr(_local, 'timer', None)
+    if timer is None:
+        yield
+        return
+    timer.enter(name)
+    try:
+        yield
+    finally:
+        timer.exit()
+
+
+def set_property(key, value):
+    """
+    Attach a property (or dimension value) to the current invocation's record
+    """
+    timer = getattr(_local, 'timer', None)
+    if timer is not None:
+        timer.set_property(key, value)
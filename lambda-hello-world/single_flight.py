@@ -0,0 +1,194 @@
+"""
+Request coalescing for the Daily Quote Lambda function
+Concurrent requests for the same key share one in-flight generation. Within a
+process this works across threads and asyncio tasks; across processes an
+optional lease (see quote_lease.SQLiteLease) lets one process generate while
+the others wait for its result.
+"""
+
+import logging
+import threading
+
+logger = logging.getLogger()
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.shared = False
+        # Set when a streaming leader was closed before it produced a result
+        self.abandoned = False
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls per key
+
+    do(key, fn) runs fn once for all threads asking for the same key at the
+    same time and returns (result, shared), where shared is True for callers
+    that received another caller's result. Errors propagate to every waiter.
+    With a lease, the leader of each process first tries to take the lease
+    for the key and otherwise waits for the process that holds it.
+    """
+
+    def __init__(self, lease=None, wait_timeout=30.0):
+        self.lease = lease
+        self.wait_timeout = wait_timeout
+        self.leaders = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._async_calls = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            if not call.done.wait(self.wait_timeout) or call.abandoned:
+                logger.warning(f"In-flight quote {key} did not finish, generating locally")
+                return fn(), False
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result, call.shared = self._run_leader(key, fn)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, call.shared
+
+    def _run_leader(self, key, fn):
+        if self.lease is None:
+            return fn(), False
+
+        if not self.lease.acquire(key):
+            result = self.lease.wait(key, self.wait_timeout)
+            if result is not None:
+                with self._lock:
+                    self.coalesced += 1
+                return result, True
+            # The other process failed or timed out; generate here instead
+            logger.info(f"Lease for {key} was not fulfilled, generating locally")
+            return fn(), False
+
+        try:
+            result = fn()
+        except BaseException:
+            self.lease.release(key)
+            raise
+        self.lease.complete(key, result)
+        return result, False
+
+    def do_stream(self, key, stream_fn):
+        """
+        Generator variant of do() for results that are produced incrementally
+
+        The leader re-yields everything stream_fn() yields and shares the
+        generator's return value; callers that join an in-flight call (from
+        do() or do_stream()) yield nothing. Use it as
+        `result, shared = yield from flight.do_stream(key, stream_fn)`.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            if not call.done.wait(self.wait_timeout) or call.abandoned:
+                logger.warning(f"In-flight quote {key} did not finish, generating locally")
+                return (yield from stream_fn()), False
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result, call.shared = yield from self._stream_leader(key, stream_fn)
+        except GeneratorExit:
+            # Closed mid-stream: let waiters generate for themselves
+            call.abandoned = True
+            raise
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, call.shared
+
+    def _stream_leader(self, key, stream_fn):
+        if self.lease is None:
+            return (yield from stream_fn()), False
+
+        if not self.lease.acquire(key):
+            result = self.lease.wait(key, self.wait_timeout)
+            if result is not None:
+                with self._lock:
+                    self.coalesced += 1
+                return result, True
+            logger.info(f"Lease for {key} was not fulfilled, generating locally")
+            return (yield from stream_fn()), False
+
+        try:
+            result = yield from stream_fn()
+        except BaseException:
+            self.lease.release(key)
+            raise
+        self.lease.complete(key, result)
+        return result, False
+
+    async def do_async(self, key, coroutine_fn):
+        """
+        Async variant of do() for tasks on one event loop (in-process only)
+        """
+        import asyncio
+
+        future = self._async_calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._async_calls[key] = future
+        self.leaders += 1
+        try:
+            result = await coroutine_fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception retrieved in case nobody was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            del self._async_calls[key]
+
+    def stats(self):
+        with self._lock:
+            return {
+                'leaders': self.leaders,
+                'coalesced': self.coalesced,
+                'inFlight': len(self._calls) + len(self._async_calls)
+            }
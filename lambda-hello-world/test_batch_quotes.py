@@ -0,0 +1,131 @@
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+import lambda_function
+from lambda_function import lambda_handler, sanitize_name_input
+from batch_quotes import dedupe_names, build_batch_request, parse_batch_response
+from model_router import NovaAdapter, TitanAdapter
+
+
+def nova_response(text):
+    """Build a mocked Nova 2 invoke_model response"""
+    response = {'body': MagicMock()}
+    response['body'].read.return_value = json.dumps({
+        'output': {'message': {'content': [{'text': text}]}}
+    }).encode()
+    return response
+
+
+def batch_event(names):
+    return {'httpMethod': 'POST', 'queryStringParameters': None, 'body': json.dumps({'names': names})}
+
+
+class TestBatchHelpers:
+    """Unit tests for batch prompt building and parsing"""
+
+    def test_dedupe_names_sanitizes_and_keeps_order(self):
+        """Test that names are sanitized, deduplicated and empties dropped"""
+        names = dedupe_names(['Alice', 'Bob!', '  Alice ', '', None, 'Bob', 'Carol'], sanitize_name_input)
+        assert names == ['Alice', 'Bob', 'Carol']
+
+    def test_batch_request_lists_every_name(self):
+        """Test that the prompt contains every name and scales the token budget"""
+        body = build_batch_request(['Alice', 'Bob'], NovaAdapter('nova'))
+        prompt = body['messages'][0]['content'][0]['text']
+
+        assert '- Alice' in prompt
+        assert '- Bob' in prompt
+        assert body['inferenceConfig']['max_new_tokens'] > 100
+
+    def test_batch_request_in_titan_format(self):
+        """Test that the batch prompt is wrapped in the adapter's request format"""
+        body = build_batch_request(['Alice'], TitanAdapter('titan'))
+
+        assert '- Alice' in body['inputText']
+        assert body['textGenerationConfig']['maxTokenCount'] == 90
+
+    def test_parse_batch_response_handles_fenced_json(self):
+        """Test parsing JSON wrapped in markdown fences with re-cased keys"""
+        text = '```json\n{"alice": "Alice, shine on. Keep going.", "Bob": "Bob, you rock. Stay bold."}\n```'
+
+        quotes = parse_batch_response(text, ['Alice', 'Bob'])
+
+        assert quotes == {'Alice': 'Alice, shine on. Keep going.', 'Bob': 'Bob, you rock. Stay bold.'}
+
+    def test_parse_batch_response_ignores_garbage(self):
+        """Test that unparseable output yields an empty map"""
+        assert parse_batch_response('Sorry, I cannot do that.', ['Alice']) == {}
+
+
+class TestBatchHandler:
+    """Tests for the batch mode of lambda_handler"""
+
+    def setup_method(self):
+        lambda_function.quote_cache.clear()
+        lambda_function.model_router.reset()
+
+    def teardown_method(self):
+        lambda_function.quote_cache.clear()
+
+    @patch('lambda_function.bedrock_client')
+    def test_batch_uses_single_model_call(self, mock_bedrock):
+        """Test that all names are generated in one invoke_model call"""
+        mock_bedrock.invoke_model.return_value = nova_response(
+            json.dumps({'Alice': 'Alice quote.', 'Bob': 'Bob quote.'})
+        )
+
+        response = lambda_handler(batch_event(['Alice', 'Bob', 'Alice']), None)
+        body = json.loads(response['body'])
+
+        assert response['statusCode'] == 200
+        assert body['quotes'] == {'Alice': 'Alice quote.', 'Bob': 'Bob quote.'}
+        assert body['batch']['requested'] == 3
+        assert body['batch']['unique'] == 2
+        assert body['batch']['fromBatch'] == 2
+        mock_bedrock.invoke_model.assert_called_once()
+
+    @patch('lambda_function.bedrock_client')
+    def test_dropped_names_fall_back_individually(self, mock_bedrock):
+        """Test that names missing from the model output are generated one by one"""
+        mock_bedrock.invoke_model.side_effect = [
+            nova_response(json.dumps({'Alice': 'Alice quote.'})),
+            nova_response('Bob individual quote.')
+        ]
+
+        body = json.loads(lambda_handler(batch_event(['Alice', 'Bob']), None)['body'])
+
+        assert body['quotes']['Bob'] == 'Bob individual quote.'
+        assert body['batch']['individual'] == 1
+        assert mock_bedrock.invoke_model.call_count == 2
+
+    @patch('lambda_function.bedrock_client')
+    def test_failed_individual_generation_uses_fallback(self, mock_bedrock):
+        """Test that a name still gets a fallback quote when every call fails"""
+        mock_bedrock.invoke_model.side_effect = Exception('Bedrock unavailable')
+
+        body = json.loads(lambda_handler(batch_event(['Dana']), None)['body'])
+
+        assert 'Dana' in body['quotes']['Dana']
+
+    @patch('lambda_function.bedrock_client')
+    def test_cached_names_are_not_sent_to_model(self, mock_bedrock):
+        """Test that only cache misses are packed into the prompt"""
+        lambda_function.quote_cache.set('Alice', 'Cached Alice quote.')
+        mock_bedrock.invoke_model.return_value = nova_response(json.dumps({'Bob': 'Bob quote.'}))
+
+        body = json.loads(lambda_handler(batch_event(['Alice', 'Bob']), None)['body'])
+
+        prompt = json.loads(mock_bedrock.invoke_model.call_args.kwargs['body'])['messages'][0]['content'][0]['text']
+        assert '- Alice' not in prompt
+        assert body['quotes']['Alice'] == 'Cached Alice quote.'
+        assert body['batch']['fromCache'] == 1
+
+    def test_invalid_names_returns_400(self):
+        """Test that a non-list names value is rejected"""
+        response = lambda_handler(batch_event('Alice'), None)
+        assert response['statusCode'] == 400
+
+    def test_too_many_names_returns_400(self):
+        """Test the batch size limit"""
+        response = lambda_handler(batch_event([f'Person{i}' for i in range(100)]), None)
+        assert response['statusCode'] == 400
@@ -0,0 +1,154 @@
+import json
+import asyncio
+import pytest
+from unittest.mock import patch
+import lambda_function
+from lambda_function import generate_quote, set_bedrock_client
+from bedrock_engine import AsyncBedrockEngine, TokenBucket, backoff_delay, is_throttling_error, estimate_tokens
+from fake_bedrock import FakeBedrockClient, throttling_error
+from model_router import ModelRouter, NovaAdapter, TitanAdapter
+
+
+def make_engine(client, **kwargs):
+    options = dict(max_concurrency=4, requests_per_minute=None, tokens_per_minute=None,
+                   max_retries=3, base_delay=0.0, max_delay=0.0)
+    options.update(kwargs)
+    return AsyncBedrockEngine(lambda: client, **options)
+
+
+class TestBackoffAndBucket:
+    """Unit tests for the rate limiting and retry helpers"""
+
+    def test_backoff_delay_is_capped_full_jitter(self):
+        """Test that delays stay within [0, min(cap, base * 2^attempt)]"""
+        assert backoff_delay(0, base_delay=1, max_delay=8, rng=lambda: 1.0) == 1
+        assert backoff_delay(3, base_delay=1, max_delay=8, rng=lambda: 1.0) == 8
+        assert backoff_delay(10, base_delay=1, max_delay=8, rng=lambda: 0.5) == 4
+        assert backoff_delay(2, base_delay=1, max_delay=8, rng=lambda: 0.0) == 0
+
+    def test_is_throttling_error(self):
+        """Test that only retryable Bedrock errors are classified as throttling"""
+        assert is_throttling_error(throttling_error()) is True
+        assert is_throttling_error(Exception('boom')) is False
+
+    def test_token_bucket_reports_wait_time(self, clock):
+        """Test that an empty bucket reports how long to wait for a refill"""
+        bucket = TokenBucket(60, capacity=2, clock=clock)
+
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == pytest.approx(1.0)
+
+        clock.now = 1.0
+        assert bucket.try_acquire() == 0
+
+    def test_estimate_tokens(self):
+        """Test the rough token estimate used for the TPM bucket"""
+        body = {'messages': [{'content': [{'text': 'x' * 400}]}], 'inferenceConfig': {'max_new_tokens': 100}}
+        assert estimate_tokens(body) == 200
+
+    def test_estimate_tokens_for_every_adapter(self):
+        """Test that Nova and Titan bodies for the same prompt cost the same"""
+        for adapter in (NovaAdapter('nova'), TitanAdapter('titan')):
+            body = adapter.build_request('x' * 400, max_tokens=100)
+            assert estimate_tokens(body) == 200
+
+
+class TestAsyncBedrockEngine:
+    """Tests for the concurrent invocation engine"""
+
+    def test_run_all_returns_results_in_order(self):
+        """Test that every request gets its decoded response body"""
+        fake = FakeBedrockClient(responder=lambda model, body: body['messages'][0]['content'][0]['text'].upper())
+        engine = make_engine(fake)
+        bodies = [{'messages': [{'content': [{'text': f'q{i}'}]}]} for i in range(6)]
+
+        results = engine.run_all('model', bodies)
+
+        texts = [r['output']['message']['content'][0]['text'] for r in results]
+        assert texts == [f'Q{i}' for i in range(6)]
+
+    def test_throttling_is_retried(self):
+        """Test that throttled calls are retried until they succeed"""
+        fake = FakeBedrockClient(throttle_rate=0.5, seed=7)
+        engine = make_engine(fake, max_retries=20)
+
+        results = engine.run_all('model', [{}] * 10)
+
+        assert not any(isinstance(r, Exception) for r in results)
+        assert fake.throttled > 0
+        assert engine.throttle_count == fake.throttled
+
+    def test_retries_are_bounded(self):
+        """Test that persistent throttling surfaces as an exception"""
+        engine = make_engine(FakeBedrockClient(throttle_rate=1.0), max_retries=2)
+
+        results = engine.run_all('model', [{}])
+
+        assert is_throttling_error(results[0])
+        assert engine.throttle_count == 2
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrency calls are in flight"""
+        fake = FakeBedrockClient(latency=0.02)
+        in_flight = []
+        peak = []
+        original = fake.invoke_model
+
+        def tracking_invoke(**kwargs):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            try:
+                return original(**kwargs)
+            finally:
+                in_flight.pop()
+
+        fake.invoke_model = tracking_invoke
+        engine = make_engine(fake, max_concurrency=2)
+        engine.run_all('model', [{}] * 8)
+
+        assert max(peak) <= 2
+
+    def test_request_bucket_limits_rate(self):
+        """Test that the RPM bucket delays calls beyond its burst capacity"""
+        engine = make_engine(FakeBedrockClient(), requests_per_minute=600)
+        engine.request_bucket.tokens = 0
+
+        async def timed():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await engine.invoke('model', {})
+            return loop.time() - start
+
+        assert asyncio.run(timed()) >= 0.08
+
+
+class TestSynchronousRetries:
+    """Tests for the retry loop of the single-quote path"""
+
+    @patch('lambda_function.time.sleep')
+    def test_generate_quote_retries_throttling(self, mock_sleep):
+        """Test that a throttled first call is retried instead of falling back"""
+        fake = FakeBedrockClient()
+        calls = []
+        original = fake.invoke_model
+
+        def flaky_invoke(**kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                raise throttling_error()
+            return original(**kwargs)
+
+        fake.invoke_model = flaky_invoke
+        # A single model leaves nothing to fail over to, so the retry loop handles it
+        router = ModelRouter([NovaAdapter('model')], is_throttle=is_throttling_error)
+        previous = set_bedrock_client(fake)
+        try:
+            with patch.object(lambda_function, 'model_router', router):
+                quote, source = generate_quote(None)
+        finally:
+            set_bedrock_client(previous)
+
+        assert source == 'bedrock'
+        assert len(calls) == 2
+        mock_sleep.assert_called_once()
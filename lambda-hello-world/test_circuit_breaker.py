@@ -0,0 +1,127 @@
+import json
+import pytest
+from unittest.mock import patch
+import lambda_function
+from lambda_function import lambda_handler, generate_quote, set_bedrock_client
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+from bedrock_engine import AsyncBedrockEngine
+from fake_bedrock import FakeBedrockClient
+
+
+class TestCircuitBreaker:
+    """Unit tests for the circuit breaker state machine"""
+
+    def test_opens_after_consecutive_failures(self, clock):
+        """Test that the breaker trips at the failure threshold"""
+        breaker = CircuitBreaker(failure_threshold=3, cooldown=10, clock=clock)
+
+        for _ in range(2):
+            assert breaker.allow_request()
+            breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.trips == 1
+        assert breaker.allow_request() is False
+        assert breaker.short_circuits == 1
+
+    def test_success_resets_failure_count(self, clock):
+        """Test that only consecutive failures count"""
+        breaker = CircuitBreaker(failure_threshold=2, clock=clock)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_single_probe(self, clock):
+        """Test that after the cool-down exactly one probe is let through"""
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.allow_request() is True
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request() is False
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request() is True
+
+    def test_failed_probe_reopens(self, clock):
+        """Test that a throttled probe re-opens the circuit for another cool-down"""
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.trips == 2
+        clock.now = 15
+        assert breaker.allow_request() is False
+
+    def test_release_frees_probe_slot(self, clock):
+        """Test that a non-throttling error lets the next request probe"""
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+
+        assert breaker.allow_request()
+        breaker.release()
+        assert breaker.allow_request()
+
+    def test_engine_fails_fast_when_open(self, clock):
+        """Test that the async engine raises CircuitOpenError without calling Bedrock"""
+        breaker = CircuitBreaker(failure_threshold=1, clock=clock)
+        breaker.record_failure()
+        fake = FakeBedrockClient()
+        engine = AsyncBedrockEngine(lambda: fake, requests_per_minute=None, tokens_per_minute=None, breaker=breaker)
+
+        results = engine.run_all('model', [{}])
+
+        assert isinstance(results[0], CircuitOpenError)
+        assert fake.call_count == 0
+
+
+class TestHandlerCircuitBreaker:
+    """Tests for the breaker inside the quote path"""
+
+    def setup_method(self):
+        lambda_function.bedrock_breaker.reset()
+        lambda_function.model_router.reset()
+        lambda_function.quote_cache.clear()
+
+    def teardown_method(self):
+        lambda_function.bedrock_breaker.reset()
+        lambda_function.model_router.reset()
+
+    @patch('lambda_function.time.sleep')
+    def test_throttling_trips_breaker_and_short_circuits(self, mock_sleep):
+        """Test that once open, requests reach the fallback without calling Bedrock"""
+        fake = FakeBedrockClient(throttle_rate=1.0)
+        previous = set_bedrock_client(fake)
+        try:
+            for _ in range(3):
+                generate_quote('Alice')
+            calls_when_open = fake.call_count
+            quote, source = generate_quote('Alice')
+        finally:
+            set_bedrock_client(previous)
+
+        assert lambda_function.bedrock_breaker.state == CircuitBreaker.OPEN
+        assert source == 'fallback'
+        assert 'Alice' in quote
+        assert fake.call_count == calls_when_open
+
+    def test_breaker_state_in_response(self):
+        """Test that breaker state and trip counts are exposed in the JSON body"""
+        lambda_function.bedrock_breaker.record_failure()
+
+        body = json.loads(lambda_handler({}, None)['body'])
+
+        assert body['circuit']['state'] == 'closed'
+        assert body['circuit']['consecutiveFailures'] == 1
+        assert body['circuit']['trips'] == 0
@@ -0,0 +1,44 @@
+import sys
+import subprocess
+from unittest.mock import patch, MagicMock
+import lambda_function
+
+
+class TestLazyBedrockClient:
+    """Tests for lazy, cached Bedrock client construction"""
+
+    def test_import_does_not_load_boto3_or_asyncio(self):
+        """Test that importing the handler keeps heavy modules off the cold-start path"""
+        code = (
+            "import sys, lambda_function; "
+            "print(lambda_function.bedrock_client is None, 'boto3' in sys.modules, "
+            "'botocore' in sys.modules, 'asyncio' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.split() == ['True', 'False', 'False', 'False']
+
+    def test_client_is_created_once_and_cached(self):
+        """Test that get_bedrock_client builds the client on first use only"""
+        previous = lambda_function.set_bedrock_client(None)
+        try:
+            with patch('lambda_function.create_bedrock_client', return_value=MagicMock()) as mock_create:
+                first = lambda_function.get_bedrock_client()
+                second = lambda_function.get_bedrock_client()
+        finally:
+            lambda_function.set_bedrock_client(previous)
+
+        assert first is second
+        mock_create.assert_called_once()
+
+    def test_client_config_is_tuned(self):
+        """Test the botocore configuration used for the Bedrock client"""
+        with patch('boto3.client') as mock_client:
+            lambda_function.create_bedrock_client()
+
+        config = mock_client.call_args.kwargs['config']
+        assert mock_client.call_args.args == ('bedrock-runtime',)
+        assert config.region_name == 'us-east-1'
+        assert config.tcp_keepalive is True
+        assert config.connect_timeout == 2
+        assert config.retries['max_attempts'] == 1
@@ -0,0 +1,64 @@
+import timeit
+import pytest
+import fallback_corpus
+from fallback_corpus import FallbackCorpus, pack_corpus, read_source, fallback_quote, CORPUS_PATH
+
+
+@pytest.fixture
+def corpus():
+    return FallbackCorpus(pack_corpus([
+        ('Generic one.', 'Hey ', ', one.'),
+        ('Generic two.', '', ', two.'),
+        ('Generic three.', 'Three for ', '.'),
+    ]))
+
+
+class TestFallbackCorpus:
+    """Unit tests for the packed fallback quote corpus"""
+
+    def test_entries_round_trip(self, corpus):
+        """Test that packed entries unpack to the same text"""
+        assert corpus.count == 3
+        assert corpus.entry(2) == ('Generic three.', 'Three for ', '.')
+
+    def test_name_is_templated_into_slot(self, corpus):
+        """Test that personalized quotes wrap the name and anonymous ones use the generic text"""
+        slot = corpus.slot_for('Alice', '2024-03-10')
+        generic, prefix, suffix = corpus.entry(slot)
+
+        assert corpus.quote('Alice', '2024-03-10') == f"{prefix}Alice{suffix}"
+        assert corpus.quote(None, '2024-03-10') == corpus.entry(corpus.slot_for(None, '2024-03-10'))[0]
+
+    def test_selection_is_deterministic_but_varied(self):
+        """Test that a name keeps its quote for the day while names and days spread over the corpus"""
+        corpus = FallbackCorpus.open()
+        names = [f"User{i}" for i in range(200)]
+
+        assert corpus.slot_for('Alice', '2024-03-10') == corpus.slot_for('alice ', '2024-03-10')
+        assert len({corpus.slot_for(name, '2024-03-10') for name in names}) > corpus.count // 2
+        assert len({corpus.slot_for('Alice', f"2024-03-{day:02d}") for day in range(1, 29)}) > 10
+
+    def test_bundled_binary_matches_source(self):
+        """Test that fallback_quotes.bin was rebuilt after editing fallback_quotes.txt"""
+        with open(CORPUS_PATH, 'rb') as f:
+            assert f.read() == pack_corpus(read_source())
+
+    def test_corrupt_file_is_rejected(self):
+        """Test that a file without the corpus header is refused"""
+        with pytest.raises(ValueError):
+            FallbackCorpus(b'JUNK' + bytes(16))
+
+    def test_missing_corpus_uses_built_in_quote(self, monkeypatch, tmp_path):
+        """Test the built-in quote when the corpus cannot be loaded"""
+        monkeypatch.setattr(fallback_corpus, 'CORPUS_PATH', str(tmp_path / 'missing.bin'))
+        monkeypatch.setattr(fallback_corpus, '_corpus', None)
+
+        assert 'Carol' in fallback_quote('Carol')
+        assert fallback_quote() == fallback_corpus.DEFAULT_GENERIC
+
+    def test_fallback_is_sub_millisecond(self):
+        """Test that a warm fallback lookup stays well under a millisecond"""
+        fallback_quote('Alice')
+        per_call = timeit.timeit(lambda: fallback_quote('Alice'), number=1000) / 1000
+
+        assert per_call < 0.001
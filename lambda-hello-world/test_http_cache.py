@@ -0,0 +1,102 @@
+import json
+import calendar
+from datetime import datetime
+from unittest.mock import patch
+import lambda_function
+from lambda_function import lambda_handler
+from http_cache import make_etag, etag_matches, get_header, cache_headers
+
+# 2024-03-10 18:00:00 UTC, six hours before midnight
+NOW = calendar.timegm(datetime(2024, 3, 10, 18, 0, 0).timetuple())
+
+
+def get_event(name=None, if_none_match=None):
+    headers = {'if-none-match': if_none_match} if if_none_match else None
+    return {
+        'httpMethod': 'GET',
+        'queryStringParameters': {'name': name} if name else None,
+        'headers': headers,
+        'body': None
+    }
+
+
+class TestHttpCacheHelpers:
+    """Unit tests for ETag and Cache-Control helpers"""
+
+    def test_etag_is_deterministic_per_quote_and_day(self):
+        """Test that the ETag only depends on the quote text and the UTC date"""
+        assert make_etag('Shine on.', '2024-03-10') == make_etag('Shine on.', '2024-03-10')
+        assert make_etag('Shine on.', '2024-03-10') != make_etag('Shine on.', '2024-03-11')
+        assert make_etag('Shine on.', '2024-03-10') != make_etag('Keep going.', '2024-03-10')
+        assert make_etag('Shine on.').startswith('"')
+
+    def test_etag_matching(self):
+        """Test If-None-Match lists, weak validators and the wildcard"""
+        etag = make_etag('Shine on.', '2024-03-10')
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches('*', etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+    def test_get_header_ignores_case(self):
+        """Test header lookup on API Gateway events"""
+        assert get_header({'headers': {'If-None-Match': '"a"'}}, 'if-none-match') == '"a"'
+        assert get_header({'headers': None}, 'If-None-Match') is None
+
+    def test_cache_control_until_midnight(self):
+        """Test public/private max-age up to midnight UTC and no-cache for fallbacks"""
+        anonymous = cache_headers('Shine on.', False, 'bedrock', now=NOW)
+        personalized = cache_headers('Shine on.', True, 'cache', now=NOW)
+        fallback = cache_headers('Shine on.', False, 'fallback', now=NOW)
+
+        assert anonymous['Cache-Control'] == 'public, max-age=21600'
+        assert anonymous['Expires'] == 'Mon, 11 Mar 2024 00:00:00 GMT'
+        assert personalized['Cache-Control'] == 'private, max-age=21600'
+        assert fallback['Cache-Control'] == 'no-cache'
+        assert 'Expires' not in fallback
+
+
+class TestConditionalGet:
+    """Tests for caching headers and 304 responses from lambda_handler"""
+
+    def setup_method(self):
+        lambda_function.quote_cache.clear()
+
+    def teardown_method(self):
+        lambda_function.quote_cache.clear()
+
+    @patch('lambda_function.generate_quote')
+    def test_matching_etag_returns_304_without_model_call(self, mock_generate):
+        """Test that a revalidation with the current ETag is answered from the cache"""
+        mock_generate.return_value = ('Alice, shine on. Keep going.', 'bedrock')
+        first = lambda_handler(get_event('Alice'), None)
+        etag = first['headers']['ETag']
+
+        second = lambda_handler(get_event('Alice', if_none_match=etag), None)
+
+        assert second['statusCode'] == 304
+        assert second['body'] == ''
+        assert second['headers']['ETag'] == etag
+        assert second['headers']['Cache-Control'].startswith('private, max-age=')
+        mock_generate.assert_called_once()
+
+    @patch('lambda_function.generate_quote')
+    def test_stale_etag_gets_full_response(self, mock_generate):
+        """Test that an outdated ETag gets today's quote with a new ETag"""
+        mock_generate.return_value = ('Shine on. Keep going.', 'bedrock')
+        response = lambda_handler(get_event(if_none_match='"yesterday"'), None)
+        body = json.loads(response['body'])
+
+        assert response['statusCode'] == 200
+        assert response['headers']['ETag'] == make_etag(body['quote'])
+        assert response['headers']['Cache-Control'].startswith('public, max-age=')
+
+    @patch('lambda_function.generate_quote')
+    def test_post_responses_carry_no_cache_headers(self, mock_generate):
+        """Test that only GET responses are marked cacheable"""
+        mock_generate.return_value = ('Shine on. Keep going.', 'bedrock')
+        response = lambda_handler({'httpMethod': 'POST', 'body': json.dumps({'name': 'Bob'})}, None)
+
+        assert 'ETag' not in response['headers']
+        assert 'Cache-Control' not in response['headers']
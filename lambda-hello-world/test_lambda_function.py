@@ -1,12 +1,34 @@
 import json
 import pytest
 from unittest.mock import patch, MagicMock
-from lambda_function import lambda_handler, get_energizing_quote
+import lambda_function
+from lambda_function import lambda_handler, get_energizing_quote, get_fallback_quote
+from bedrock_engine import is_throttling_error
+from model_router import ModelRouter, TitanAdapter
 
 
 class TestLambdaFunction:
     """Unit tests for the Daily Quote Lambda function"""
     
+    def setup_method(self):
+        lambda_function.quote_cache.clear()
+        lambda_function.model_router.reset()
+        lambda_function.bedrock_breaker.reset()
+        # The Bedrock mocks below answer in Titan's format, so route to Titan only
+        self.router_patch = patch.object(
+            lambda_function, 'model_router',
+            ModelRouter([TitanAdapter('amazon.titan-text-express-v1')], is_throttle=is_throttling_error)
+        )
+        self.router_patch.start()
+        # Drop the cached client so each test's boto3.client mock is picked up
+        self.previous_client = lambda_function.set_bedrock_client(None)
+    
+    def teardown_method(self):
+        lambda_function.set_bedrock_client(self.previous_client)
+        self.router_patch.stop()
+        lambda_function.quote_cache.clear()
+        lambda_function.bedrock_breaker.reset()
+    
     @patch('boto3.client')
     def test_lambda_handler_returns_200(self, mock_boto_client):
         """Test that the function returns a 200 status code"""
@@ -54,7 +76,7 @@ class TestLambdaFunction:
         body = json.loads(response['body'])
         
         assert 'quote' in body
-        assert len(body['quote']) > 0
+        assert body['quote'] == test_quote
         assert body['model'] == 'amazon.titan-text-express-v1'
     
     @patch('boto3.client')
@@ -136,9 +158,9 @@ class TestLambdaFunction:
         assert response['statusCode'] == 200
         body = json.loads(response['body'])
         assert 'quote' in body
-        # Should return a fallback quote
+        # Should return today's fallback quote from the offline corpus
         assert len(body['quote']) > 0
-        assert "Every new day" in body['quote'] or "Success is not final" in body['quote']
+        assert body['quote'] == get_fallback_quote()
     
     @patch('lambda_function.bedrock_client')
     def test_get_energizing_quote_direct(self, mock_bedrock):
@@ -0,0 +1,43 @@
+import os
+import sys
+import random
+import lambda_function
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks'))
+
+from load_benchmark import build_events, parse_mix, percentile, run_load  # noqa: E402
+
+
+class TestLoadBenchmark:
+    """Tests for the load benchmark harness"""
+
+    def test_parse_mix(self):
+        """Test that method weights are parsed and validated"""
+        assert parse_mix('get=3,POST=1') == {'GET': 3.0, 'POST': 1.0}
+
+    def test_events_follow_mix(self):
+        """Test that only requested methods appear and anonymous events carry no name"""
+        events = build_events(50, {'POST': 1}, 0.0, 5, random.Random(1))
+
+        assert {event['httpMethod'] for event in events} == {'POST'}
+        assert all(event['body'] == '{}' for event in events)
+
+    def test_percentile_nearest_rank(self):
+        """Test the nearest-rank percentile"""
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([7], 95) == 7
+
+    def test_run_load_report(self):
+        """Test a small run reports percentiles, throughput and hit rates and restores state"""
+        previous_cache = lambda_function.quote_cache
+        report = run_load(requests=40, mix={'GET': 1, 'OPTIONS': 1}, name_pool=2, cache_size=4)
+
+        assert report['latencyMs']['count'] == 40
+        assert report['latencyMs']['p50'] <= report['latencyMs']['p99']
+        assert report['requestsPerSecond'] > 0
+        assert report['statusCodes'] == {'200': 40}
+        assert 0 < report['cache']['hitRate'] < 1
+        assert report['breaker']['shortCircuitRate'] == 0.0
+        assert lambda_function.quote_cache is previous_cache
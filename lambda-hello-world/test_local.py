@@ -6,7 +6,7 @@ Run this script to quickly test the function locally
 
 import json
 from unittest.mock import patch, MagicMock
-from lambda_function import lambda_handler
+from lambda_function import lambda_handler, get_fallback_quote
 
 
 def test_function():
@@ -132,8 +132,8 @@ def test_fallback_behavior():
             assert response['statusCode'] == 200
             assert 'quote' in body
             assert len(body['quote']) > 0
-            # Should contain fallback quote
-            assert "Every new day" in body['quote'] or "Success is not final" in body['quote']
+            # Should contain today's fallback quote from the offline corpus
+            assert body['quote'] == get_fallback_quote()
             
             print("🎉 Fallback test passed!")
             return True
@@ -0,0 +1,167 @@
+import json
+import pytest
+from unittest.mock import patch
+import lambda_function
+from lambda_function import generate_quote, set_bedrock_client
+from model_router import ModelRouter, NovaAdapter, TitanAdapter, adapter_for
+from bedrock_engine import is_throttling_error
+from fake_bedrock import FakeBedrockClient, throttling_error
+from quote_stream import iter_stream_text
+
+
+def make_router(clock, **kwargs):
+    adapters = [NovaAdapter('nova-lite'), NovaAdapter('nova-micro'), TitanAdapter('amazon.titan-text-express-v1')]
+    return ModelRouter(adapters, is_throttle=is_throttling_error, clock=clock, **kwargs)
+
+
+class TestAdapters:
+    """Unit tests for the per-model request and response formats"""
+
+    def test_adapter_for_model_ids(self):
+        """Test that inference profiles and foundation model IDs map to the right adapter"""
+        assert isinstance(adapter_for('us.amazon.nova-2-lite-v1:0'), NovaAdapter)
+        assert isinstance(adapter_for('amazon.nova-micro-v1:0'), NovaAdapter)
+        assert isinstance(adapter_for('amazon.titan-text-express-v1'), TitanAdapter)
+        with pytest.raises(ValueError):
+            adapter_for('anthropic.claude-v2')
+
+    def test_titan_round_trip(self):
+        """Test the Titan inputText request and results[0].outputText response"""
+        adapter = TitanAdapter('amazon.titan-text-express-v1')
+        body = adapter.build_request('Hello', max_tokens=50, stop_sequences=['\n\n'])
+
+        assert body['inputText'] == 'Hello'
+        assert body['textGenerationConfig']['maxTokenCount'] == 50
+        assert body['textGenerationConfig']['stopSequences'] == ['\n\n']
+        assert adapter.parse_response({'results': [{'outputText': 'Hi there'}]}) == 'Hi there'
+
+    def test_titan_stream_chunks(self):
+        """Test that Titan stream chunks decode with the adapter's chunk parser"""
+        adapter = TitanAdapter('amazon.titan-text-express-v1')
+        response = FakeBedrockClient().invoke_model_with_response_stream(modelId=adapter.model_id, body='{}')
+
+        text = ''.join(iter_stream_text(response, adapter.parse_stream_chunk))
+
+        assert text == FakeBedrockClient.default_responder(None, None)
+
+
+class TestRouting:
+    """Tests for EWMA-based model selection"""
+
+    def test_unmeasured_models_keep_configured_order(self, clock):
+        """Test that the first configured model is used before any measurements"""
+        assert make_router(clock).select().model_id == 'nova-lite'
+
+    def test_fastest_healthy_model_wins(self, clock):
+        """Test that the latency EWMA decides between healthy models"""
+        router = make_router(clock)
+        router.observe('nova-lite', 0.9)
+        router.observe('nova-micro', 0.2)
+
+        assert router.select().model_id == 'nova-micro'
+
+    def test_throttled_model_cools_down(self, clock):
+        """Test that a throttled model is skipped until its cool-down ends"""
+        router = make_router(clock=clock, cooldown=60.0)
+        router.observe('nova-lite', 0.1)
+        router.observe('nova-lite', 0.1, throttling_error())
+
+        assert router.select().model_id == 'nova-micro'
+        assert router.candidates()[-1].model_id == 'nova-lite'
+
+        clock.now = 61.0
+        assert router.is_healthy('nova-lite')
+
+    def test_primary_returns_after_cooldown(self, clock):
+        """Test that a model throttled past the error threshold is preferred again once its cool-down ends"""
+        router = make_router(clock=clock, cooldown=60.0)
+        router.observe('nova-lite', 0.1)
+        router.observe('nova-micro', 0.5)
+        for _ in range(2):
+            router.observe('nova-lite', 0.1, throttling_error())
+
+        assert router.stats['nova-lite'].error_rate >= router.error_threshold
+        assert router.select().model_id == 'nova-micro'
+
+        clock.now = 61.0
+        assert router.select().model_id == 'nova-lite'
+        assert router.snapshot()['nova-lite']['errorRate'] == 0.0
+
+    def test_error_rate_marks_model_unhealthy(self, clock):
+        """Test that repeated non-throttling errors push a model behind the others"""
+        router = make_router(clock)
+        for _ in range(3):
+            router.observe('nova-lite', 0.1, RuntimeError('bad response'))
+
+        assert not router.is_healthy('nova-lite')
+        assert router.select().model_id == 'nova-micro'
+        assert router.snapshot()['nova-lite']['calls'] == 3
+
+    def test_erroring_model_is_probed_after_cooldown(self, clock):
+        """Test that a model marked unhealthy by non-throttling errors gets another try later"""
+        router = make_router(clock=clock, cooldown=60.0)
+        for _ in range(3):
+            router.observe('nova-lite', 0.1, RuntimeError('bad response'))
+
+        clock.now = 61.0
+        assert router.is_healthy('nova-lite')
+        router.observe('nova-lite', 0.1, RuntimeError('still bad'))
+        assert router.is_healthy('nova-lite')
+
+
+class TestFailover:
+    """Tests for automatic failover between models"""
+
+    def test_invoke_fails_over_on_throttling(self, clock):
+        """Test that a throttled model is skipped in favour of the next one"""
+        fake = FakeBedrockClient()
+        original = fake.invoke_model
+
+        def throttle_nova(**kwargs):
+            if kwargs['modelId'].startswith('nova'):
+                fake.calls.append((kwargs['modelId'], None))
+                raise throttling_error()
+            return original(**kwargs)
+
+        fake.invoke_model = throttle_nova
+        router = make_router(clock)
+        text, adapter = router.invoke(fake, lambda a: a.build_request('Hi'))
+
+        assert adapter.model_id == 'amazon.titan-text-express-v1'
+        assert text == FakeBedrockClient.default_responder(None, None)
+        assert [model for model, _ in fake.calls] == ['nova-lite', 'nova-micro', 'amazon.titan-text-express-v1']
+
+    def test_invoke_raises_other_errors(self, clock):
+        """Test that non-throttling errors are not retried on another model"""
+        fake = FakeBedrockClient()
+        fake.invoke_model = lambda **kwargs: (_ for _ in ()).throw(RuntimeError('boom'))
+
+        with pytest.raises(RuntimeError):
+            make_router(clock).invoke(fake, lambda a: a.build_request('Hi'))
+
+    @patch('lambda_function.time.sleep')
+    def test_generate_quote_fails_over_instead_of_falling_back(self, mock_sleep, clock):
+        """Test that the quote path reaches Titan when the Nova models are throttled"""
+        fake = FakeBedrockClient(responder=lambda model, body: f"Served by {model}. Keep going.")
+        original = fake.invoke_model
+
+        def throttle_nova(**kwargs):
+            if 'nova' in kwargs['modelId']:
+                raise throttling_error()
+            return original(**kwargs)
+
+        fake.invoke_model = throttle_nova
+        router = make_router(clock)
+        previous = set_bedrock_client(fake)
+        lambda_function.bedrock_breaker.reset()
+        try:
+            with patch.object(lambda_function, 'model_router', router):
+                quote, source = generate_quote('Alice')
+        finally:
+            set_bedrock_client(previous)
+            lambda_function.bedrock_breaker.reset()
+
+        assert source == 'bedrock'
+        assert 'amazon.titan-text-express-v1' in quote
+        mock_sleep.assert_not_called()
+        assert router.select().model_id == 'amazon.titan-text-express-v1'
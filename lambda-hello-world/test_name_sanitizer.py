@@ -0,0 +1,48 @@
+import types
+import random
+import pytest
+from lambda_function import sanitize_name_input
+from name_sanitizer import sanitize_name_regex, sanitize_names
+
+
+class TestSanitizeNameInput:
+    """Parity tests for the fast name sanitizer against the regex reference"""
+
+    @pytest.mark.parametrize('raw, expected', [
+        ('John Doe', 'John Doe'),
+        ('Sarah123!@#', 'Sarah123'),
+        ('   Alice   ', 'Alice'),
+        ('Bob<script>alert(1)</script>', 'Bobscriptalert1script'),
+        ('', None),
+        ('   ', None),
+        ('A' * 100, 'A' * 50),
+        ("Mary-Jane O'Connor", "Mary-Jane O'Connor"),
+        ('5439300655350779', '5439300655350779'),
+        ('Ann\t\n  Lee', 'Ann Lee'),
+        ('!! Bob', ' Bob'),
+        ('Bob !!', 'Bob '),
+        ('José  García', 'José García'),
+        ('李 明', '李 明'),
+        ('!!!', None),
+        (None, None),
+        (12345, None),
+    ])
+    def test_known_inputs(self, raw, expected):
+        """Test the personalization and numeric-username cases"""
+        assert sanitize_name_input(raw) == expected
+        assert sanitize_name_regex(raw) == expected
+
+    def test_random_inputs_match_reference(self):
+        """Test parity on random ASCII, control and unicode characters"""
+        rng = random.Random(42)
+        alphabet = [chr(code) for code in range(128)] + list('éñΩ中  \u0085😀')
+        for _ in range(20000):
+            raw = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 70)))
+            assert sanitize_name_input(raw) == sanitize_name_regex(raw), repr(raw)
+
+    def test_sanitize_names_streams(self):
+        """Test that the batch API is lazy and keeps one result per input"""
+        results = sanitize_names(iter(['Alice!', '', 'Bob  Smith']))
+
+        assert isinstance(results, types.GeneratorType)
+        assert list(results) == ['Alice', None, 'Bob Smith']
@@ -0,0 +1,139 @@
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timezone
+import lambda_function
+from lambda_function import lambda_handler
+from quote_cache import QuoteCache, make_cache_key, seconds_until_midnight_utc
+
+
+def ts(year, month, day, hour=0, minute=0, second=0):
+    return datetime(year, month, day, hour, minute, second, tzinfo=timezone.utc).timestamp()
+
+
+class TestQuoteCache:
+    """Unit tests for the daily quote cache"""
+
+    def test_get_returns_cached_quote(self):
+        """Test that a stored quote is returned and counted as a hit"""
+        cache = QuoteCache(max_size=4)
+        cache.set('Alice', 'Shine on, Alice!')
+
+        assert cache.get('Alice') == 'Shine on, Alice!'
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 0
+
+    def test_miss_is_counted(self):
+        """Test that a missing key returns None and counts a miss"""
+        cache = QuoteCache(max_size=4)
+
+        assert cache.get('Bob') is None
+        assert cache.stats()['misses'] == 1
+
+    def test_anonymous_and_named_keys_differ(self):
+        """Test that anonymous quotes do not leak into personalized ones"""
+        cache = QuoteCache(max_size=4)
+        cache.set(None, 'Generic quote')
+
+        assert cache.get(None) == 'Generic quote'
+        assert cache.get('Alice') is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = QuoteCache(max_size=2)
+        cache.set('A', 'quote a')
+        cache.set('B', 'quote b')
+        cache.get('A')
+        cache.set('C', 'quote c')
+
+        assert cache.get('B') is None
+        assert cache.get('A') == 'quote a'
+        assert cache.get('C') == 'quote c'
+        assert cache.stats()['evictions'] == 1
+
+    def test_entries_expire_at_midnight_utc(self, clock):
+        """Test that a quote cached late in the day is gone after midnight UTC"""
+        clock.now = ts(2026, 3, 1, 23, 59, 0)
+        cache = QuoteCache(max_size=4, clock=clock)
+        cache.set('Alice', 'Yesterday quote')
+
+        clock.now = ts(2026, 3, 1, 23, 59, 59)
+        assert cache.get('Alice') == 'Yesterday quote'
+
+        clock.now = ts(2026, 3, 2, 0, 0, 1)
+        assert cache.get('Alice') is None
+
+    def test_backend_consulted_on_local_miss(self):
+        """Test that the shared backend fills local misses"""
+        backend = MagicMock()
+        backend.get.return_value = 'Shared quote'
+        cache = QuoteCache(max_size=4, backend=backend)
+
+        assert cache.get('Alice') == 'Shared quote'
+        assert cache.get('Alice') == 'Shared quote'
+        backend.get.assert_called_once()
+
+    def test_backend_errors_are_ignored(self):
+        """Test that a failing backend degrades to a local cache"""
+        backend = MagicMock()
+        backend.get.side_effect = Exception('backend down')
+        backend.set.side_effect = Exception('backend down')
+        cache = QuoteCache(max_size=4, backend=backend)
+
+        assert cache.get('Alice') is None
+        cache.set('Alice', 'Local quote')
+        assert cache.get('Alice') == 'Local quote'
+
+    def test_cache_key_and_ttl_helpers(self):
+        """Test the key format and seconds-until-midnight helper"""
+        assert make_cache_key('Alice', '2026-03-01') == '2026-03-01:Alice'
+        assert make_cache_key(None, '2026-03-01') == '2026-03-01:'
+        assert seconds_until_midnight_utc(ts(2026, 3, 1, 23, 0, 0)) == 3600
+
+
+class TestHandlerCaching:
+    """Tests for cache use inside lambda_handler"""
+
+    def setup_method(self):
+        lambda_function.quote_cache.clear()
+
+    def teardown_method(self):
+        lambda_function.quote_cache.clear()
+
+    @patch('lambda_function.generate_quote')
+    def test_second_request_is_served_from_cache(self, mock_generate):
+        """Test that Bedrock is called once per name per day"""
+        mock_generate.return_value = ('Go get them, Alice!', 'bedrock')
+        event = {'queryStringParameters': {'name': 'Alice'}, 'body': None}
+
+        first = json.loads(lambda_handler(event, None)['body'])
+        second = json.loads(lambda_handler(event, None)['body'])
+
+        assert mock_generate.call_count == 1
+        assert first['cache']['hit'] is False
+        assert second['cache']['hit'] is True
+        assert second['quote'] == 'Go get them, Alice!'
+        assert second['cache']['hits'] == 1
+        assert second['cache']['misses'] == 1
+
+    @patch('lambda_function.generate_quote')
+    def test_fallback_quotes_are_not_cached(self, mock_generate):
+        """Test that a throttled request retries Bedrock next time"""
+        mock_generate.return_value = ('Fallback quote', 'fallback')
+        event = {'queryStringParameters': {'name': 'Bob'}, 'body': None}
+
+        lambda_handler(event, None)
+        lambda_handler(event, None)
+
+        assert mock_generate.call_count == 2
+
+    @patch('lambda_function.generate_quote')
+    def test_cache_key_uses_sanitized_name(self, mock_generate):
+        """Test that names differing only in stripped characters share an entry"""
+        mock_generate.return_value = ('Hello Carol!', 'bedrock')
+
+        lambda_handler({'queryStringParameters': {'name': 'Carol'}, 'body': None}, None)
+        body = json.loads(lambda_handler({'queryStringParameters': {'name': '  Carol!!'}, 'body': None}, None)['body'])
+
+        assert mock_generate.call_count == 1
+        assert body['cache']['hit'] is True
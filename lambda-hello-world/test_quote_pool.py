@@ -0,0 +1,149 @@
+import json
+import pytest
+from unittest.mock import patch
+import lambda_function
+from lambda_function import lambda_handler, refill_handler, set_bedrock_client
+from fake_bedrock import FakeBedrockClient
+from quote_pool import QuotePool
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = QuotePool(str(tmp_path / 'pool.db'), capacity=5, low_watermark=2)
+    yield pool
+    pool.close()
+
+
+class TestQuotePool:
+    """Unit tests for the pre-generated quote pool"""
+
+    def test_take_returns_quotes_in_fifo_order(self, pool):
+        """Test that quotes are served oldest first and removed"""
+        pool.add(['first', 'second'])
+
+        assert pool.take() == 'first'
+        assert pool.take() == 'second'
+        assert pool.take() is None
+
+    def test_pool_persists_to_file(self, tmp_path):
+        """Test that a second pool on the same file sees stored quotes"""
+        path = str(tmp_path / 'shared.db')
+        writer = QuotePool(path, capacity=5)
+        writer.add(['persisted'])
+        reader = QuotePool(path, capacity=5)
+
+        assert reader.size() == 1
+        assert reader.take() == 'persisted'
+        assert writer.size() == 0
+        writer.close()
+        reader.close()
+
+    def test_refill_tops_up_to_capacity(self, pool):
+        """Test that refill generates exactly the missing quotes"""
+        pool.add(['existing'])
+        counter = iter(range(100))
+
+        added = pool.refill(lambda: f'quote {next(counter)}')
+
+        assert added == 4
+        assert pool.size() == 5
+
+    def test_refill_stops_on_generator_error(self, pool):
+        """Test that refill stops at the first failure"""
+        calls = []
+
+        def generator():
+            calls.append(1)
+            if len(calls) == 3:
+                raise Exception('ThrottlingException')
+            return 'quote'
+
+        assert pool.refill(generator) == 2
+        assert len(calls) == 3
+
+    def test_needs_refill_below_watermark(self, pool):
+        """Test the low watermark check"""
+        assert pool.needs_refill() is True
+        pool.add(['a', 'b'])
+        assert pool.needs_refill() is False
+
+
+class TestHandlerPool:
+    """Tests for pool use inside lambda_handler"""
+
+    def setup_method(self):
+        lambda_function.quote_cache.clear()
+
+    @patch('lambda_function.generate_quote')
+    def test_anonymous_request_served_from_pool(self, mock_generate, pool):
+        """Test that anonymous requests never wait on the model when pooled"""
+        pool.add(['Pooled quote one', 'Pooled quote two', 'Pooled quote three'])
+
+        with patch.object(lambda_function, 'quote_pool', pool):
+            body = json.loads(lambda_handler({}, None)['body'])
+
+        assert body['quote'] == 'Pooled quote one'
+        assert body['source'] == 'pool'
+        mock_generate.assert_not_called()
+
+    @patch('lambda_function.generate_quote')
+    def test_pooled_quote_is_todays_anonymous_quote(self, mock_generate, pool):
+        """Test that later anonymous requests reuse the first pooled quote and can get a 304"""
+        pool.add(['Pooled quote one', 'Pooled quote two'])
+
+        with patch.object(lambda_function, 'quote_pool', pool), \
+                patch.object(pool, 'refill_in_background'):
+            first = lambda_handler({'httpMethod': 'GET'}, None)
+            second = lambda_handler({'httpMethod': 'GET'}, None)
+            revalidated = lambda_handler(
+                {'httpMethod': 'GET', 'headers': {'If-None-Match': first['headers']['ETag']}}, None
+            )
+
+        assert json.loads(second['body'])['quote'] == 'Pooled quote one'
+        assert json.loads(second['body'])['source'] == 'cache'
+        assert revalidated['statusCode'] == 304
+        assert pool.size() == 1
+        mock_generate.assert_not_called()
+
+    @patch('lambda_function.generate_quote')
+    def test_personalized_request_skips_pool(self, mock_generate, pool):
+        """Test that personalized requests do not consume generic quotes"""
+        mock_generate.return_value = ('Hi Alice', 'fallback')
+        pool.add(['Pooled quote'])
+
+        with patch.object(lambda_function, 'quote_pool', pool):
+            body = json.loads(lambda_handler({'queryStringParameters': {'name': 'Alice'}}, None)['body'])
+
+        assert body['quote'] == 'Hi Alice'
+        assert pool.size() == 1
+
+    @patch('lambda_function.generate_quote')
+    def test_empty_pool_falls_through_to_model(self, mock_generate, pool):
+        """Test that an empty pool uses the normal generation path"""
+        mock_generate.return_value = ('Generated quote', 'fallback')
+
+        with patch.object(lambda_function, 'quote_pool', pool), \
+                patch.object(pool, 'refill_in_background') as mock_refill:
+            body = json.loads(lambda_handler({}, None)['body'])
+
+        assert body['quote'] == 'Generated quote'
+        mock_refill.assert_called_once()
+
+    def test_refill_handler(self, pool):
+        """Test the refill entry point generates the missing quotes through the engine"""
+        fake = FakeBedrockClient()
+        previous = set_bedrock_client(fake)
+        try:
+            with patch.object(lambda_function, 'quote_pool', pool):
+                result = refill_handler({}, None)
+        finally:
+            set_bedrock_client(previous)
+
+        assert result == {'added': 5, 'size': 5, 'enabled': True}
+        assert fake.call_count == 5
+        assert pool.take() == FakeBedrockClient.default_responder(None, None)
+
+    def test_refill_many_keeps_partial_results(self, pool):
+        """Test that a batch generator returning fewer quotes still adds them"""
+        assert pool.refill_many(lambda count: ['only one']) == 1
+        assert pool.size() == 1
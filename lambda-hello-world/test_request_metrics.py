@@ -0,0 +1,130 @@
+import io
+import json
+import logging
+import random
+from unittest.mock import patch, call
+import lambda_function
+from lambda_function import lambda_handler, set_bedrock_client
+from request_metrics import RequestTimer, RequestMetrics, PHASES, phase
+from fake_bedrock import FakeBedrockClient
+
+
+class TestRequestTimer:
+    """Unit tests for phase timing and the EMF record"""
+
+    def test_nested_phases_are_exclusive(self, clock):
+        """Test that time in an inner phase is not counted for the outer one"""
+        timer = RequestTimer(clock=clock)
+        timer.enter('modelCall')
+        clock.now = 1.0
+        timer.enter('parseResponse')
+        clock.now = 1.25
+        timer.exit()
+        clock.now = 1.5
+        timer.exit()
+
+        assert timer.durations == {'modelCall': 1.25, 'parseResponse': 0.25}
+
+    def test_emf_record_structure(self, clock):
+        """Test the CloudWatch Embedded Metric Format layout"""
+        timer = RequestTimer(clock=clock)
+        timer.enter('sanitize')
+        clock.now = 0.002
+        timer.exit()
+        timer.set_property('Source', 'cache')
+
+        record = timer.to_emf('DailyQuote', timestamp=1700000000)
+        directive = record['_aws']['CloudWatchMetrics'][0]
+
+        assert record['_aws']['Timestamp'] == 1700000000000
+        assert directive['Namespace'] == 'DailyQuote'
+        assert directive['Dimensions'] == [['Source']]
+        assert [m['Name'] for m in directive['Metrics']] == [f"{p}Ms" for p in PHASES] + ['totalMs']
+        assert record['sanitizeMs'] == 2.0
+        assert record['fallbackMs'] == 0.0
+        assert record['Source'] == 'cache'
+
+
+class TestRequestMetrics:
+    """Tests for sampling and emission"""
+
+    def test_sampled_out_requests_emit_nothing(self):
+        """Test that a zero sample rate disables timing entirely"""
+        stream = io.StringIO()
+        metrics = RequestMetrics(sample_rate=0.0, stream=stream)
+        with metrics.record() as timer:
+            with phase('sanitize'):
+                pass
+
+        assert timer is None
+        assert stream.getvalue() == ''
+
+    def test_sample_rate(self):
+        """Test that roughly sample_rate of the invocations are emitted"""
+        stream = io.StringIO()
+        metrics = RequestMetrics(sample_rate=0.25, stream=stream, rng=random.Random(7))
+        for _ in range(400):
+            with metrics.record():
+                pass
+
+        assert 60 < len(stream.getvalue().splitlines()) < 140
+
+
+class TestHandlerMetrics:
+    """Tests for the instrumentation inside lambda_handler"""
+
+    def setup_method(self):
+        lambda_function.quote_cache.clear()
+        lambda_function.bedrock_breaker.reset()
+        lambda_function.model_router.reset()
+        self.stream = io.StringIO()
+        self.previous_stream = lambda_function.request_metrics.stream
+        lambda_function.request_metrics.stream = self.stream
+
+    def teardown_method(self):
+        lambda_function.request_metrics.stream = self.previous_stream
+        lambda_function.quote_cache.clear()
+
+    def records(self):
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_one_record_per_invocation(self):
+        """Test that a personalized request records its phases and source"""
+        previous = set_bedrock_client(FakeBedrockClient())
+        try:
+            lambda_handler({'httpMethod': 'GET', 'queryStringParameters': {'name': 'Alice'}, 'body': None}, None)
+            lambda_handler({'httpMethod': 'GET', 'queryStringParameters': {'name': 'Alice'}, 'body': None}, None)
+        finally:
+            set_bedrock_client(previous)
+
+        first, second = self.records()
+        assert first['Source'] == 'bedrock'
+        assert first['method'] == 'GET'
+        assert first['personalized'] is True
+        assert first['modelCallMs'] > 0
+        assert first['model'] == lambda_function.MODEL_IDS[0]
+        assert second['Source'] == 'cache'
+        assert second['modelCallMs'] == 0.0
+
+    def test_fallback_phase_recorded(self):
+        """Test that the fallback path is attributed to its own phase"""
+        with patch('lambda_function.request_quote_from_bedrock', side_effect=RuntimeError('down')):
+            lambda_handler({'httpMethod': 'GET', 'queryStringParameters': None, 'body': None}, None)
+
+        record, = self.records()
+        assert record['Source'] == 'fallback'
+        assert record['fallbackMs'] > 0
+
+    def test_event_is_not_serialized_at_info_level(self):
+        """Test that the full event is only dumped when debug logging is enabled"""
+        event = {'httpMethod': 'OPTIONS'}
+        with patch('lambda_function.json.dumps', wraps=json.dumps) as mock_dumps:
+            lambda_handler(event, None)
+            assert call(event) not in mock_dumps.call_args_list
+
+            lambda_function.logger.setLevel(logging.DEBUG)
+            try:
+                lambda_handler(event, None)
+            finally:
+                lambda_function.logger.setLevel(logging.INFO)
+            assert call(event) in mock_dumps.call_args_list
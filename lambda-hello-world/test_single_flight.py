@@ -0,0 +1,246 @@
+import json
+import time
+import asyncio
+import threading
+import pytest
+from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
+import lambda_function
+from lambda_function import lambda_handler, set_bedrock_client
+from single_flight import SingleFlight
+from quote_lease import SQLiteLease
+from fake_bedrock import FakeBedrockClient
+
+
+def slow_counter(calls, result='quote', delay=0.05):
+    def fn():
+        calls.append(1)
+        time.sleep(delay)
+        return result
+    return fn
+
+
+@pytest.fixture
+def lease_path(tmp_path):
+    return str(tmp_path / 'leases.db')
+
+
+class TestSingleFlight:
+    """Unit tests for in-process coalescing"""
+
+    def test_concurrent_threads_share_one_call(self):
+        """Test that simultaneous callers for one key trigger a single call"""
+        flight = SingleFlight()
+        calls = []
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(lambda _: flight.do('2024-03-10:Alice', slow_counter(calls)), range(10)))
+
+        assert len(calls) == 1
+        assert {result for result, _ in results} == {'quote'}
+        assert sum(shared for _, shared in results) == 9
+        assert flight.stats() == {'leaders': 1, 'coalesced': 9, 'inFlight': 0}
+
+    def test_different_keys_do_not_coalesce(self):
+        """Test that each key gets its own call"""
+        flight = SingleFlight()
+        calls = []
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda key: flight.do(key, slow_counter(calls)), ['a', 'b', 'a', 'b']))
+
+        assert len(calls) == 2
+
+    def test_errors_reach_every_waiter(self):
+        """Test that a failed generation raises in all coalesced callers"""
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def failing():
+            started.set()
+            time.sleep(0.05)
+            raise RuntimeError('throttled')
+
+        def follower():
+            started.wait()
+            return flight.do('key', lambda: 'not called')
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, 'key', failing)
+            waiter = executor.submit(follower)
+            with pytest.raises(RuntimeError):
+                leader.result()
+            with pytest.raises(RuntimeError):
+                waiter.result()
+
+    def test_stream_waiters_share_the_leader_result(self):
+        """Test that the leader streams its items while joining callers get only the result"""
+        flight = SingleFlight()
+        calls = []
+
+        def stream():
+            calls.append(1)
+            yield 'a'
+            time.sleep(0.05)
+            yield 'b'
+            return 'ab'
+
+        def consume(_):
+            items = []
+            stream_gen = flight.do_stream('key', stream)
+            while True:
+                try:
+                    items.append(next(stream_gen))
+                except StopIteration as stop:
+                    return items, stop.value
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outputs = list(executor.map(consume, range(4)))
+
+        assert len(calls) == 1
+        assert sorted(outputs) == [([], ('ab', True))] * 3 + [(['a', 'b'], ('ab', False))]
+
+    def test_abandoned_stream_lets_waiters_generate(self):
+        """Test that closing a leading stream part-way does not fail the callers waiting on it"""
+        flight = SingleFlight()
+        leading = flight.do_stream('key', lambda: iter(['a', 'b']))
+        assert next(leading) == 'a'
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            waiter = executor.submit(flight.do, 'key', lambda: 'local')
+            time.sleep(0.05)
+            leading.close()
+            assert waiter.result(timeout=1) == ('local', False)
+
+    def test_async_tasks_share_one_call(self):
+        """Test coalescing of asyncio tasks on one loop"""
+        flight = SingleFlight()
+        calls = []
+
+        async def generate():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'quote'
+
+        async def burst():
+            return await asyncio.gather(*(flight.do_async('key', generate) for _ in range(5)))
+
+        results = asyncio.run(burst())
+
+        assert len(calls) == 1
+        assert [result for result, _ in results] == ['quote'] * 5
+
+
+class TestSQLiteLease:
+    """Tests for the cross-process lease stand-in"""
+
+    def test_second_owner_waits_for_result(self, lease_path):
+        """Test that only one owner gets the lease and the other reads its result"""
+        first, second = SQLiteLease(lease_path), SQLiteLease(lease_path)
+        try:
+            assert first.acquire('key')
+            assert not second.acquire('key')
+            first.complete('key', ['Shine on.', 'bedrock'])
+            assert second.wait('key', timeout=1) == ['Shine on.', 'bedrock']
+        finally:
+            first.close()
+            second.close()
+
+    def test_released_lease_is_free(self, lease_path):
+        """Test that a failed owner frees the lease for the next process"""
+        first, second = SQLiteLease(lease_path), SQLiteLease(lease_path)
+        try:
+            first.acquire('key')
+            first.release('key')
+            assert second.wait('key', timeout=1) is None
+            assert second.acquire('key')
+        finally:
+            first.close()
+            second.close()
+
+    def test_expired_lease_can_be_taken_over(self, lease_path, clock):
+        """Test that a lease held by a crashed process expires after its ttl"""
+        clock.now = 100.0
+        first = SQLiteLease(lease_path, ttl=5, clock=clock)
+        second = SQLiteLease(lease_path, ttl=5, clock=clock)
+        try:
+            first.acquire('key')
+            clock.now = 106.0
+            assert second.acquire('key')
+        finally:
+            first.close()
+            second.close()
+
+    def test_flights_in_separate_processes_share_one_call(self, lease_path):
+        """Test that two processes (separate flights and leases) generate once"""
+        calls = []
+        flights = [SingleFlight(lease=SQLiteLease(lease_path, poll_interval=0.01)) for _ in range(2)]
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(lambda flight: flight.do('key', slow_counter(calls, ['q', 'bedrock'])), flights))
+        finally:
+            for flight in flights:
+                flight.lease.close()
+
+        assert len(calls) == 1
+        assert sorted(shared for _, shared in results) == [False, True]
+
+
+class TestHandlerCoalescing:
+    """Tests for coalescing inside lambda_handler"""
+
+    def setup_method(self):
+        lambda_function.quote_cache.clear()
+        lambda_function.bedrock_breaker.reset()
+        lambda_function.model_router.reset()
+
+    def teardown_method(self):
+        lambda_function.quote_cache.clear()
+
+    def test_burst_of_identical_requests_calls_model_once(self):
+        """Test that a burst for the same name reaches Bedrock once"""
+        fake = FakeBedrockClient(latency=0.05)
+        previous = set_bedrock_client(fake)
+        event = {'httpMethod': 'GET', 'queryStringParameters': {'name': 'Alice'}, 'body': None}
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                responses = list(executor.map(lambda _: lambda_handler(event, None), range(8)))
+        finally:
+            set_bedrock_client(previous)
+
+        quotes = {json.loads(response['body'])['quote'] for response in responses}
+        assert fake.call_count == 1
+        assert len(quotes) == 1
+
+    def test_result_from_other_process_is_cached(self, lease_path):
+        """Test that a quote received through the lease is cached like a local one"""
+        other = SQLiteLease(lease_path)
+        flight = SingleFlight(lease=SQLiteLease(lease_path, poll_interval=0.01), wait_timeout=1)
+        fake = FakeBedrockClient()
+        previous = set_bedrock_client(fake)
+        key = lambda_function.make_cache_key('Alice')
+        try:
+            other.acquire(key)
+            other.complete(key, ['Shine on, Alice.', 'bedrock'])
+            with patch.object(lambda_function, 'quote_flight', flight):
+                quote, source = lambda_function.generate_daily_quote('Alice')
+        finally:
+            set_bedrock_client(previous)
+            other.close()
+            flight.lease.close()
+
+        assert (quote, source) == ('Shine on, Alice.', 'bedrock')
+        assert lambda_function.quote_cache.get('Alice') == 'Shine on, Alice.'
+        assert fake.call_count == 0
+
+    def test_burst_of_identical_streams_calls_model_once(self):
+        """Test that concurrent streamed requests for the same name share one model call"""
+        fake = FakeBedrockClient(latency=0.05, chunk_delay=0.01)
+        previous = set_bedrock_client(fake)
+        event = {'httpMethod': 'GET', 'queryStringParameters': {'name': 'Alice', 'stream': 'true', 'format': 'ndjson'}, 'body': None}
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                responses = list(executor.map(lambda _: lambda_handler(event, None), range(8)))
+        finally:
+            set_bedrock_client(previous)
+
+        done = [json.loads(response['body'].splitlines()[-1]) for response in responses]
+        assert fake.call_count == 1
+        assert len({event['quote'] for event in done}) == 1
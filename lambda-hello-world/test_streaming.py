@@ -0,0 +1,180 @@
+import json
+import pytest
+from unittest.mock import patch
+import lambda_function
+from lambda_function import lambda_handler, stream_quote_events, set_bedrock_client
+from quote_stream import iter_stream_text, format_sse
+from botocore.exceptions import ClientError
+from bedrock_engine import is_throttling_error
+from fake_bedrock import FakeBedrockClient, throttling_error
+
+
+def stream_event(name=None, fmt=None):
+    params = {'stream': 'true'}
+    if name:
+        params['name'] = name
+    if fmt:
+        params['format'] = fmt
+    return {'httpMethod': 'GET', 'queryStringParameters': params, 'body': None}
+
+
+def throttle_event_after(stream, events_before, model=None):
+    """
+    Wrap invoke_model_with_response_stream so the stream (for one model, or all)
+    breaks with a throttlingException event after events_before events
+    """
+    def invoke(modelId, **kwargs):
+        response = stream(modelId=modelId, **kwargs)
+        if model is None or modelId == model:
+            body = list(response['body'])[:events_before]
+            body.append({'throttlingException': {'message': 'Too many tokens, please wait.'}})
+            response['body'] = iter(body)
+        return response
+    return invoke
+
+
+def parse_sse(body):
+    events = []
+    for block in body.strip().split('\n\n'):
+        lines = dict(line.split(': ', 1) for line in block.split('\n'))
+        events.append((lines['event'], json.loads(lines['data'])))
+    return events
+
+
+@pytest.fixture
+def fake_client():
+    fake = FakeBedrockClient(responder=lambda model, body: 'Rise and shine. Today is yours.')
+    previous = set_bedrock_client(fake)
+    lambda_function.quote_cache.clear()
+    lambda_function.bedrock_breaker.reset()
+    lambda_function.model_router.reset()
+    yield fake
+    set_bedrock_client(previous)
+    lambda_function.quote_cache.clear()
+    lambda_function.bedrock_breaker.reset()
+    lambda_function.model_router.reset()
+
+
+class TestStreamDecoding:
+    """Unit tests for stream decoding and encoding"""
+
+    def test_iter_stream_text_yields_deltas(self):
+        """Test that only contentBlockDelta text is yielded"""
+        response = FakeBedrockClient().invoke_model_with_response_stream(
+            modelId='model', body=json.dumps({})
+        )
+        text = ''.join(iter_stream_text(response))
+        assert text == FakeBedrockClient.default_responder(None, None)
+
+    def test_iter_stream_text_raises_stream_errors(self):
+        """Test that modeled exceptions inside the stream surface as throttling ClientErrors"""
+        response = {'body': [{'throttlingException': {'message': 'slow down'}}]}
+        with pytest.raises(ClientError) as excinfo:
+            list(iter_stream_text(response))
+
+        assert excinfo.value.response['Error']['Code'] == 'throttlingException'
+        assert is_throttling_error(excinfo.value)
+
+    def test_format_sse(self):
+        """Test the Server-Sent Event encoding"""
+        assert format_sse({'type': 'chunk', 'text': 'Hi'}) == 'event: chunk\ndata: {"text": "Hi"}\n\n'
+
+
+class TestStreamingHandler:
+    """Tests for the streaming mode of lambda_handler"""
+
+    def test_streams_chunks_then_done(self, fake_client):
+        """Test that the quote arrives as several chunks followed by a done event"""
+        response = lambda_handler(stream_event('Alice'), None)
+        events = parse_sse(response['body'])
+
+        assert response['headers']['Content-Type'] == 'text/event-stream'
+        chunks = [data['text'] for kind, data in events if kind == 'chunk']
+        assert len(chunks) > 1
+        kind, done = events[-1]
+        assert kind == 'done'
+        assert done['quote'] == ''.join(chunks)
+        assert done['source'] == 'bedrock'
+        assert done['personalized'] is True
+
+    def test_ndjson_format(self, fake_client):
+        """Test newline-delimited JSON output"""
+        response = lambda_handler(stream_event(fmt='ndjson'), None)
+        lines = [json.loads(line) for line in response['body'].splitlines()]
+
+        assert response['headers']['Content-Type'] == 'application/x-ndjson'
+        assert lines[-1]['type'] == 'done'
+
+    def test_streamed_quote_is_cached(self, fake_client):
+        """Test that a completed stream fills the cache for the next request"""
+        list(stream_quote_events('Bob'))
+        events = list(stream_quote_events('Bob'))
+
+        assert events[-1]['source'] == 'cache'
+        assert fake_client.call_count == 1
+
+    def test_throttled_stream_falls_back(self, fake_client):
+        """Test that a throttled stream yields the fallback quote and counts a breaker failure"""
+        fake_client.throttle_rate = 1.0
+        events = list(stream_quote_events('Carol'))
+
+        assert events[-1]['source'] == 'fallback'
+        assert 'Carol' in events[-1]['quote']
+        assert lambda_function.bedrock_breaker.consecutive_failures == 1
+
+    def test_throttled_model_fails_over_before_first_chunk(self, fake_client):
+        """Test that a throttled stream moves on to the next model instead of the fallback"""
+        stream = fake_client.invoke_model_with_response_stream
+        first_model = lambda_function.model_router.select().model_id
+
+        def throttle_first_model(modelId, **kwargs):
+            if modelId == first_model:
+                raise throttling_error('InvokeModelWithResponseStream')
+            return stream(modelId=modelId, **kwargs)
+
+        with patch.object(fake_client, 'invoke_model_with_response_stream', throttle_first_model):
+            events = list(stream_quote_events('Dana'))
+
+        assert events[-1]['source'] == 'bedrock'
+        assert events[-1]['quote'] == 'Rise and shine. Today is yours.'
+        assert lambda_function.model_router.select().model_id != first_model
+        assert lambda_function.bedrock_breaker.consecutive_failures == 0
+
+    def test_throttle_event_before_first_chunk_fails_over(self, fake_client):
+        """Test that a throttlingException event ahead of any text moves on to the next model"""
+        first_model = lambda_function.model_router.select().model_id
+        invoke = throttle_event_after(fake_client.invoke_model_with_response_stream, 1, model=first_model)
+
+        with patch.object(fake_client, 'invoke_model_with_response_stream', invoke):
+            text = ''.join(lambda_function.request_quote_stream_from_bedrock('Erin'))
+
+        assert text == 'Rise and shine. Today is yours.'
+        assert [model for model, _ in fake_client.calls][0] == first_model
+        assert fake_client.calls[-1][0] != first_model
+        assert lambda_function.model_router.select().model_id != first_model
+
+    def test_throttle_event_mid_stream_records_breaker_failure(self, fake_client):
+        """Test that a throttlingException event after text has been sent counts against the breaker"""
+        invoke = throttle_event_after(fake_client.invoke_model_with_response_stream, 3)
+
+        with patch.object(fake_client, 'invoke_model_with_response_stream', invoke):
+            events = list(stream_quote_events('Finn'))
+
+        types = [event['type'] for event in events]
+        assert types[:2] == ['chunk', 'chunk'] and types[-3:] == ['reset', 'chunk', 'done']
+        assert events[-1]['source'] == 'fallback'
+        assert fake_client.call_count == 1
+        assert lambda_function.bedrock_breaker.consecutive_failures == 1
+
+    def test_failure_mid_stream_resets_text(self, fake_client):
+        """Test that text from a stream that breaks part-way is discarded"""
+        def broken_stream(name=None):
+            yield 'Partial '
+            raise RuntimeError('connection reset')
+
+        with patch('lambda_function.request_quote_stream_from_bedrock', broken_stream):
+            events = list(stream_quote_events(None))
+
+        types = [event['type'] for event in events]
+        assert types == ['chunk', 'reset', 'chunk', 'done']
+        assert events[-1]['source'] == 'fallback'